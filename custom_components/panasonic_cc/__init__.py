@@ -1,14 +1,14 @@
 """Support for the Panasonic Comfort Cloud."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from aio_panasonic_comfort_cloud import ApiClient
 from aio_panasonic_comfort_cloud.exceptions import AgreementNotAcceptedError
 from homeassistant.components.persistent_notification import async_dismiss
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_integration
@@ -20,6 +20,8 @@ from .const import (
     CONF_ENERGY_FETCH_INTERVAL,
     CONF_FORCE_ENABLE_NANOE,
     CONF_FORCE_OUTSIDE_SENSOR,
+    CONF_MAX_STALENESS,
+    CONF_REQUEST_BUDGET,
     CONF_USE_PANASONIC_PRESET_NAMES,
     DEFAULT_AUTO_POWER_ON,
     DEFAULT_DEVICE_FETCH_INTERVAL,
@@ -27,16 +29,26 @@ from .const import (
     DEFAULT_ENERGY_FETCH_INTERVAL,
     DEFAULT_FORCE_ENABLE_NANOE,
     DEFAULT_FORCE_OUTSIDE_SENSOR,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_REQUEST_BUDGET,
     DEFAULT_USE_PANASONIC_PRESET_NAMES,
+    DATA_SCHEDULER,
     DOMAIN,
     MANUFACTURER,
     NOTIFICATION_AUTH_EXPIRED,
     STARTUP,
     COMPONENT_TYPES,
 )
+from .api_client import PanasonicApiClient
+from .rate_limiter import AccountRateLimiter
+from .runtime_data import PanasonicConfigEntry, PanasonicRuntimeData
+from .scheduler import AccountPoller, PollScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options that shape which entities exist or how they are built
+_RELOAD_OPTIONS = {CONF_FORCE_ENABLE_NANOE, CONF_USE_PANASONIC_PRESET_NAMES}
+
 
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate a config entry."""
@@ -110,17 +122,35 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Panasonic Comfort Cloud from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+@callback
+def _async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler shared by every account, creating it with the first."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = PollScheduler(hass)
+    return scheduler
+
 
+async def async_setup_entry(hass: HomeAssistant, entry: PanasonicConfigEntry) -> bool:
+    """Set up Panasonic Comfort Cloud from a config entry."""
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
 
     auto_power_on = entry.options.get(CONF_AUTO_POWER_ON, DEFAULT_AUTO_POWER_ON)
+    setup_started = hass.loop.time()
+
+    # Every request on this account, poll or command, draws from one budget
+    rate_limiter = AccountRateLimiter(
+        hass,
+        f"Panasonic Comfort Cloud ({entry.title})",
+        entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET),
+    )
+    entry.async_on_unload(rate_limiter.async_shutdown)
 
+    # Home Assistant's shared session; every account talks through the same connection pool
     client = async_get_clientsession(hass)
-    api = ApiClient(username, password, client, auto_power_on=auto_power_on)
+    api = PanasonicApiClient(
+        username, password, client, rate_limiter, auto_power_on=auto_power_on
+    )
 
     try:
         await api.start_session()
@@ -147,17 +177,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Could not find any Panasonic Comfort Cloud Devices")
         return False
 
-    # Set up Panasonic slice
+    # One account-level poller drives every coordinator instead of per-device timers,
+    # and the domain scheduler runs the pollers of every account from one timer
+    poller = AccountPoller(
+        hass,
+        f"Panasonic Comfort Cloud ({entry.title})",
+        _async_get_scheduler(hass),
+        rate_limiter,
+        api.request_stats,
+    )
+    runtime = PanasonicRuntimeData(
+        api=api, rate_limiter=rate_limiter, poller=poller, options=dict(entry.options)
+    )
+    entry.runtime_data = runtime
+    # Also runs when setup fails part way, for whatever the slices created by then
+    entry.async_on_unload(runtime.async_shutdown)
+
+    # Set up Panasonic slice (all slices share the single ApiClient session above)
     from .panasonic import async_setup_panasonic
-    data_coordinators, energy_coordinators = await async_setup_panasonic(hass, entry)
+    await async_setup_panasonic(hass, entry, api)
 
     # Set up Aquarea slice
     from .aquarea import async_setup_aquarea
-    aquarea_coordinators = await async_setup_aquarea(hass, entry, api)
+    await async_setup_aquarea(hass, entry, api)
 
     # Set up HWS slice
     from .hws import async_setup_hws
-    hws_coordinators = await async_setup_hws(hass, entry, api)
+    await async_setup_hws(hass, entry, api)
+
+    poller.async_add_coordinators(runtime.data_coordinators)
+    poller.async_add_coordinators(runtime.energy_coordinators)
+    poller.async_add_coordinators(runtime.aquarea_coordinators)
+    poller.async_add_coordinators(runtime.aquarea_energy_coordinators)
+    poller.async_add_coordinators(runtime.hws_coordinators)
+    poller.async_start()
+
+    runtime.setup_duration = hass.loop.time() - setup_started
+    _LOGGER.debug(
+        "Set up %d coordinator(s) in %.2fs",
+        len(poller.coordinators),
+        runtime.setup_duration,
+    )
 
     integration = await async_get_integration(hass, DOMAIN)
     _LOGGER.info(STARTUP, integration.version)
@@ -165,12 +225,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward setup to all platforms (thin router files delegate to each slice)
     await hass.config_entries.async_forward_entry_setups(entry, COMPONENT_TYPES)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
+
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def _async_update_options(hass: HomeAssistant, entry: PanasonicConfigEntry) -> None:
+    """Apply changed options to the running entry instead of reloading it."""
+    runtime = entry.runtime_data
+    changed = {
+        key
+        for key in entry.options.keys() | runtime.options.keys()
+        if entry.options.get(key) != runtime.options.get(key)
+    }
+    if not changed:
+        return
+    if changed & _RELOAD_OPTIONS:
+        # Read once when the climate and switch entities are created
+        _LOGGER.debug("Options %s changed, reloading", sorted(changed))
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    _LOGGER.debug("Applying changed options %s", sorted(changed))
+    runtime.options = dict(entry.options)
+    config = {**entry.data, **entry.options}
+    for coordinator in runtime.poller.coordinators:
+        coordinator.async_set_poll_options(config)
+    runtime.rate_limiter.async_set_budget(
+        entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)
+    )
+    runtime.api.auto_power_on = entry.options.get(CONF_AUTO_POWER_ON, DEFAULT_AUTO_POWER_ON)
+    if CONF_MAX_STALENESS in changed:
+        max_staleness = entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        for coordinator in runtime.data_coordinators:
+            coordinator.async_set_max_staleness(max_staleness)
+
+    if CONF_ENABLE_DAILY_ENERGY_SENSOR in changed:
+        from .aquarea import async_set_energy_enabled as async_set_aquarea_energy_enabled
+        from .panasonic import async_set_energy_enabled
+
+        enabled = entry.options.get(
+            CONF_ENABLE_DAILY_ENERGY_SENSOR, DEFAULT_ENABLE_DAILY_ENERGY_SENSOR
+        )
+        await asyncio.gather(
+            async_set_energy_enabled(hass, entry, runtime.api, enabled),
+            async_set_aquarea_energy_enabled(hass, entry, runtime.api, enabled),
+        )
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: PanasonicConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, COMPONENT_TYPES)
+    if not await hass.config_entries.async_unload_platforms(entry, COMPONENT_TYPES):
+        return False
+    # Leave the scheduler now rather than with the other unload callbacks, so the
+    # last account to go can drop it
+    entry.runtime_data.poller.async_stop()
+    scheduler = hass.data.get(DATA_SCHEDULER)
+    if scheduler is not None and not scheduler.pollers:
+        hass.data.pop(DATA_SCHEDULER)
+    return True
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
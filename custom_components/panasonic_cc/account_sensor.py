@@ -0,0 +1,211 @@
+"""Account and request diagnostic sensors shared by every Panasonic slice."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .rate_limiter import AccountRateLimiter
+from .request_stats import DeviceRequestStats, RequestStats
+
+
+@dataclass(frozen=True, kw_only=True)
+class AccountRateLimiterSensorEntityDescription(SensorEntityDescription):
+    """Describes an account rate limiter sensor entity."""
+    get_state: Callable[[AccountRateLimiter], Any]
+    get_attributes: Callable[[AccountRateLimiter], dict[str, Any]] | None = None
+
+
+REQUEST_QUEUE_DEPTH_DESCRIPTION = AccountRateLimiterSensorEntityDescription(
+    key="request_queue_depth",
+    translation_key="request_queue_depth",
+    name="Request Queue Depth",
+    icon="mdi:tray-full",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
+    get_state=lambda limiter: limiter.queue_depth,
+    get_attributes=lambda limiter: {
+        "requests_per_minute": limiter.requests_per_minute,
+        "total_requests": limiter.total_requests,
+        "throttled_requests": limiter.throttled_requests,
+    },
+)
+REQUEST_WAIT_TIME_DESCRIPTION = AccountRateLimiterSensorEntityDescription(
+    key="request_wait_time",
+    translation_key="request_wait_time",
+    name="Request Wait Time",
+    icon="mdi:timer-sand",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+    suggested_display_precision=1,
+    get_state=lambda limiter: limiter.average_wait,
+    get_attributes=lambda limiter: {
+        "last_wait": round(limiter.last_wait, 3),
+    },
+)
+
+ACCOUNT_RATE_LIMITER_SENSOR_DESCRIPTIONS = (
+    REQUEST_QUEUE_DEPTH_DESCRIPTION,
+    REQUEST_WAIT_TIME_DESCRIPTION,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class DeviceRequestStatsSensorEntityDescription(SensorEntityDescription):
+    """Describes a device request statistics sensor entity."""
+    get_state: Callable[[DeviceRequestStats], Any]
+    get_attributes: Callable[[DeviceRequestStats], dict[str, Any]] | None = None
+
+
+REQUEST_LATENCY_DESCRIPTION = DeviceRequestStatsSensorEntityDescription(
+    key="request_latency",
+    translation_key="request_latency",
+    name="Request Latency",
+    icon="mdi:timer-outline",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    suggested_display_precision=0,
+    entity_registry_enabled_default=False,
+    get_state=lambda stats: stats.latency_percentile(0.95),
+    get_attributes=lambda stats: {
+        "p50": stats.latency_percentile(0.5),
+        "p99": stats.latency_percentile(0.99),
+        "endpoints": {
+            endpoint: endpoint_stats.as_dict()
+            for endpoint, endpoint_stats in stats.endpoints.items()
+        },
+    },
+)
+UPDATE_LATENCY_DESCRIPTION = DeviceRequestStatsSensorEntityDescription(
+    key="update_latency",
+    translation_key="update_latency",
+    name="Update Latency",
+    icon="mdi:timer-sync-outline",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    suggested_display_precision=0,
+    entity_registry_enabled_default=False,
+    get_state=lambda stats: stats.updates.percentiles()["p95_ms"],
+    get_attributes=lambda stats: {
+        "p50": stats.updates.percentiles()["p50_ms"],
+        "p99": stats.updates.percentiles()["p99_ms"],
+        "updates": stats.updates.successes,
+    },
+)
+
+DEVICE_REQUEST_STATS_SENSOR_DESCRIPTIONS = (
+    REQUEST_LATENCY_DESCRIPTION,
+    UPDATE_LATENCY_DESCRIPTION,
+)
+
+
+class AccountRateLimiterSensor(SensorEntity):
+    """Sensor that reports the state of the account request limiter.
+
+    The limiter is shared by every device on the account, so these sensors
+    are created once and attached to the first device that was set up.
+    """
+
+    entity_description: AccountRateLimiterSensorEntityDescription  # type: ignore[reportIncompatibleVariableOverride]
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        rate_limiter: AccountRateLimiter,
+        device_id: str,
+        device_info: DeviceInfo,
+        description: AccountRateLimiterSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description  # type: ignore[reportIncompatibleVariableOverride]
+        self._rate_limiter = rate_limiter
+        self._attr_unique_id = f"{device_id}-{description.key}"
+        self._attr_device_info = device_info
+        self._async_update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._rate_limiter.async_add_listener(self._handle_rate_limiter_update)
+        )
+
+    @callback
+    def _handle_rate_limiter_update(self) -> None:
+        """Handle a change in the limiter queue."""
+        self._async_update_attrs()
+        self.async_write_ha_state()
+
+    def _async_update_attrs(self) -> None:
+        """Update the attributes of the sensor."""
+        self._attr_native_value = self.entity_description.get_state(self._rate_limiter)
+        if self.entity_description.get_attributes is not None:
+            self._attr_extra_state_attributes = self.entity_description.get_attributes(
+                self._rate_limiter
+            )
+
+
+class DeviceRequestStatsSensor(SensorEntity):
+    """Sensor that reports the request latency and outcomes of one device.
+
+    Latencies are the 95th percentile of the recent samples; the other
+    percentiles and the per endpoint outcome counts are attributes.
+    """
+
+    entity_description: DeviceRequestStatsSensorEntityDescription  # type: ignore[reportIncompatibleVariableOverride]
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        request_stats: RequestStats,
+        device_id: str,
+        device_info: DeviceInfo,
+        description: DeviceRequestStatsSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description  # type: ignore[reportIncompatibleVariableOverride]
+        self._request_stats = request_stats
+        self._device_id = device_id
+        self._attr_unique_id = f"{device_id}-{description.key}"
+        self._attr_device_info = device_info
+        self._async_update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._request_stats.async_add_listener(
+                self._device_id, self._handle_request_stats_update
+            )
+        )
+
+    @callback
+    def _handle_request_stats_update(self) -> None:
+        """Handle a new request or update record of the device."""
+        self._async_update_attrs()
+        self.async_write_ha_state()
+
+    def _async_update_attrs(self) -> None:
+        """Update the attributes of the sensor."""
+        stats = self._request_stats.device(self._device_id)
+        self._attr_native_value = self.entity_description.get_state(stats)
+        if self.entity_description.get_attributes is not None:
+            self._attr_extra_state_attributes = self.entity_description.get_attributes(
+                stats
+            )
@@ -0,0 +1,210 @@
+"""ApiClient used by the integration for every call to the Panasonic cloud."""
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable
+from typing import Any
+
+from aio_panasonic_comfort_cloud import ApiClient, PanasonicDeviceInfo
+from aiohttp import ClientResponse, ClientSession, hdrs
+
+from .error_handler import parse_retry_after
+from .rate_limiter import AccountRateLimiter
+from .request_stats import RequestStats, payload_size
+
+# Responses whose Retry-After asks the client to back off
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+class _RetryAfterSession:
+    """Pass the library's requests to the shared session, noting any Retry-After.
+
+    The library turns a failed response into its own ResponseError with only
+    the status and body in the message, so the header is read here while the
+    response is still at hand. Everything else, including the cookie jar the
+    Aquarea calls swap in and out, goes straight to the session.
+    """
+
+    __slots__ = ("_session", "_rate_limiter")
+
+    def __init__(self, session: ClientSession, rate_limiter: AccountRateLimiter) -> None:
+        """Initialize the wrapper."""
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_rate_limiter", rate_limiter)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the session."""
+        return getattr(self._session, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute of the session."""
+        setattr(self._session, name, value)
+
+    async def get(self, *args: Any, **kwargs: Any) -> ClientResponse:
+        """Send a GET request."""
+        return self._check(await self._session.get(*args, **kwargs))
+
+    async def post(self, *args: Any, **kwargs: Any) -> ClientResponse:
+        """Send a POST request."""
+        return self._check(await self._session.post(*args, **kwargs))
+
+    async def put(self, *args: Any, **kwargs: Any) -> ClientResponse:
+        """Send a PUT request."""
+        return self._check(await self._session.put(*args, **kwargs))
+
+    def _check(self, response: ClientResponse) -> ClientResponse:
+        """Hold the account's requests for as long as the response asked."""
+        if (
+            response.status in RETRY_AFTER_STATUSES
+            and (value := response.headers.get(hdrs.RETRY_AFTER)) is not None
+            and (delay := parse_retry_after(value)) is not None
+        ):
+            self._rate_limiter.async_defer(delay)
+        return response
+
+
+class PanasonicApiClient(ApiClient):
+    """ApiClient that routes every request through the account limiter.
+
+    All device, Aquarea, HWS and energy calls in the library end up in one of
+    the session ``execute_*`` methods, so gating those covers polls, commands
+    and refreshes alike without wrapping each public method.
+
+    The same methods time every request into the account ``RequestStats``,
+    from the moment the limiter lets it through until the response is parsed.
+    The library's session is wrapped so that any ``Retry-After`` of a
+    rejected request is handed back to the limiter.
+
+    The last status response of every air conditioner and Aquarea device is
+    kept as well, so coordinators can persist it and start from it on the
+    next restart.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        client: ClientSession,
+        rate_limiter: AccountRateLimiter,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the client."""
+        super().__init__(username, password, client, **kwargs)
+        # Only the session the device requests go through; login keeps its own
+        self._client = _RetryAfterSession(client, rate_limiter)
+        self._rate_limiter = rate_limiter
+        self._request_stats = RequestStats()
+        self._last_status: dict[str, dict[str, Any]] = {}
+
+    @property
+    def rate_limiter(self) -> AccountRateLimiter:
+        """Return the limiter shared by every request on this account."""
+        return self._rate_limiter
+
+    @property
+    def request_stats(self) -> RequestStats:
+        """Return the latency and outcome statistics of every request."""
+        return self._request_stats
+
+    @property
+    def auto_power_on(self) -> bool:
+        """Return whether changing a setting of a device that is off powers it on."""
+        return self._auto_power_on
+
+    @auto_power_on.setter
+    def auto_power_on(self, value: bool) -> None:
+        """Change auto power on for every following command."""
+        self._auto_power_on = value
+
+    def last_status(self, device_id: str) -> dict[str, Any] | None:
+        """Return the last status response received for a device."""
+        return self._last_status.get(device_id)
+
+    async def execute_post(
+        self, url: str, json_data: Any, function_description: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Send a POST request once the budget allows it."""
+        await self._rate_limiter.async_acquire()
+        return await self._async_timed(
+            function_description,
+            super().execute_post(url, json_data, function_description, *args, **kwargs),
+            json_data,
+        )
+
+    async def execute_get(
+        self, url: str, function_description: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Send a GET request once the budget allows it."""
+        await self._rate_limiter.async_acquire()
+        return await self._async_timed(
+            function_description,
+            super().execute_get(url, function_description, *args, **kwargs),
+        )
+
+    async def execute_put(
+        self, url: str, json_data: Any, function_description: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Send a PUT request once the budget allows it."""
+        await self._rate_limiter.async_acquire()
+        return await self._async_timed(
+            function_description,
+            super().execute_put(url, json_data, function_description, *args, **kwargs),
+            json_data,
+        )
+
+    async def execute_aqua_get(
+        self, url: str, function_description: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Send an Aquarea GET request once the budget allows it."""
+        await self._rate_limiter.async_acquire()
+        return await self._async_timed(
+            function_description,
+            super().execute_aqua_get(url, function_description, *args, **kwargs),
+        )
+
+    async def execute_aqua_post(
+        self, url: str, function_description: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Send an Aquarea POST request once the budget allows it."""
+        await self._rate_limiter.async_acquire()
+        return await self._async_timed(
+            function_description,
+            super().execute_aqua_post(url, function_description, *args, **kwargs),
+        )
+
+    async def _async_timed(
+        self, endpoint: str, request: Awaitable[Any], payload: Any = None
+    ) -> Any:
+        """Await a request and record its latency, outcome and size."""
+        started = time.monotonic()
+        try:
+            response = await request
+        except Exception as err:
+            self._request_stats.async_record_request(
+                endpoint, time.monotonic() - started, error=err
+            )
+            raise
+        self._request_stats.async_record_request(
+            endpoint,
+            time.monotonic() - started,
+            size=payload_size(payload) + payload_size(response),
+        )
+        return response
+
+    # get_device/try_update_device and their Aquarea counterparts all fetch
+    # through these two helpers, which only hand the raw response to the
+    # device model; hooking them is the one place to keep a copy of it
+
+    async def _get_device_status(self, device_info: PanasonicDeviceInfo) -> Any:
+        """Fetch an air conditioner status and remember the response."""
+        json_response = await super()._get_device_status(device_info)
+        if isinstance(json_response, dict):
+            self._last_status[device_info.id] = json_response
+        return json_response
+
+    async def _async_get_aquarea_status(self, device_info: PanasonicDeviceInfo) -> Any:
+        """Fetch an Aquarea status and remember the response."""
+        json_response = await super()._async_get_aquarea_status(device_info)
+        if isinstance(json_response, dict):
+            self._last_status[device_info.id] = json_response
+        return json_response
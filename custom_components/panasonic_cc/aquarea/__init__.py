@@ -5,9 +5,9 @@ import asyncio
 import logging
 
 from aio_panasonic_comfort_cloud import ApiClient, PanasonicDeviceInfo
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..const import (
     CONF_ENABLE_DAILY_ENERGY_SENSOR,
@@ -15,7 +15,13 @@ from ..const import (
     DOMAIN,
     MANUFACTURER,
 )
-from .const import AQUAREA_COORDINATORS, AQUAREA_ENERGY_COORDINATORS
+from ..discovery import DeviceDiscovery
+from ..runtime_data import PanasonicConfigEntry
+from .const import (
+    SIGNAL_AQUAREA_DEVICE_DISCOVERED,
+    SIGNAL_AQUAREA_ENERGY_ADDED,
+    SIGNAL_AQUAREA_ENERGY_REMOVED,
+)
 from .coordinator import AquareaConsumptionCoordinator, AquareaDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,14 +40,12 @@ PLATFORMS = [
 
 async def async_setup_aquarea(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
     panasonic_api: ApiClient,
 ) -> list[AquareaDeviceCoordinator]:
     """Set up Aquarea devices: build coordinators from the shared ApiClient session and register devices."""
     aquarea_devices = panasonic_api.aquarea_devices
     if not aquarea_devices:
-        hass.data[DOMAIN][AQUAREA_COORDINATORS] = []
-        hass.data[DOMAIN][AQUAREA_ENERGY_COORDINATORS] = []
         return []
 
     config = {**entry.data, **entry.options}
@@ -71,30 +75,45 @@ async def async_setup_aquarea(
                 exc_info=True,
             )
 
-    # Refresh all Aquarea coordinators in parallel
-    async def _init_aquarea(coordinator: AquareaDeviceCoordinator, device_info: PanasonicDeviceInfo) -> None:
-        try:
-            await coordinator.async_config_entry_first_refresh()
+    # Start from the state persisted last time when there is one; the poller
+    # refreshes it from the cloud right after setup
+    restored = await asyncio.gather(
+        *(coordinator.async_restore_state() for coordinator, _ in aquarea_coordinators_uninitialized),
+        return_exceptions=True,
+    )
+    undiscovered: list[AquareaDeviceCoordinator] = []
+    for (coordinator, _), is_restored in zip(aquarea_coordinators_uninitialized, restored):
+        if is_restored is True:
             aquarea_coordinators.append(coordinator)
-        except Exception as exc:
-            _LOGGER.warning(
-                "Failed to setup Aquarea device %s: %s",
-                device_info.name,
-                exc,
-                exc_info=True,
-            )
+        else:
+            undiscovered.append(coordinator)
+
+    @callback
+    def _async_device_discovered(coordinator: AquareaDeviceCoordinator) -> None:
+        """Attach a device that only responded after setup."""
+        aquarea_coordinators.append(coordinator)
+        entry.runtime_data.poller.async_add_coordinators([coordinator])
+        async_dispatcher_send(
+            hass, SIGNAL_AQUAREA_DEVICE_DISCOVERED.format(entry.entry_id), coordinator
+        )
 
-    await asyncio.gather(
-        *(_init_aquarea(coordinator, device_info) for coordinator, device_info in aquarea_coordinators_uninitialized),
-        return_exceptions=True,
+    # Fetch the rest in parallel; slow or offline units keep retrying in the
+    # background instead of holding up setup
+    discovery = DeviceDiscovery(
+        hass,
+        f"Aquarea ({entry.title})",
+        _async_device_discovered,
+        entry.runtime_data.rate_limiter,
     )
+    aquarea_coordinators.extend(await discovery.async_discover(undiscovered))
 
-    hass.data[DOMAIN][AQUAREA_COORDINATORS] = aquarea_coordinators
-    hass.data[DOMAIN][AQUAREA_ENERGY_COORDINATORS] = energy_coordinators
+    entry.runtime_data.aquarea_coordinators = aquarea_coordinators
+    entry.runtime_data.aquarea_energy_coordinators = energy_coordinators
+    entry.runtime_data.aquarea_discovery = discovery
 
-    # Register devices in device registry
+    # Register every device, including those that are still being discovered
     device_registry = dr.async_get(hass)
-    for coordinator in aquarea_coordinators:
+    for coordinator, _ in aquarea_coordinators_uninitialized:
         device_registry.async_get_or_create(
             config_entry_id=entry.entry_id,
             identifiers={(DOMAIN, coordinator.device_id)},
@@ -113,9 +132,46 @@ async def async_setup_aquarea(
     return aquarea_coordinators
 
 
+async def async_set_energy_enabled(
+    hass: HomeAssistant,
+    entry: PanasonicConfigEntry,
+    panasonic_api: ApiClient,
+    enabled: bool,
+) -> None:
+    """Create or shut down the consumption coordinators after the energy option changed."""
+    runtime = entry.runtime_data
+    if not enabled:
+        removed, runtime.aquarea_energy_coordinators = runtime.aquarea_energy_coordinators, []
+        runtime.poller.async_remove_coordinators(removed)
+        for coordinator in removed:
+            async_dispatcher_send(hass, SIGNAL_AQUAREA_ENERGY_REMOVED.format(coordinator.device_id))
+        await asyncio.gather(
+            *(coordinator.async_shutdown() for coordinator in removed),
+            return_exceptions=True,
+        )
+        return
+    if runtime.aquarea_energy_coordinators or not panasonic_api.aquarea_devices:
+        return
+
+    config = {**entry.data, **entry.options}
+    energy_coordinators = [
+        AquareaConsumptionCoordinator(hass, config, panasonic_api, device_info)
+        for device_info in panasonic_api.aquarea_devices
+    ]
+    await asyncio.gather(
+        *(coordinator.async_refresh() for coordinator in energy_coordinators),
+        return_exceptions=True,
+    )
+    runtime.aquarea_energy_coordinators = energy_coordinators
+    runtime.poller.async_add_coordinators(energy_coordinators)
+    async_dispatcher_send(
+        hass, SIGNAL_AQUAREA_ENERGY_ADDED.format(entry.entry_id), energy_coordinators
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
     panasonic_api: ApiClient,
 ) -> bool:
     """Set up Aquarea from a config entry."""
@@ -131,7 +187,7 @@ async def async_setup_entry(
 
 async def async_unload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
 ) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
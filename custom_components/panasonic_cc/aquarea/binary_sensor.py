@@ -14,10 +14,8 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
-from ..const import DOMAIN
-from .base import AquareaDataEntity
+from .base import AquareaDataEntity, async_add_device_entities
 from .coordinator import AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,12 +43,14 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up the Aquarea binary sensors."""
-    entities = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
-    for coordinator in aquarea_coordinators:
-        entities.append(AquareaStatusBinarySensor(coordinator, AQUAREA_STATUS_DESCRIPTION))
-        entities.append(AquareaDefrostBinarySensor(coordinator, AQUAREA_DEFROST_DESCRIPTION))
-    async_add_entities(entities)
+
+    def _create_entities(coordinator: AquareaDeviceCoordinator) -> list[BinarySensorEntity]:
+        return [
+            AquareaStatusBinarySensor(coordinator, AQUAREA_STATUS_DESCRIPTION),
+            AquareaDefrostBinarySensor(coordinator, AQUAREA_DEFROST_DESCRIPTION),
+        ]
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
 
 class AquareaStatusBinarySensor(AquareaDataEntity, BinarySensorEntity):
@@ -65,7 +65,11 @@ class AquareaStatusBinarySensor(AquareaDataEntity, BinarySensorEntity):
     ) -> None:
         """Initialize the binary sensor."""
         self.entity_description = description
-        super().__init__(coordinator, description.key)
+        super().__init__(
+            coordinator,
+            description.key,
+            ("parameters.is_on_error", "parameters.fault_status"),
+        )
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the binary sensor."""
@@ -92,7 +96,7 @@ class AquareaDefrostBinarySensor(AquareaDataEntity, BinarySensorEntity):
     ) -> None:
         """Initialize the binary sensor."""
         self.entity_description = description
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, ("parameters.device_mode_status",))
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the binary sensor."""
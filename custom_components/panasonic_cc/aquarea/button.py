@@ -9,9 +9,8 @@ from aio_panasonic_comfort_cloud.constants import AquareaDeviceModeStatus
 from homeassistant.core import HomeAssistant, cached_property
 from homeassistant.components.button import ButtonEntity
 
-from ..const import DOMAIN
+from .base import async_add_device_entities
 from .coordinator import AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,10 +50,8 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Aquarea button entities."""
-    entities = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
 
-    for coordinator in aquarea_coordinators:
-        entities.append(AquareaDefrostButton(coordinator))
+    def _create_entities(coordinator: AquareaDeviceCoordinator) -> list[AquareaDefrostButton]:
+        return [AquareaDefrostButton(coordinator)]
 
-    async_add_entities(entities)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
@@ -26,10 +26,11 @@ from aio_panasonic_comfort_cloud.constants import (
 )
 from aio_panasonic_comfort_cloud.models.aquarea import AquareaZoneStatus
 
-from ..const import DOMAIN, PRESET_ECO, PRESET_NONE
-from .base import AquareaDataEntity
+from ..const import PRESET_ECO, PRESET_NONE
+from .base import AquareaDataEntity, async_add_device_entities
 from .coordinator import AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS, AQUAREA_CLIMATE_DELAY_SHORT, AQUAREA_CLIMATE_DELAY_LONG
+from .const import AQUAREA_CLIMATE_DELAY_SHORT, AQUAREA_CLIMATE_DELAY_LONG
+from ..rate_limiter import RequestPriority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +55,7 @@ class AquareaClimateEntityDescription(ClimateEntityDescription):
     """Describes an Aquarea climate entity."""
 
     zone_id: int
+    depends_on: tuple[str, ...] | None = None
 
 
 def convert_mode_and_status_to_hvac_mode(
@@ -114,7 +116,7 @@ class AquareaClimateEntity(AquareaDataEntity, ClimateEntity):
         description: AquareaClimateEntityDescription,
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
         self.entity_description = description
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         zone = self.coordinator.device.parameters.get_zone(description.zone_id)
@@ -197,7 +199,8 @@ class AquareaClimateEntity(AquareaDataEntity, ClimateEntity):
         """Schedule a coordinator refresh after a short delay."""
         await asyncio.sleep(delay)
         try:
-            await self.coordinator.async_request_refresh()
+            with request_priority(RequestPriority.REFRESH):
+                await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception(
                 "Delayed refresh failed for device %s",
@@ -295,9 +298,9 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Aquarea climate entities."""
-    entities = []
-    aquarea_coordinators = hass.data[DOMAIN][AQUAREA_COORDINATORS]
-    for aquarea_coordinator in aquarea_coordinators:
+
+    def _create_entities(aquarea_coordinator: AquareaDeviceCoordinator) -> list[AquareaClimateEntity]:
+        entities = []
         for zone in aquarea_coordinator.device.parameters.zones:
             entities.append(
                 AquareaClimateEntity(
@@ -307,7 +310,15 @@ async def async_setup_entry(
                         name=zone.name,
                         key=f"zone-{zone.id}-climate",
                         translation_key=f"zone-{zone.id}-climate",
+                        depends_on=(
+                            "parameters.operation_mode",
+                            "parameters.direction",
+                            "parameters.special_status",
+                            f"parameters.zones[{zone.id}]",
+                        ),
                     ),
                 )
             )
-    async_add_entities(entities)
+        return entities
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
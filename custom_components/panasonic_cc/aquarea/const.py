@@ -1,7 +1,11 @@
 """Constants for Aquarea devices."""
 
-AQUAREA_COORDINATORS = "aquarea_coordinators"
-AQUAREA_ENERGY_COORDINATORS = "aquarea_energy_coordinators"
+# Sent with the coordinator of a device that came online after setup
+SIGNAL_AQUAREA_DEVICE_DISCOVERED = "panasonic_cc_aquarea_device_discovered_{}"
+# Sent with the energy coordinators created when the energy option is turned on
+SIGNAL_AQUAREA_ENERGY_ADDED = "panasonic_cc_aquarea_energy_added_{}"
+# Sent per device when the energy option is turned off, to remove its energy entities
+SIGNAL_AQUAREA_ENERGY_REMOVED = "panasonic_cc_aquarea_energy_removed_{}"
 
 AQUAREA_SWITCH_DELAY = 10.0
 AQUAREA_SELECT_DELAY = 10.0
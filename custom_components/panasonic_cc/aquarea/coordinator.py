@@ -1,13 +1,18 @@
 """Coordinators for Aquarea devices."""
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
 
 from aiohttp import ClientResponseError
 from homeassistant.components.persistent_notification import async_create
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from aio_panasonic_comfort_cloud import (
     ApiClient,
@@ -20,17 +25,80 @@ from aio_panasonic_comfort_cloud import (
 from ..const import (
     DEFAULT_DEVICE_FETCH_INTERVAL,
     DEFAULT_ENERGY_FETCH_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     CONF_DEVICE_FETCH_INTERVAL,
     CONF_ENERGY_FETCH_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     DOMAIN,
     MANUFACTURER,
     NOTIFICATION_AUTH_EXPIRED,
 )
-from ..error_handler import classify_error, FriendlyError, ErrorCategory
+from ..api_client import PanasonicApiClient
+from ..change_tracking import FieldListenerRegistry, diff_state
+from ..energy_backfill import EnergyBackfill, EnergyStatisticDescription, parse_history_day
+from ..error_handler import backoff_policy, classify_error, FriendlyError, ErrorCategory
+from ..rate_limiter import RequestPriority, current_priority, request_priority
+from ..request_stats import request_device
+from ..scheduler import AccountPoller, AdaptivePollInterval
 
 MAX_CONSECUTIVE_FAILURES = 5
-BACKOFF_MULTIPLIER = 2
-MAX_UPDATE_INTERVAL = 600  # seconds
+# Months of daily consumption entries kept in memory per device
+CONSUMPTION_CACHE_MONTHS = 2
+# Persisted device state is written at most this often
+STATE_CACHE_SAVE_DELAY = 60  # seconds
+
+# AquareaConsumption fields added up when a day-mode response has several entries
+CONSUMPTION_SUM_FIELDS = (
+    ("heatConsumption", "heat_consumption"),
+    ("coolConsumption", "cool_consumption"),
+    ("tankConsumption", "tank_consumption"),
+    ("heatCost", "heat_cost"),
+    ("coolCost", "cool_cost"),
+    ("tankCost", "tank_cost"),
+)
+
+# Daily history imported into long-term statistics by the energy backfill
+ENERGY_STATISTICS = (
+    EnergyStatisticDescription(key="energy", name="Energy"),
+    EnergyStatisticDescription(key="heat_energy", name="Heating energy"),
+    EnergyStatisticDescription(key="cool_energy", name="Cooling energy"),
+    EnergyStatisticDescription(key="tank_energy", name="Tank energy"),
+)
+
+# AquareaDeviceParameters attributes that make up the device state snapshot
+DEVICE_STATE_FIELDS = (
+    "operation_status",
+    "operation_mode",
+    "device_mode_status",
+    "temperature_outdoor",
+    "direction",
+    "pump_duty",
+    "quiet_mode",
+    "force_dhw",
+    "force_heater",
+    "holiday_timer",
+    "powerful_time",
+    "special_status",
+    "is_on_error",
+)
+TANK_STATE_FIELDS = ("operation_status", "temperature", "heat_min", "heat_max", "heat_set")
+ZONE_STATE_FIELDS = (
+    "name",
+    "operation_status",
+    "temperature",
+    "heat_min",
+    "heat_max",
+    "heat_set",
+    "cool_min",
+    "cool_max",
+    "cool_set",
+    "eco_heat",
+    "eco_cool",
+    "comfort_heat",
+    "comfort_cool",
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,7 +128,7 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
         self,
         hass: HomeAssistant,
         config: dict,
-        api_client: ApiClient,
+        api_client: PanasonicApiClient,
         device_info: PanasonicDeviceInfo,
     ) -> None:
         """Initialize the coordinator."""
@@ -71,16 +139,32 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
             hass,
             _LOGGER,
             name=f"Aquarea Device Coordinator ({device_info.name})",
-            update_interval=timedelta(seconds=self._base_interval),
+            # Polling is driven by the account-level AccountPoller
+            update_interval=None,
+            # Only notify listeners when _update_id moves, i.e. the state changed
+            always_update=False,
+        )
+        self.poll_interval = timedelta(seconds=self._base_interval)
+        self._poll_schedule = AdaptivePollInterval(
+            self._base_interval,
+            config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
         )
+        # Set by the AccountPoller that drives this coordinator
+        self.poller: AccountPoller | None = None
         self._api_client = api_client
         self._device_info = device_info
         self._device: AquareaDevice | None = None
         self._update_id = 0
+        self._state_store = Store(hass, version=1, key=f"panasonic_cc_{device_info.id}_state")
+        # True when the device was built from persisted state at startup
+        self.restored_from_cache = False
         self._refresh_task: asyncio.Task | None = None
         self._consecutive_failures = 0
         self._auth_failed = False
-        self._last_device_state_hash: int | None = None
+        self._last_device_state: dict[str, Any] = {}
+        self._changed_fields: frozenset[str] | None = None
+        self._field_listeners = FieldListenerRegistry()
         self._last_error: FriendlyError | None = None
 
     @property
@@ -88,6 +172,11 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
         """Return the last error that occurred."""
         return self._last_error
 
+    @property
+    def changed_fields(self) -> frozenset[str] | None:
+        """Return the field paths changed by the last refresh (None means all)."""
+        return self._changed_fields
+
     @property
     def connection_status(self) -> str:
         """Return the current connection status."""
@@ -99,6 +188,17 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
             return "degraded"
         return "connected"
 
+    @property
+    def is_active(self) -> bool:
+        """Return True while the device is on and its pump is running."""
+        if self._device is None:
+            return False
+        params = self._device.parameters
+        return (
+            params.operation_status == constants.AquareaOperationStatus.On
+            and params.direction != constants.AquareaDeviceDirection.Idle
+        )
+
     @property
     def device(self) -> AquareaDevice:
         """Return the current device state."""
@@ -140,37 +240,95 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
             sw_version=self._api_client.app_version,
         )
 
-    def _device_state_hash(self) -> int:
-        """Compute a hash of the device state for change detection."""
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, optionally only for the field paths in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        paths = context if isinstance(context, Iterable) and not isinstance(context, str) else None
+        remove_field_listener = self._field_listeners.async_add(update_callback, paths)
+
+        @callback
+        def remove_listeners() -> None:
+            """Remove the listener from both registries."""
+            remove_field_listener()
+            remove_listener()
+
+        return remove_listeners
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call only the listeners subscribed to the fields that changed."""
+        for update_callback in self._field_listeners.listeners_for(self._changed_fields):
+            update_callback()
+
+    def _device_state_snapshot(self) -> dict[str, Any]:
+        """Flatten the device state into a snapshot keyed by field path."""
         if self._device is None:
-            return 0
+            return {}
         params = self._device.parameters
-        state = (
-            params.operation_status,
-            params.operation_mode,
-            params.direction,
-            params.special_status,
-            params.force_dhw,
-            params.force_heater,
-            params.quiet_mode,
-            params.powerful_time,
-            params.tank.heat_set if params.tank else None,
-            params.tank.temperature if params.tank else None,
-            params.tank.operation_status if params.tank else None,
-            tuple(
-                (
-                    zone.operation_status,
-                    zone.temperature,
-                    zone.heat_set,
-                    zone.cool_set,
-                )
-                for zone in params.zones
-            ),
+        state: dict[str, Any] = {
+            f"parameters.{name}": getattr(params, name) for name in DEVICE_STATE_FIELDS
+        }
+        state["parameters.fault_status"] = tuple(map(str, params.fault_status or ()))
+        if params.tank is not None:
+            for name in TANK_STATE_FIELDS:
+                state[f"parameters.tank.{name}"] = getattr(params.tank, name)
+        for zone in params.zones:
+            prefix = f"parameters.zones[{zone.id}]"
+            for name in ZONE_STATE_FIELDS:
+                state[f"{prefix}.{name}"] = getattr(zone, name)
+        return state
+
+    async def async_restore_state(self) -> bool:
+        """Build the device from the status response persisted last time.
+
+        Returns True when the entities can start from it; the poller then
+        brings the device up to date in the background.
+        """
+        data = await self._state_store.async_load()
+        if not data or not data.get("status"):
+            return False
+        try:
+            device = AquareaDevice(self._device_info, data["status"])
+            self._device = device
+            self._last_device_state = self._device_state_snapshot()
+        except Exception as err:
+            _LOGGER.debug(
+                "%s Ignoring unusable cached state: %s", self._device_info.name, err
+            )
+            self._device = None
+            return False
+        _LOGGER.debug(
+            "%s Restored cached state from %s", self._device_info.name, data.get("saved_at")
         )
-        return hash(state)
+        self._update_id = 1
+        self.restored_from_cache = True
+        self.async_set_updated_data(self._update_id)
+        return True
+
+    @callback
+    def _async_save_state(self) -> None:
+        """Persist the last status response once the save delay has passed."""
+        self._state_store.async_delay_save(self._state_to_store, STATE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _state_to_store(self) -> dict[str, Any]:
+        """Return the data written to the state store."""
+        return {
+            "status": self._api_client.last_status(self._device_info.id),
+            "saved_at": dt_util.utcnow().isoformat(),
+        }
 
     async def _async_update_data(self) -> int:
         """Fetch data from API."""
+        # Treat everything as changed unless a successful diff narrows it down
+        self._changed_fields = None
+        # Refreshes at REFRESH priority follow a command sent by an entity
+        if current_priority() == RequestPriority.REFRESH:
+            self._poll_schedule.record_command()
+            self._async_update_poll_interval()
         if self._auth_failed:
             raise UpdateFailed("Authentication failed — coordinator disabled")
 
@@ -178,16 +336,24 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
             if self._device is None:
                 self._device = await self._api_client.get_aquarea_device(self._device_info)
                 self._update_id = 1
-                self._last_device_state_hash = self._device_state_hash()
+                self._last_device_state = self._device_state_snapshot()
+                self._async_save_state()
                 self._reset_backoff()
                 return self._update_id
             if await self._api_client.try_update_aquarea_device(self._device):
-                current_hash = self._device_state_hash()
-                if current_hash != self._last_device_state_hash:
-                    self._last_device_state_hash = current_hash
+                current_state = self._device_state_snapshot()
+                changed_fields = diff_state(self._last_device_state, current_state)
+                if changed_fields:
+                    self._last_device_state = current_state
+                    # After a failed refresh every entity must re-evaluate availability
+                    if self.last_update_success:
+                        self._changed_fields = changed_fields
                     self._update_id += 1
+                    self._async_save_state()
+                    self._record_freshness(True)
                     self._reset_backoff()
                     return self._update_id
+            self._record_freshness(False)
             self._reset_backoff()
         except Exception as err:
             if _is_auth_error(err):
@@ -204,8 +370,16 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
             raise UpdateFailed(f"{friendly.title}: {friendly.message}") from err
         return self._update_id
 
+    def _record_freshness(self, changed: bool) -> None:
+        """Tell the adaptive interval whether the refresh returned live or cached status."""
+        if self._device_info.status_data_mode == constants.StatusDataMode.CACHED:
+            # Aquarea status carries no server timestamp to time a follow-up from
+            self._poll_schedule.record_cached(None)
+        else:
+            self._poll_schedule.record_refresh(changed)
+
     def _reset_backoff(self) -> None:
-        """Reset circuit breaker and restore base polling interval."""
+        """Reset circuit breaker and return to the adaptive polling interval."""
         if self._consecutive_failures > 0:
             _LOGGER.debug(
                 "%s API recovered after %d consecutive failure(s)",
@@ -214,18 +388,59 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
             )
         self._consecutive_failures = 0
         self._last_error = None
-        self.update_interval = timedelta(seconds=self._base_interval)
+        self._async_update_poll_interval()
+
+    @property
+    def min_poll_interval(self) -> float:
+        """Return the shortest interval this device is polled at."""
+        return self._poll_schedule.minimum
+
+    @callback
+    def _async_update_poll_interval(self) -> None:
+        """Recompute the adaptive interval and let the poller pull the next poll in."""
+        self.poll_interval = self._poll_schedule.interval(self.is_active)
+        if self.poller is not None:
+            self.poller.async_reschedule(self)
+
+    @callback
+    def async_set_poll_options(self, config: dict) -> None:
+        """Apply changed fetch interval options without recreating the coordinator."""
+        self._base_interval = config.get(
+            CONF_DEVICE_FETCH_INTERVAL, DEFAULT_DEVICE_FETCH_INTERVAL
+        )
+        self._poll_schedule.set_bounds(
+            self._base_interval,
+            config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+        # A device that is backing off picks the new interval up once it recovers
+        if self._consecutive_failures == 0:
+            self._async_update_poll_interval()
 
     def _handle_failure(self, err: Exception | None = None) -> None:
-        """Handle API failure with exponential backoff."""
+        """Handle API failure with the backoff policy of its error category."""
         self._consecutive_failures += 1
+        friendly = classify_error(err) if err is not None else None
+        if friendly is not None:
+            self._last_error = friendly
+        policy = backoff_policy(friendly)
+        if friendly is not None and policy.account_wide:
+            # The account poller backs off every device at once for these
+            _LOGGER.warning(
+                "%s API failure %d/%d — %s: %s — left to the account poller",
+                self._device_info.name,
+                self._consecutive_failures,
+                MAX_CONSECUTIVE_FAILURES,
+                friendly.title,
+                friendly.message,
+            )
+            return
         new_interval = min(
-            self._base_interval * (BACKOFF_MULTIPLIER ** self._consecutive_failures),
-            MAX_UPDATE_INTERVAL,
+            self._base_interval * (policy.multiplier ** self._consecutive_failures),
+            policy.max_interval,
         )
-        self.update_interval = timedelta(seconds=new_interval)
+        self.poll_interval = timedelta(seconds=new_interval)
         if err is not None:
-            self._last_error = classify_error(err)
             _LOGGER.warning(
                 "%s API failure %d/%d — %s: %s — polling interval increased to %ds",
                 self._device_info.name,
@@ -253,7 +468,8 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
         async def _delayed_refresh() -> None:
             try:
                 await asyncio.sleep(2)
-                await self.async_request_refresh()
+                with request_priority(RequestPriority.REFRESH), request_device(self.device_id):
+                    await self.async_request_refresh()
             except asyncio.CancelledError:
                 pass
             finally:
@@ -261,6 +477,114 @@ class AquareaDeviceCoordinator(DataUpdateCoordinator[int]):
 
         self._refresh_task = self.hass.async_create_task(_delayed_refresh())
 
+    async def async_shutdown(self) -> None:
+        """Cancel a pending refresh and write out the cached state on unload."""
+        await super().async_shutdown()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        # Save now rather than after the save delay, so a write from this
+        # coordinator cannot land after the entry has been set up again
+        if self._api_client.last_status(self._device_info.id) is not None:
+            await self._state_store.async_save(self._state_to_store())
+
+
+def _daily_consumption(
+    data_time: str, entries: list[AquareaConsumption]
+) -> AquareaConsumption | None:
+    """Turn a day-mode consumption response into the entry for that day.
+
+    The response either has an entry for the day itself or one per hour of
+    it; hourly entries are added up (the outdoor temperature is the latest
+    one reported).
+    """
+    if not entries:
+        return None
+    for entry in entries:
+        if entry.data_time == data_time:
+            return entry
+    json: dict[str, Any] = {"dataTime": data_time}
+    for key, attribute in CONSUMPTION_SUM_FIELDS:
+        values = [
+            value
+            for value in (getattr(entry, attribute) for entry in entries)
+            if value is not None and value >= 0
+        ]
+        if values:
+            json[key] = sum(values)
+    outdoor_temps = [entry.outdoor_temp for entry in entries if entry.outdoor_temp is not None]
+    if outdoor_temps:
+        json["outdoorTemp"] = outdoor_temps[-1]
+    return AquareaConsumption(json)
+
+
+class AquareaConsumptionCache:
+    """Daily Aquarea consumption entries of one device, kept per month.
+
+    A month is downloaded once. Days before today are closed and never
+    change, so their entries are served from memory from then on; only
+    today is fetched again, with a day-mode query. When the day rolls over
+    the day that just closed is fetched one last time for its final value;
+    after a longer break the months holding the closed days are downloaded
+    again. Days follow the Home Assistant time zone, like the energy backfill
+    that reads the closed ones.
+    """
+
+    def __init__(self, api_client: ApiClient, device_info: PanasonicDeviceInfo) -> None:
+        """Initialize the cache."""
+        self._api_client = api_client
+        self._device_info = device_info
+        self._months: OrderedDict[str, dict[str, AquareaConsumption]] = OrderedDict()
+        self._open_day: date | None = None
+
+    async def async_get_month(self, month: date) -> dict[str, AquareaConsumption]:
+        """Return the entries of a month keyed by ``YYYYMMDD``, downloading it once."""
+        key = month.strftime("%Y%m")
+        entries = self._months.get(key)
+        if entries is not None:
+            self._months.move_to_end(key)
+            return entries
+        fetched = await self._api_client.async_get_aquarea_consumption(
+            self._device_info, constants.AquareaDataMode.Month, month.strftime("%Y%m%d")
+        )
+        entries = {entry.data_time: entry for entry in fetched if entry.data_time}
+        self._months[key] = entries
+        while len(self._months) > CONSUMPTION_CACHE_MONTHS:
+            self._months.popitem(last=False)
+        return entries
+
+    async def async_get_today(self) -> AquareaConsumption | None:
+        """Return today's entry, fetching only today unless the month is new."""
+        today = dt_util.now().date()
+        if self._open_day is not None and self._open_day != today:
+            if today - self._open_day == timedelta(days=1):
+                await self._async_refresh_day(self._open_day)
+            else:
+                # Several days closed without a poll; one month query
+                # brings in their final values
+                month = self._open_day.replace(day=1)
+                while month <= today:
+                    self._months.pop(month.strftime("%Y%m"), None)
+                    month = (month + timedelta(days=32)).replace(day=1)
+        if today.strftime("%Y%m") in self._months:
+            await self._async_refresh_day(today)
+        entries = await self.async_get_month(today)
+        self._open_day = today
+        return entries.get(today.strftime("%Y%m%d"))
+
+    async def _async_refresh_day(self, day: date) -> None:
+        """Fetch one day again and replace its entry in the cached month."""
+        entries = self._months.get(day.strftime("%Y%m"))
+        if entries is None:
+            return
+        data_time = day.strftime("%Y%m%d")
+        fetched = await self._api_client.async_get_aquarea_consumption(
+            self._device_info, constants.AquareaDataMode.Day, data_time
+        )
+        entry = _daily_consumption(data_time, fetched)
+        if entry is not None:
+            entries[data_time] = entry
+
 
 class AquareaConsumptionCoordinator(DataUpdateCoordinator[int]):
     """Aquarea energy consumption data coordinator (today's heat/cool/tank consumption+cost)."""
@@ -280,12 +604,24 @@ class AquareaConsumptionCoordinator(DataUpdateCoordinator[int]):
             hass,
             _LOGGER,
             name=f"Aquarea Energy Coordinator ({device_info.name})",
-            update_interval=timedelta(seconds=self._base_interval),
+            # Polling is driven by the account-level AccountPoller
+            update_interval=None,
         )
+        self.poll_interval = timedelta(seconds=self._base_interval)
+        # Set by the AccountPoller that drives this coordinator
+        self.poller: AccountPoller | None = None
         self._api_client = api_client
         self._device_info = device_info
         self._consumption: AquareaConsumption | None = None
+        self._consumption_cache = AquareaConsumptionCache(api_client, device_info)
         self._update_id = 0
+        self._backfill = EnergyBackfill(
+            hass,
+            device_info.id,
+            device_info.name,
+            ENERGY_STATISTICS,
+            self._async_fetch_energy_month,
+        )
         self._consecutive_failures = 0
         self._auth_failed = False
         self._last_error: FriendlyError | None = None
@@ -337,23 +673,40 @@ class AquareaConsumptionCoordinator(DataUpdateCoordinator[int]):
             sw_version=self._api_client.app_version,
         )
 
+    async def async_shutdown(self) -> None:
+        """Stop an energy history backfill in progress on unload."""
+        await super().async_shutdown()
+        self._backfill.async_cancel()
+
+    async def _async_fetch_energy_month(self, month: date) -> dict[date, dict[str, float | None]]:
+        """Return the daily consumption of one month for the energy backfill."""
+        entries = await self._consumption_cache.async_get_month(month)
+        days: dict[date, dict[str, float | None]] = {}
+        for entry in entries.values():
+            day = parse_history_day(entry.data_time)
+            if day is not None:
+                days[day] = {
+                    "energy": entry.total_consumption,
+                    "heat_energy": entry.heat_consumption,
+                    "cool_energy": entry.cool_consumption,
+                    "tank_energy": entry.tank_consumption,
+                }
+        return days
+
     async def _async_update_data(self) -> int:
         """Fetch today's consumption data from the API."""
         if self._auth_failed:
             raise UpdateFailed("Authentication failed — coordinator disabled")
 
-        today = datetime.now().strftime("%Y%m%d")
         try:
-            entries = await self._api_client.async_get_aquarea_consumption(
-                self._device_info, constants.AquareaDataMode.Month, today
-            )
-            todays_entry = next(
-                (entry for entry in entries if entry.data_time == today), None
-            )
+            todays_entry = await self._consumption_cache.async_get_today()
             if todays_entry is not None:
                 self._consumption = todays_entry
                 self._update_id += 1
             self._reset_backoff()
+            # Closed days missed while Home Assistant was down go to the
+            # statistics; the cache has just closed yesterday if needed
+            self._backfill.async_schedule()
         except Exception as err:
             if _is_auth_error(err):
                 self._auth_failed = True
@@ -369,6 +722,17 @@ class AquareaConsumptionCoordinator(DataUpdateCoordinator[int]):
             raise UpdateFailed(f"{friendly.title}: {friendly.message}") from err
         return self._update_id
 
+    @callback
+    def async_set_poll_options(self, config: dict) -> None:
+        """Apply a changed energy fetch interval without recreating the coordinator."""
+        self._base_interval = config.get(
+            CONF_ENERGY_FETCH_INTERVAL, DEFAULT_ENERGY_FETCH_INTERVAL
+        )
+        if self._consecutive_failures == 0:
+            self.poll_interval = timedelta(seconds=self._base_interval)
+            if self.poller is not None:
+                self.poller.async_reschedule(self)
+
     def _reset_backoff(self) -> None:
         """Reset circuit breaker and restore base polling interval."""
         if self._consecutive_failures > 0:
@@ -379,18 +743,32 @@ class AquareaConsumptionCoordinator(DataUpdateCoordinator[int]):
             )
         self._consecutive_failures = 0
         self._last_error = None
-        self.update_interval = timedelta(seconds=self._base_interval)
+        self.poll_interval = timedelta(seconds=self._base_interval)
 
     def _handle_failure(self, err: Exception | None = None) -> None:
-        """Handle API failure with exponential backoff."""
+        """Handle API failure with the backoff policy of its error category."""
         self._consecutive_failures += 1
+        friendly = classify_error(err) if err is not None else None
+        if friendly is not None:
+            self._last_error = friendly
+        policy = backoff_policy(friendly)
+        if friendly is not None and policy.account_wide:
+            # The account poller backs off every device at once for these
+            _LOGGER.warning(
+                "%s Energy API failure %d/%d — %s: %s — left to the account poller",
+                self._device_info.name,
+                self._consecutive_failures,
+                MAX_CONSECUTIVE_FAILURES,
+                friendly.title,
+                friendly.message,
+            )
+            return
         new_interval = min(
-            self._base_interval * (BACKOFF_MULTIPLIER ** self._consecutive_failures),
-            MAX_UPDATE_INTERVAL,
+            self._base_interval * (policy.multiplier ** self._consecutive_failures),
+            policy.max_interval,
         )
-        self.update_interval = timedelta(seconds=new_interval)
+        self.poll_interval = timedelta(seconds=new_interval)
         if err is not None:
-            self._last_error = classify_error(err)
             _LOGGER.warning(
                 "%s Energy API failure %d/%d — %s: %s — polling interval increased to %ds",
                 self._device_info.name,
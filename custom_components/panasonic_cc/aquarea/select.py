@@ -11,10 +11,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 
-from ..const import DOMAIN
-from .base import AquareaDataEntity
+from .base import AquareaDataEntity, async_add_device_entities
 from .coordinator import AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS, AQUAREA_SELECT_DELAY
+from .const import AQUAREA_SELECT_DELAY
+from ..rate_limiter import RequestPriority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +42,7 @@ class AquareaQuietModeSelect(AquareaDataEntity, SelectEntity):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator, "quiet_mode")
+        super().__init__(coordinator, "quiet_mode", ("parameters.quiet_mode",))
         self._attr_translation_key = "quiet_mode"
         self._attr_options = list(QUIET_MODE_LOOKUP.keys())
         self._attr_icon = "mdi:volume-off"
@@ -61,7 +61,8 @@ class AquareaQuietModeSelect(AquareaDataEntity, SelectEntity):
         """Clear optimistic state and request a coordinator refresh after a short delay."""
         await asyncio.sleep(delay)
         self._optimistic_option = None
-        await self.coordinator.async_request_refresh()
+        with request_priority(RequestPriority.REFRESH):
+            await self.coordinator.async_request_refresh()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -90,7 +91,7 @@ class AquareaPowerfulTimeSelect(AquareaDataEntity, SelectEntity):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator, "powerful_time")
+        super().__init__(coordinator, "powerful_time", ("parameters.powerful_time",))
         self._attr_translation_key = "powerful_time"
         self._attr_options = list(POWERFUL_TIME_LOOKUP.keys())
         self._optimistic_option: str | None = None
@@ -114,7 +115,8 @@ class AquareaPowerfulTimeSelect(AquareaDataEntity, SelectEntity):
         """Clear optimistic state and request a coordinator refresh after a short delay."""
         await asyncio.sleep(delay)
         self._optimistic_option = None
-        await self.coordinator.async_request_refresh()
+        with request_priority(RequestPriority.REFRESH):
+            await self.coordinator.async_request_refresh()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -144,11 +146,11 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Aquarea select entities."""
-    entities = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
 
-    for coordinator in aquarea_coordinators:
-        entities.append(AquareaQuietModeSelect(coordinator))
-        entities.append(AquareaPowerfulTimeSelect(coordinator))
+    def _create_entities(coordinator: AquareaDeviceCoordinator) -> list[SelectEntity]:
+        return [
+            AquareaQuietModeSelect(coordinator),
+            AquareaPowerfulTimeSelect(coordinator),
+        ]
 
-    async_add_entities(entities)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
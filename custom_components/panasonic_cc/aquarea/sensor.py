@@ -18,13 +18,13 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.core import callback, HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util import dt as dt_util
 
-from ..const import DOMAIN
-from .base import AquareaDataEntity, AquareaEnergyEntity
+from .base import AquareaDataEntity, AquareaEnergyEntity, async_add_device_entities
+from .const import SIGNAL_AQUAREA_ENERGY_ADDED
 from .coordinator import AquareaConsumptionCoordinator, AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS, AQUAREA_ENERGY_COORDINATORS
 from ..error_handler import ErrorCategory
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,6 +34,7 @@ class AquareaSensorEntityDescription(SensorEntityDescription):
     """Describes Aquarea sensor entity."""
     get_state: Callable[[AquareaDevice], Any] | None = None
     is_available: Callable[[AquareaDevice], bool]| None = None
+    depends_on: tuple[str, ...] | None = None
 
 AQUAREA_OUTSIDE_TEMPERATURE_DESCRIPTION = AquareaSensorEntityDescription(
     key="outside_temperature",
@@ -45,6 +46,7 @@ AQUAREA_OUTSIDE_TEMPERATURE_DESCRIPTION = AquareaSensorEntityDescription(
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     get_state=lambda device: device.parameters.temperature_outdoor,
     is_available=lambda device: device.parameters.temperature_outdoor is not None,
+    depends_on=("parameters.temperature_outdoor",),
 )
 
 AQUAREA_TANK_TEMPERATURE_DESCRIPTION = AquareaSensorEntityDescription(
@@ -57,6 +59,7 @@ AQUAREA_TANK_TEMPERATURE_DESCRIPTION = AquareaSensorEntityDescription(
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     get_state=lambda device: device.parameters.tank.temperature if device.parameters.tank is not None else None,
     is_available=lambda device: device.parameters.tank is not None,
+    depends_on=("parameters.tank",),
 )
 
 AQUAREA_DIRECTION_DESCRIPTION = AquareaSensorEntityDescription(
@@ -66,6 +69,7 @@ AQUAREA_DIRECTION_DESCRIPTION = AquareaSensorEntityDescription(
     icon="mdi:compass",
     get_state=lambda device: device.parameters.direction.name,
     is_available=lambda device: True,
+    depends_on=("parameters.direction",),
 )
 
 AQUAREA_PUMP_STATUS_DESCRIPTION = AquareaSensorEntityDescription(
@@ -75,6 +79,7 @@ AQUAREA_PUMP_STATUS_DESCRIPTION = AquareaSensorEntityDescription(
     icon="mdi:pump",
     get_state=lambda device: "On" if device.parameters.pump_duty == AquareaPumpDuty.On else "Off",
     is_available=lambda device: True,
+    depends_on=("parameters.pump_duty",),
 )
 
 # Connection status sensor options
@@ -175,6 +180,7 @@ AQUAREA_COST_SENSORS = [
 class AquareaDailyCounterEntityDescription(SensorEntityDescription):
     """Describes Aquarea daily counter sensor entity."""
     detector: Callable[[AquareaDevice], bool]
+    depends_on: tuple[str, ...] | None = None
 
 
 AQUAREA_DAILY_COUNTERS = [
@@ -186,6 +192,7 @@ AQUAREA_DAILY_COUNTERS = [
         state_class=SensorStateClass.TOTAL,
         entity_category=EntityCategory.DIAGNOSTIC,
         detector=lambda device: device.parameters.direction == AquareaDeviceDirection.Water,
+        depends_on=("parameters.direction",),
     ),
     AquareaDailyCounterEntityDescription(
         key="zone_cycles_today",
@@ -198,6 +205,7 @@ AQUAREA_DAILY_COUNTERS = [
             device.parameters.direction == AquareaDeviceDirection.Pump
             and any(zone.operation_status == AquareaOperationStatus.On for zone in device.parameters.zones)
         ),
+        depends_on=("parameters.direction", "parameters.zones"),
     ),
     AquareaDailyCounterEntityDescription(
         key="defrost_cycles_today",
@@ -207,16 +215,26 @@ AQUAREA_DAILY_COUNTERS = [
         state_class=SensorStateClass.TOTAL,
         entity_category=EntityCategory.DIAGNOSTIC,
         detector=lambda device: device.parameters.device_mode_status is AquareaDeviceModeStatus.Defrost,
+        depends_on=("parameters.device_mode_status",),
     ),
 ]
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    entities = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
-    energy_coordinators: list[AquareaConsumptionCoordinator] = hass.data[DOMAIN].get(AQUAREA_ENERGY_COORDINATORS, [])
-
-    for coordinator in aquarea_coordinators:
+    discovery = entry.runtime_data.aquarea_discovery
+
+    def _create_energy_entities(
+        coordinator: AquareaDeviceCoordinator, energy_coordinator: AquareaConsumptionCoordinator
+    ) -> list[SensorEntity]:
+        # Which energy sensors exist depends on the device data
+        return [
+            AquareaEnergySensorEntity(energy_coordinator, desc)
+            for desc in (*AQUAREA_ENERGY_SENSORS, *AQUAREA_COST_SENSORS)
+            if desc.exists_fn(coordinator)
+        ]
+
+    def _create_entities(coordinator: AquareaDeviceCoordinator) -> list[SensorEntity]:
+        entities: list[SensorEntity] = []
         entities.append(AquareaSensorEntity(coordinator, AQUAREA_OUTSIDE_TEMPERATURE_DESCRIPTION))
         entities.append(AquareaPumpDirectionSensor(coordinator))
         entities.append(AquareaPumpStatusSensor(coordinator))
@@ -225,22 +243,42 @@ async def async_setup_entry(hass, entry, async_add_entities):
         # Daily edge counters
         for desc in AQUAREA_DAILY_COUNTERS:
             entities.append(AquareaDailyCounterSensor(coordinator, desc))
-        # Connection status sensor
-        entities.append(AquareaConnectionStatusSensor(coordinator))
 
-    aquarea_by_id = {coordinator.device_id: coordinator for coordinator in aquarea_coordinators}
-    for energy_coordinator in energy_coordinators:
-        device_coordinator = aquarea_by_id.get(energy_coordinator.device_id)
-        if device_coordinator is None:
-            continue
-        for desc in AQUAREA_ENERGY_SENSORS:
-            if desc.exists_fn(device_coordinator):
-                entities.append(AquareaEnergySensorEntity(energy_coordinator, desc))
-        for desc in AQUAREA_COST_SENSORS:
-            if desc.exists_fn(device_coordinator):
-                entities.append(AquareaEnergySensorEntity(energy_coordinator, desc))
+        # Looked up when the device is added, so it sees energy turned on since setup
+        for energy_coordinator in entry.runtime_data.aquarea_energy_coordinators:
+            if energy_coordinator.device_id == coordinator.device_id:
+                entities.extend(_create_energy_entities(coordinator, energy_coordinator))
+        return entities
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
-    async_add_entities(entities)
+    @callback
+    def _async_energy_added(energy_coordinators: list[AquareaConsumptionCoordinator]) -> None:
+        """Add the energy sensors of the devices that are online when energy is turned on."""
+        devices = {
+            coordinator.device_id: coordinator
+            for coordinator in entry.runtime_data.aquarea_coordinators
+        }
+        async_add_entities([
+            entity
+            for energy_coordinator in energy_coordinators
+            if (coordinator := devices.get(energy_coordinator.device_id)) is not None
+            for entity in _create_energy_entities(coordinator, energy_coordinator)
+        ])
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_AQUAREA_ENERGY_ADDED.format(entry.entry_id), _async_energy_added
+        )
+    )
+
+    # Connection status sensors; devices that are still being discovered get
+    # theirs (unavailable) right away since it does not need device data
+    pending_coordinators = discovery.pending if discovery is not None else []
+    async_add_entities([
+        AquareaConnectionStatusSensor(coordinator)
+        for coordinator in [*entry.runtime_data.aquarea_coordinators, *pending_coordinators]
+    ])
 
 
 class AquareaSensorEntity(AquareaDataEntity, SensorEntity):
@@ -249,7 +287,7 @@ class AquareaSensorEntity(AquareaDataEntity, SensorEntity):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator, description: AquareaSensorEntityDescription):
         self.entity_description = description  # type: ignore[reportIncompatibleVariableOverride]
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     @property  # type: ignore[reportIncompatibleOverride]
     def available(self) -> bool:
@@ -271,7 +309,7 @@ class AquareaPumpDirectionSensor(AquareaDataEntity, SensorEntity):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, "direction")
+        super().__init__(coordinator, "direction", AQUAREA_DIRECTION_DESCRIPTION.depends_on)
         self._attr_translation_key = "direction"
         self._attr_icon = "mdi:compass"
 
@@ -291,7 +329,7 @@ class AquareaPumpStatusSensor(AquareaDataEntity, SensorEntity):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, "pump_status")
+        super().__init__(coordinator, "pump_status", AQUAREA_PUMP_STATUS_DESCRIPTION.depends_on)
         self._attr_translation_key = "pump_status"
         self._attr_icon = "mdi:pump"
 
@@ -317,7 +355,7 @@ class AquareaDailyCounterSensor(AquareaDataEntity, SensorEntity, RestoreEntity):
         description: AquareaDailyCounterEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
         self.entity_description = description
         self._attr_translation_key = description.key
         self._attr_icon = description.icon
@@ -15,10 +15,10 @@ from homeassistant.components.switch import (
 
 from aio_panasonic_comfort_cloud.constants import AquareaForceDHW, AquareaForceHeater, AquareaHolidayTimer
 
-from ..const import DOMAIN
-from .base import AquareaDataEntity
+from .base import AquareaDataEntity, async_add_device_entities
 from .coordinator import AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS, AQUAREA_SWITCH_DELAY
+from .const import AQUAREA_SWITCH_DELAY
+from ..rate_limiter import RequestPriority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,7 +45,8 @@ class AquareaBaseSwitch(AquareaDataEntity, SwitchEntity):
         await asyncio.sleep(delay)
         self._optimistic_is_on = None
         try:
-            await self.coordinator.async_request_refresh()
+            with request_priority(RequestPriority.REFRESH):
+                await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception(
                 "Delayed refresh failed for device %s",
@@ -58,7 +59,7 @@ class AquareaForceDHWSwitch(AquareaBaseSwitch):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, "force_dhw")
+        super().__init__(coordinator, "force_dhw", ("parameters.force_dhw",))
         self._attr_translation_key = "force_dhw"
 
     @property
@@ -92,7 +93,7 @@ class AquareaForceHeaterSwitch(AquareaBaseSwitch):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, "force_heater")
+        super().__init__(coordinator, "force_heater", ("parameters.force_heater",))
         self._attr_translation_key = "force_heater"
 
     @property
@@ -126,7 +127,7 @@ class AquareaHolidayTimerSwitch(AquareaBaseSwitch):
 
     def __init__(self, coordinator: AquareaDeviceCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, "holiday_timer")
+        super().__init__(coordinator, "holiday_timer", ("parameters.holiday_timer",))
         self._attr_translation_key = "holiday_timer"
 
     @property
@@ -161,15 +162,13 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Aquarea switches."""
-    devices = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][
-        AQUAREA_COORDINATORS
-    ]
 
-    for coordinator in aquarea_coordinators:
+    def _create_entities(coordinator: AquareaDeviceCoordinator) -> list[SwitchEntity]:
+        devices = []
         if coordinator.device.parameters.has_tank:
             devices.append(AquareaForceDHWSwitch(coordinator))
         devices.append(AquareaForceHeaterSwitch(coordinator))
         devices.append(AquareaHolidayTimerSwitch(coordinator))
+        return devices
 
-    async_add_entities(devices)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
@@ -16,10 +16,8 @@ from homeassistant.config_entries import ConfigEntry
 
 from aio_panasonic_comfort_cloud.constants import AquareaOperationStatus
 
-from ..const import DOMAIN
-from .base import AquareaDataEntity
+from .base import AquareaDataEntity, async_add_device_entities
 from .coordinator import AquareaDeviceCoordinator
-from .const import AQUAREA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,23 +26,26 @@ _LOGGER = logging.getLogger(__name__)
 class AquareaWaterHeaterEntityDescription(WaterHeaterEntityDescription):
     """Describes a Aquarea Water Heater entity."""
 
+    depends_on: tuple[str, ...] | None = None
+
 
 AQUAREA_WATER_TANK_DESCRIPTION = AquareaWaterHeaterEntityDescription(
     key="tank",
     translation_key="tank",
     name="Tank",
+    depends_on=("parameters.tank",),
 )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the Aquarea water heater."""
-    entities = []
-    aquarea_coordinators: list[AquareaDeviceCoordinator] = hass.data[DOMAIN][AQUAREA_COORDINATORS]
-    for aquarea_coordinator in aquarea_coordinators:
+
+    def _create_entities(aquarea_coordinator: AquareaDeviceCoordinator) -> list[AquareaWaterHeater]:
         if not aquarea_coordinator.device.parameters.has_tank:
-            continue
-        entities.append(AquareaWaterHeater(aquarea_coordinator, AQUAREA_WATER_TANK_DESCRIPTION))
-    async_add_entities(entities)
+            return []
+        return [AquareaWaterHeater(aquarea_coordinator, AQUAREA_WATER_TANK_DESCRIPTION)]
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
 
 class AquareaWaterHeater(AquareaDataEntity, WaterHeaterEntity):
@@ -65,7 +66,7 @@ class AquareaWaterHeater(AquareaDataEntity, WaterHeaterEntity):
     ) -> None:
         """Initialize the water heater entity."""
         self.entity_description = description
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     def _async_update_attrs(self) -> None:
         """Update attributes."""
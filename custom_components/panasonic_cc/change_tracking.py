@@ -0,0 +1,90 @@
+"""Structural change tracking for coordinator device state.
+
+Coordinators flatten their device state into a snapshot keyed by field path
+(``parameters.fan_speed``, ``parameters.zones[2].temperature``) and diff it
+against the previous snapshot after every refresh. Listeners can subscribe to
+the paths they read so they are only called back when one of them changed.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+_MISSING = object()
+_PATH_SPLIT = re.compile(r"[.\[]")
+
+
+def diff_state(previous: dict[str, Any], current: dict[str, Any]) -> frozenset[str]:
+    """Return the paths whose value differs between two state snapshots."""
+    return frozenset(
+        path
+        for path in previous.keys() | current.keys()
+        if previous.get(path, _MISSING) != current.get(path, _MISSING)
+    )
+
+
+def path_prefixes(path: str) -> list[str]:
+    """Return a path and every parent path it is nested under.
+
+    ``parameters.zones[2].temperature`` yields ``parameters``,
+    ``parameters.zones``, ``parameters.zones[2]`` and the full path, so a
+    subscription to any of them matches a change to the leaf.
+    """
+    prefixes = [path[:match.start()] for match in _PATH_SPLIT.finditer(path) if match.start() > 0]
+    prefixes.append(path)
+    return prefixes
+
+
+class FieldListenerRegistry:
+    """Index coordinator listeners by the field paths they depend on."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._listeners: dict[CALLBACK_TYPE, frozenset[str] | None] = {}
+        self._unfiltered: dict[CALLBACK_TYPE, None] = {}
+        self._by_path: dict[str, set[CALLBACK_TYPE]] = {}
+
+    @callback
+    def async_add(
+        self, update_callback: CALLBACK_TYPE, paths: Iterable[str] | None = None
+    ) -> CALLBACK_TYPE:
+        """Register a listener; ``paths=None`` subscribes to every change."""
+        subscribed = frozenset(paths) if paths is not None else None
+        self._listeners[update_callback] = subscribed
+        if subscribed is None:
+            self._unfiltered[update_callback] = None
+        for path in subscribed or ():
+            self._by_path.setdefault(path, set()).add(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            removed = self._listeners.pop(update_callback, None)
+            self._unfiltered.pop(update_callback, None)
+            for path in removed or ():
+                listeners = self._by_path.get(path)
+                if listeners is None:
+                    continue
+                listeners.discard(update_callback)
+                if not listeners:
+                    del self._by_path[path]
+
+        return remove_listener
+
+    def listeners_for(self, changed: frozenset[str] | None) -> list[CALLBACK_TYPE]:
+        """Return the listeners to call for a set of changed paths.
+
+        ``changed=None`` means the whole state must be treated as new (first
+        load, recovery after a failure) and returns every listener.
+        """
+        if changed is None:
+            return list(self._listeners)
+        selected = dict(self._unfiltered)
+        for path in changed:
+            for prefix in path_prefixes(path):
+                for update_callback in self._by_path.get(prefix, ()):
+                    selected[update_callback] = None
+        return list(selected)
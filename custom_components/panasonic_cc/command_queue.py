@@ -0,0 +1,190 @@
+"""Durable queue of device writes that failed with a recoverable error."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .error_handler import classify_error
+from .request_stats import request_device
+
+# Delay before the first retry of a queued write
+COMMAND_RETRY_INITIAL = 10  # seconds
+# Retries back off up to this delay
+COMMAND_RETRY_MAX = 300  # seconds
+# Writes still queued after this long are dropped rather than applied out of the blue
+COMMAND_QUEUE_MAX_AGE = 3600  # seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandQueue:
+    """Keep the writes of one device that the cloud could not take, and retry them.
+
+    Queued writes are merged with ``merge``, so a later write to the same
+    field replaces the earlier one and only the latest value of each field
+    is ever sent. The queue is persisted, so writes made just before a
+    restart are not lost; ``on_change`` is called whenever it changes and
+    ``on_settled`` once it is empty again, with the error that made it give
+    up, if any.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_id: str,
+        device_name: str,
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+        merge: Callable[[dict[str, Any], dict[str, Any]], None],
+        on_change: Callable[[], None],
+        on_settled: Callable[[Exception | None], None],
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._device_id = device_id
+        self._device_name = device_name
+        self._send = send
+        self._merge = merge
+        self._on_change = on_change
+        self._on_settled = on_settled
+        self._store = Store(hass, version=1, key=f"panasonic_cc_{device_id}_commands")
+        self._changes: dict[str, Any] = {}
+        self._queued_at: datetime | None = None
+        self._attempts = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> dict[str, Any]:
+        """Return the merged writes waiting to be sent."""
+        return self._changes
+
+    @property
+    def attempts(self) -> int:
+        """Return how many retries of the pending writes have failed."""
+        return self._attempts
+
+    async def async_load(self) -> None:
+        """Load the writes that were still queued when Home Assistant stopped."""
+        data = await self._store.async_load()
+        if not data or not data.get("changes"):
+            return
+        queued_at = dt_util.parse_datetime(data.get("queued_at") or "")
+        if queued_at is None or self._expired(queued_at):
+            await self._store.async_remove()
+            return
+        self._changes = data["changes"]
+        self._queued_at = queued_at
+        self._attempts = data.get("attempts", 0)
+
+    @callback
+    def async_resume(self) -> None:
+        """Start retrying the loaded writes once the device can take them."""
+        if self._changes:
+            self._start_retry()
+
+    @callback
+    def async_enqueue(self, changes: dict[str, Any]) -> None:
+        """Queue writes that failed, merging them over the ones already queued."""
+        if not self._changes:
+            self._queued_at = dt_util.utcnow()
+            self._attempts = 0
+        self._merge(self._changes, changes)
+        self._async_save()
+        self._start_retry()
+        self._on_change()
+
+    @callback
+    def async_take(self) -> dict[str, Any]:
+        """Remove and return every queued write, to be sent with a new one."""
+        changes, self._changes = self._changes, {}
+        if changes:
+            self.async_cancel()
+            self._async_save()
+        return changes
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop retrying; the queued writes stay persisted."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def _start_retry(self) -> None:
+        """Start the retry loop unless it is already running."""
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_retry(), f"{self._device_name} command retry"
+            )
+
+    async def _async_retry(self) -> None:
+        """Send the queued writes with exponential backoff until they are taken."""
+        delay = COMMAND_RETRY_INITIAL
+        error: Exception | None = None
+        try:
+            while self._changes:
+                await asyncio.sleep(delay)
+                if self._queued_at is not None and self._expired(self._queued_at):
+                    error = TimeoutError("Queued command expired before the device took it")
+                    break
+                try:
+                    with request_device(self._device_id):
+                        await self._send(self._changes)
+                except Exception as err:
+                    friendly = classify_error(err)
+                    self._attempts += 1
+                    if not friendly.is_recoverable:
+                        error = err
+                        break
+                    delay = min(delay * 2, COMMAND_RETRY_MAX)
+                    _LOGGER.debug(
+                        "%s Queued command failed again (%s), retrying in %ds",
+                        self._device_name,
+                        friendly.title,
+                        delay,
+                    )
+                    self._async_save()
+                    self._on_change()
+                    continue
+                _LOGGER.info(
+                    "%s Queued command sent after %d retries", self._device_name, self._attempts
+                )
+                break
+        finally:
+            self._task = None
+        if error is not None:
+            _LOGGER.warning(
+                "%s Dropping queued command: %s", self._device_name, error
+            )
+        self._changes = {}
+        self._attempts = 0
+        self._async_save()
+        self._on_settled(error)
+
+    @callback
+    def _async_save(self) -> None:
+        """Persist the queue, or remove the file when it is empty."""
+        if not self._changes:
+            self._hass.async_create_task(self._store.async_remove())
+            return
+        self._store.async_delay_save(self._data_to_store, 0)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the data written to the queue store."""
+        return {
+            "changes": self._changes,
+            "queued_at": self._queued_at.isoformat() if self._queued_at else None,
+            "attempts": self._attempts,
+        }
+
+    @staticmethod
+    def _expired(queued_at: datetime) -> bool:
+        """Return True if writes queued at this time are too old to apply."""
+        return (dt_util.utcnow() - queued_at).total_seconds() > COMMAND_QUEUE_MAX_AGE
@@ -21,12 +21,20 @@ from .const import (
     CONF_ENERGY_FETCH_INTERVAL,
     CONF_FORCE_ENABLE_NANOE,
     CONF_FORCE_OUTSIDE_SENSOR,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MAX_STALENESS,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_REQUEST_BUDGET,
     CONF_USE_PANASONIC_PRESET_NAMES,
     DEFAULT_AUTO_POWER_ON,
     DEFAULT_DEVICE_FETCH_INTERVAL,
     DEFAULT_ENABLE_DAILY_ENERGY_SENSOR,
     DEFAULT_ENERGY_FETCH_INTERVAL,
     DEFAULT_FORCE_ENABLE_NANOE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_REQUEST_BUDGET,
     DEFAULT_USE_PANASONIC_PRESET_NAMES,
     DOMAIN,
 )
@@ -396,6 +404,17 @@ class FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return await self._async_handle_login(merged_input, "reauth_confirm")
 
 
+def _validate_poll_intervals(options: Mapping[str, Any]) -> dict[str, str]:
+    """Return form errors when the adaptive polling bounds do not fit together."""
+    minimum = options.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)
+    maximum = options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+    if minimum > maximum:
+        return {CONF_MIN_POLL_INTERVAL: "min_poll_above_max"}
+    if maximum < options.get(CONF_DEVICE_FETCH_INTERVAL, DEFAULT_DEVICE_FETCH_INTERVAL):
+        return {CONF_MAX_POLL_INTERVAL: "max_poll_below_fetch_interval"}
+    return {}
+
+
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle an option changes."""
 
@@ -407,59 +426,82 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+        options = {**self._config_entry.options, **(user_input or {})}
         if user_input is not None:
-            return self.async_create_entry(
-                title="",
-                data={
-                    **self._config_entry.options,
-                    **user_input,
-                },
-            )
+            errors = _validate_poll_intervals(options)
+            if not errors:
+                return self.async_create_entry(title="", data=options)
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Optional(
                     CONF_FORCE_OUTSIDE_SENSOR,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_FORCE_OUTSIDE_SENSOR, False
                     ),
                 ): bool,
                 vol.Optional(
                     CONF_ENABLE_DAILY_ENERGY_SENSOR,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_ENABLE_DAILY_ENERGY_SENSOR, DEFAULT_ENABLE_DAILY_ENERGY_SENSOR
                     ),
                 ): bool,
                 vol.Optional(
                     CONF_FORCE_ENABLE_NANOE,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_FORCE_ENABLE_NANOE, DEFAULT_FORCE_ENABLE_NANOE
                     ),
                 ): bool,
                 vol.Optional(
                     CONF_USE_PANASONIC_PRESET_NAMES,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_USE_PANASONIC_PRESET_NAMES, DEFAULT_USE_PANASONIC_PRESET_NAMES
                     ),
                 ): bool,
                 vol.Optional(
                     CONF_AUTO_POWER_ON,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_AUTO_POWER_ON, DEFAULT_AUTO_POWER_ON
                     ),
                 ): bool,
                 vol.Optional(
                     CONF_DEVICE_FETCH_INTERVAL,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_DEVICE_FETCH_INTERVAL, DEFAULT_DEVICE_FETCH_INTERVAL
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
                 vol.Optional(
                     CONF_ENERGY_FETCH_INTERVAL,
-                    default=self._config_entry.options.get(
+                    default=options.get(
                         CONF_ENERGY_FETCH_INTERVAL, DEFAULT_ENERGY_FETCH_INTERVAL
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=10, max=600)),
+                vol.Optional(
+                    CONF_REQUEST_BUDGET,
+                    default=options.get(
+                        CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=6, max=300)),
+                vol.Optional(
+                    CONF_MIN_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                vol.Optional(
+                    CONF_MAX_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                vol.Optional(
+                    CONF_MAX_STALENESS,
+                    default=options.get(
+                        CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
             }),
+            errors=errors,
         )
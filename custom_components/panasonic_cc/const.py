@@ -1,18 +1,22 @@
 """Shared constants for Panasonic Comfort Cloud integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.const import CONF_ICON, CONF_NAME, CONF_TYPE, Platform
 from homeassistant.components.climate.const import (
     HVACMode, ClimateEntityFeature,
     PRESET_ECO, PRESET_NONE, PRESET_BOOST)
+from homeassistant.util.hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from .scheduler import PollScheduler
 
 DOMAIN = "panasonic_cc"
 MANUFACTURER = "Panasonic"
 
-# Coordinator keys in hass.data[DOMAIN]
-DATA_COORDINATORS = "data_coordinators"
-ENERGY_COORDINATORS = "energy_coordinators"
-AQUAREA_COORDINATORS = "aquarea_coordinators"
-AQUAREA_ENERGY_COORDINATORS = "aquarea_energy_coordinators"
-HWS_COORDINATORS = "hws_coordinators"
+# The only domain-wide state; everything per account lives on entry.runtime_data
+DATA_SCHEDULER: HassKey[PollScheduler] = HassKey(DOMAIN)
 
 NOTIFICATION_AUTH_EXPIRED = f"{DOMAIN}_auth_expired"
 
@@ -27,10 +31,19 @@ CONF_DEVICE_FETCH_INTERVAL = "device_fetch_interval"
 CONF_ENERGY_FETCH_INTERVAL = "energy_fetch_interval"
 DEFAULT_DEVICE_FETCH_INTERVAL = 120
 DEFAULT_ENERGY_FETCH_INTERVAL = 300
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+DEFAULT_MIN_POLL_INTERVAL = 30
+DEFAULT_MAX_POLL_INTERVAL = 900
 CONF_FORCE_ENABLE_NANOE = "force_enable_nanoe"
 DEFAULT_FORCE_ENABLE_NANOE = False
 CONF_AUTO_POWER_ON = "auto_power_on"
 DEFAULT_AUTO_POWER_ON = True
+CONF_REQUEST_BUDGET = "request_budget"
+DEFAULT_REQUEST_BUDGET = 30
+# Entities go unavailable once their data is older than this; 0 (the default) turns it off
+CONF_MAX_STALENESS = "max_staleness"
+DEFAULT_MAX_STALENESS = 0
 
 # Service definitions
 SERVICE_SET_SWING_LR_MODE = "set_horizontal_swing_mode"
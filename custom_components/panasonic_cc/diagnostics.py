@@ -4,17 +4,11 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 
-from .const import (
-    AQUAREA_COORDINATORS,
-    DATA_COORDINATORS,
-    DOMAIN,
-    ENERGY_COORDINATORS,
-    HWS_COORDINATORS,
-)
+from .const import DATA_SCHEDULER
+from .runtime_data import PanasonicConfigEntry
 
 TO_REDACT = {
     CONF_PASSWORD,
@@ -26,19 +20,20 @@ TO_REDACT = {
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: PanasonicConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    data_coordinators = hass.data[DOMAIN].get(DATA_COORDINATORS, [])
-    energy_coordinators = hass.data[DOMAIN].get(ENERGY_COORDINATORS, [])
-    aquarea_coordinators = hass.data[DOMAIN].get(AQUAREA_COORDINATORS, [])
+    runtime = entry.runtime_data
 
     devices = []
-    for coordinator in data_coordinators:
+    for coordinator in runtime.data_coordinators:
         device_info = {
             "id": coordinator.device_id,
             "name": coordinator._device_info.name,
             "model": coordinator._device_info.model,
+            "pending_commands": coordinator.pending_commands,
+            "data_age": coordinator.freshness.age(),
+            "stale_fields": sorted(coordinator.freshness.stale_paths()),
         }
         if coordinator._device is not None:
             panasonic_device = coordinator._device
@@ -62,7 +57,7 @@ async def async_get_config_entry_diagnostics(
         devices.append(device_info)
 
     energy_data = []
-    for coordinator in energy_coordinators:
+    for coordinator in runtime.energy_coordinators:
         if coordinator._energy is not None:
             energy_data.append(
                 {
@@ -73,7 +68,7 @@ async def async_get_config_entry_diagnostics(
             )
 
     aquarea_devices = []
-    for coordinator in aquarea_coordinators:
+    for coordinator in runtime.aquarea_coordinators:
         if coordinator._device is not None:
             aquarea_params = coordinator._device.parameters
             aquarea_devices.append(
@@ -87,9 +82,8 @@ async def async_get_config_entry_diagnostics(
                 }
             )
 
-    hws_coordinators = hass.data[DOMAIN].get(HWS_COORDINATORS, [])
     hws_devices = []
-    for coordinator in hws_coordinators:
+    for coordinator in runtime.hws_coordinators:
         if coordinator._device is not None:
             hws_params = coordinator._device.parameters
             hws_devices.append(
@@ -102,6 +96,23 @@ async def async_get_config_entry_diagnostics(
                 }
             )
 
+    rate_limiter = runtime.rate_limiter
+    performance: dict[str, Any] = {
+        "polling": runtime.poller.get_stats(),
+        "requests": {
+            "requests_per_minute": rate_limiter.requests_per_minute,
+            "total_requests": rate_limiter.total_requests,
+            "throttled_requests": rate_limiter.throttled_requests,
+            "average_wait": round(rate_limiter.average_wait, 3),
+        },
+        "devices": runtime.request_stats.as_dict(),
+    }
+    if runtime.setup_duration is not None:
+        performance["setup_duration"] = round(runtime.setup_duration, 3)
+    # Every account shares the scheduler, so this covers the other entries too
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is not None:
+        performance["scheduler"] = scheduler.get_stats()
+
     return async_redact_data(
         {
             "entry": entry.as_dict(),
@@ -109,6 +120,7 @@ async def async_get_config_entry_diagnostics(
             "energy_data": energy_data,
             "aquarea_devices": aquarea_devices,
             "hws_devices": hws_devices,
+            "performance": performance,
         },
         TO_REDACT,
     )
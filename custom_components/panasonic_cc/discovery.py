@@ -0,0 +1,138 @@
+"""Background discovery of devices whose first refresh did not succeed."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .rate_limiter import RATE_LIMIT_BURST, AccountRateLimiter, RequestPriority, request_priority
+from .request_stats import request_device
+
+# How long setup waits for the first refresh of every device, on top of the
+# time the account's request budget needs to let all of them through
+DISCOVERY_SETUP_TIMEOUT = 15  # seconds
+# Delay before the first background retry of a device that did not respond
+DISCOVERY_RETRY_INITIAL = 30  # seconds
+# Retries back off up to this delay
+DISCOVERY_RETRY_MAX = 900  # seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeviceDiscovery:
+    """Bring devices online in the background until their first refresh succeeds.
+
+    Setup starts the first refresh of every device at once and waits for
+    them for ``DISCOVERY_SETUP_TIMEOUT`` plus the time the rate limiter needs
+    to let every first request through. Devices that respond in time are
+    returned and set up with the entry. The others stay pending: their
+    refresh carries on and is retried with exponential backoff, and as soon
+    as one succeeds ``on_discovered`` attaches the device to the running
+    entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        on_discovered: Callable[[DataUpdateCoordinator], None],
+        rate_limiter: AccountRateLimiter | None = None,
+    ) -> None:
+        """Initialize the discovery."""
+        self._hass = hass
+        self._name = name
+        self._on_discovered = on_discovered
+        self._rate_limiter = rate_limiter
+        self._tasks: dict[DataUpdateCoordinator, asyncio.Task[bool]] = {}
+        # Devices whose refresh has failed at least once, as opposed to still waiting
+        self._failed: set[DataUpdateCoordinator] = set()
+        self._setup_done = False
+
+    def setup_timeout(self, devices: int) -> float:
+        """Return how long setup waits for the first refresh of ``devices`` devices.
+
+        Requests beyond the limiter's burst are let through at the account's
+        request budget, so a large account is not reported as unresponsive
+        just because its requests were still queued.
+        """
+        if self._rate_limiter is None:
+            return DISCOVERY_SETUP_TIMEOUT
+        queued = max(devices - RATE_LIMIT_BURST, 0)
+        return DISCOVERY_SETUP_TIMEOUT + queued * 60 / self._rate_limiter.requests_per_minute
+
+    @property
+    def pending(self) -> list[DataUpdateCoordinator]:
+        """Return the coordinators still waiting for a successful refresh."""
+        return [
+            coordinator for coordinator, task in self._tasks.items() if not task.done()
+        ]
+
+    async def async_discover(
+        self, coordinators: Iterable[DataUpdateCoordinator]
+    ) -> list[DataUpdateCoordinator]:
+        """Refresh the coordinators and return the ones that responded during setup."""
+        for coordinator in coordinators:
+            self._tasks[coordinator] = self._hass.async_create_background_task(
+                self._async_discover(coordinator),
+                f"{self._name} discovery of {coordinator.name}",
+            )
+        if self._tasks:
+            await asyncio.wait(
+                self._tasks.values(), timeout=self.setup_timeout(len(self._tasks))
+            )
+        # Nothing is awaited from here on, so every task is either counted as
+        # ready below or reports itself through on_discovered later
+        self._setup_done = True
+        ready = [
+            coordinator
+            for coordinator, task in self._tasks.items()
+            if task.done() and not task.cancelled() and task.result()
+        ]
+        for coordinator in self.pending:
+            if coordinator in self._failed:
+                _LOGGER.warning(
+                    "%s did not respond during setup; it will be added once it does",
+                    coordinator.name,
+                )
+            else:
+                # Nothing went wrong; its first request has not been sent or answered yet
+                _LOGGER.debug(
+                    "%s is still waiting for its first refresh; it will be added once it responds",
+                    coordinator.name,
+                )
+        return ready
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop retrying the devices that are still pending."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        self._tasks.clear()
+        self._failed.clear()
+
+    async def _async_discover(self, coordinator: DataUpdateCoordinator) -> bool:
+        """Refresh a coordinator until it succeeds or authentication fails."""
+        delay = DISCOVERY_RETRY_INITIAL
+        while True:
+            with request_priority(RequestPriority.POLL), request_device(coordinator.device_id):
+                await coordinator.async_refresh()
+            if coordinator.last_update_success:
+                break
+            if getattr(coordinator, "connection_status", None) == "authentication_error":
+                return False
+            self._failed.add(coordinator)
+            _LOGGER.debug(
+                "%s first refresh failed, retrying in %ds", coordinator.name, delay
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, DISCOVERY_RETRY_MAX)
+
+        self._failed.discard(coordinator)
+        if self._setup_done:
+            _LOGGER.info("%s responded, adding it", coordinator.name)
+            self._on_discovered(coordinator)
+        return True
@@ -0,0 +1,190 @@
+"""Import past energy consumption into Home Assistant long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from .const import DOMAIN
+from .rate_limiter import RequestPriority, request_priority
+
+# How far back the first run of a device imports
+ENERGY_BACKFILL_MAX_DAYS = 90
+# Days the cloud gets to report a closed day before it counts as never reported
+ENERGY_BACKFILL_GRACE_DAYS = 3
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EnergyStatisticDescription:
+    """Describes one external energy statistic of a device."""
+    key: str
+    name: str
+
+
+def parse_history_day(data_time: str | None) -> date | None:
+    """Return the day of a ``YYYYMMDD`` history entry, or None if it is not one."""
+    if not data_time or len(data_time) != 8:
+        return None
+    try:
+        return datetime.strptime(data_time, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+class EnergyBackfill:
+    """Import the closed days of a device's energy history as external statistics.
+
+    ``fetch_month`` returns the daily values of one month, keyed by day and
+    then by statistic key. The last imported day and the running sum of each
+    statistic are persisted per device as a high-water mark, so each run only
+    fetches the months from that day up to yesterday, and a restart or an
+    outage never leaves a gap or imports a day twice. A recent day without a
+    value holds the mark until the cloud reports it; one older than
+    ``ENERGY_BACKFILL_GRACE_DAYS`` never will be, the device was offline or
+    its history had not started, so the mark moves past it. Today is left to
+    the live energy sensors until it is over.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_id: str,
+        device_name: str,
+        descriptions: Iterable[EnergyStatisticDescription],
+        fetch_month: Callable[[date], Awaitable[dict[date, dict[str, float | None]]]],
+    ) -> None:
+        """Initialize the backfill."""
+        self._hass = hass
+        self._device_id = device_id
+        self._device_name = device_name
+        self._descriptions = tuple(descriptions)
+        self._fetch_month = fetch_month
+        self._store = Store(hass, version=1, key=f"panasonic_cc_{device_id}_energy_backfill")
+        self._task: asyncio.Task | None = None
+        self._last_run: date | None = None
+
+    @callback
+    def async_schedule(self) -> None:
+        """Start a run in the background unless one already ran today."""
+        if "recorder" not in self._hass.config.components:
+            return
+        today = dt_util.now().date()
+        if self._task is not None or self._last_run == today:
+            return
+        # A failed run is retried the next day rather than on every poll
+        self._last_run = today
+        self._task = self._hass.async_create_background_task(
+            self._async_run(), f"{self._device_name} energy backfill"
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a run in progress."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(self) -> None:
+        """Run the backfill, logging instead of raising on failure."""
+        try:
+            # Backfill requests yield to commands and regular polls
+            with request_priority(RequestPriority.POLL):
+                await self._async_backfill()
+        except Exception as err:
+            _LOGGER.warning(
+                "%s Energy history backfill failed: %s", self._device_name, err
+            )
+        finally:
+            self._task = None
+
+    async def _async_backfill(self) -> None:
+        """Fetch and import every closed day after the high-water mark."""
+        today = dt_util.now().date()
+        settled = today - timedelta(days=ENERGY_BACKFILL_GRACE_DAYS)
+        data = await self._store.async_load() or {}
+        if "last_day" in data:
+            last_day = date.fromisoformat(data["last_day"])
+        else:
+            last_day = today - timedelta(days=ENERGY_BACKFILL_MAX_DAYS + 1)
+        sums: dict[str, float] = dict(data.get("sums", {}))
+        first_day = last_day + timedelta(days=1)
+        if first_day >= today:
+            return
+
+        statistics: dict[str, list[StatisticData]] = {
+            description.key: [] for description in self._descriptions
+        }
+        day = first_day
+        days: dict[date, dict[str, float | None]] = {}
+        while day < today:
+            if day.day == 1 or day == first_day:
+                days = await self._fetch_month(day.replace(day=1))
+            values = {
+                description.key: value
+                for description in self._descriptions
+                if (value := days.get(day, {}).get(description.key)) is not None
+                and value >= 0
+            }
+            if not values:
+                if day < settled:
+                    # Never reported, so later runs need not fetch it again
+                    last_day = day
+                    day += timedelta(days=1)
+                    continue
+                # Before the first value the device had no history yet
+                if not sums:
+                    day += timedelta(days=1)
+                    continue
+                # The cloud has not reported this day yet; later days are
+                # imported once it has, so the running sums never skip one
+                break
+            start = dt_util.start_of_local_day(day)
+            for key, value in values.items():
+                sums[key] = sums.get(key, 0.0) + value
+                statistics[key].append(StatisticData(start=start, state=value, sum=sums[key]))
+            last_day = day
+            day += timedelta(days=1)
+
+        imported = 0
+        for description in self._descriptions:
+            if not statistics[description.key]:
+                continue
+            async_add_external_statistics(
+                self._hass, self._metadata(description), statistics[description.key]
+            )
+            imported += len(statistics[description.key])
+        await self._store.async_save({"last_day": last_day.isoformat(), "sums": sums})
+        _LOGGER.debug(
+            "%s Imported %d energy statistic row(s) up to %s",
+            self._device_name,
+            imported,
+            last_day,
+        )
+
+    def _metadata(self, description: EnergyStatisticDescription) -> StatisticMetaData:
+        """Return the metadata of one external statistic."""
+        return StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=f"{self._device_name} {description.name}",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{slugify(self._device_id)}_{description.key}",
+            unit_class=EnergyConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import dataclasses
+import email.utils
 import logging
 import re
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any
 
 from aiohttp import ClientResponseError
@@ -59,6 +62,34 @@ class FriendlyError:
         )
 
 
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """How coordinators back off after a failure of one error category."""
+    # Leave the failure to the account poller instead of backing off one device
+    account_wide: bool
+    multiplier: float = 2
+    max_interval: float = 600  # seconds
+
+
+# Errors of the whole service go to the account poller, whose circuit breaker
+# pauses every device at once; errors of one device only slow that device
+BACKOFF_POLICIES = {
+    # An unplugged or offline unit can stay away for hours
+    ErrorCategory.ADAPTER_COMMUNICATION: BackoffPolicy(account_wide=False, max_interval=1800),
+    ErrorCategory.AUTHENTICATION: BackoffPolicy(account_wide=False),
+    ErrorCategory.NETWORK: BackoffPolicy(account_wide=True),
+    ErrorCategory.RATE_LIMIT: BackoffPolicy(account_wide=True),
+    ErrorCategory.SERVER_ERROR: BackoffPolicy(account_wide=True),
+    ErrorCategory.CLIENT_ERROR: BackoffPolicy(account_wide=False),
+    ErrorCategory.UNKNOWN: BackoffPolicy(account_wide=False),
+}
+
+
+def backoff_policy(error: FriendlyError | None) -> BackoffPolicy:
+    """Return the backoff policy for a classified error, or the default one."""
+    return BACKOFF_POLICIES[error.category if error is not None else ErrorCategory.UNKNOWN]
+
+
 # Mapping of known API error codes to friendly errors
 KNOWN_ERROR_CODES = {
     5005: FriendlyError(
@@ -182,6 +213,84 @@ ERROR_PATTERNS = [
 ]
 
 
+# An HTTP status code standing on its own
+_HTTP_CODE = re.compile(r"\b(4\d{2}|5\d{2})\b")
+
+
+def _first_characters(pattern: str) -> set[str] | None:
+    """Return the lowercase characters the top-level alternatives of ``pattern`` start with.
+
+    Returns None if any alternative does not start with a required letter or
+    digit, so no set of first characters can be relied on.
+    """
+    characters: set[str] = set()
+    depth = 0
+    index = 0
+    at_start = True
+    while index < len(pattern):
+        char = pattern[index]
+        if at_start:
+            following = pattern[index + 1 : index + 2]
+            if not char.isalnum() or following in ("?", "*", "{"):
+                return None
+            characters.add(char.lower())
+            at_start = False
+        elif char == "\\":
+            index += 1
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            at_start = True
+        index += 1
+    return characters
+
+
+def _match_start(patterns: list[str]) -> str:
+    """Return a lookahead for the first characters of ``patterns``, or "" if one cannot be told.
+
+    The status and error code extractors start with a digit, a quote or the
+    "r" of "received".
+    """
+    characters = {"r", '"'}
+    for pattern in patterns:
+        if (first := _first_characters(pattern)) is None:
+            return ""
+        characters |= first
+    return rf"(?=[\d{''.join(sorted(characters))}])"
+
+
+# Every pattern above plus the status and error code extractors, as one
+# alternation; a single scan finds the first match of each named group. The
+# extractors stay case sensitive like the separate searches they replaced.
+# The lookahead lets the scan skip a position on one character test unless
+# it can start a match.
+_ERROR_MATCHER = re.compile(
+    _match_start([pattern.pattern for pattern, _ in ERROR_PATTERNS])
+    + "(?:"
+    + "|".join(
+        [
+            # Pattern: "Expected status code '200' but received '500'"
+            r"(?-i:received\s+['\"]?(?P<status>\d{3})['\"]?)",
+            # Pattern: {"code":5005,"message":"Adapter Communication error"}
+            r'(?-i:"code"\s*:\s*(?P<code>\d+))',
+            # HTTP status codes anywhere in the message (401, 403, 404, 429, 500, etc.)
+            rf"(?P<http>{_HTTP_CODE.pattern})",
+            *(
+                f"(?P<pattern{index}>{pattern.pattern})"
+                for index, (pattern, _) in enumerate(ERROR_PATTERNS)
+            ),
+        ]
+    )
+    + ")",
+    re.IGNORECASE,
+)
+
+# Distinct error strings remembered by the classifier; an outage repeats a few
+CLASSIFY_CACHE_SIZE = 256
+
+
 def classify_error(err: Exception) -> FriendlyError:
     """Classify an exception into a user-friendly error.
 
@@ -190,39 +299,39 @@ def classify_error(err: Exception) -> FriendlyError:
     it falls back to pattern matching on the error string, and finally
     returns a generic unknown error.
     """
-    error_str = str(err)
-
-    # Check for HTTP status code in the error string
-    # Pattern: "Expected status code '200' but received '500'"
-    status_match = re.search(r"received\s+['\"]?(\d{3})['\"]?", error_str)
-    if status_match:
-        status_code = int(status_match.group(1))
-        if status_code in KNOWN_ERROR_CODES:
-            return dataclasses.replace(KNOWN_ERROR_CODES[status_code], original_error=error_str)
-
-    # Check for JSON error code in response body
-    # Pattern: {"code":5005,"message":"Adapter Communication error"}
-    code_match = re.search(r'"code"\s*:\s*(\d+)', error_str)
-    if code_match:
-        error_code = int(code_match.group(1))
-        if error_code in KNOWN_ERROR_CODES:
-            return dataclasses.replace(KNOWN_ERROR_CODES[error_code], original_error=error_str)
-
-    # Check for HTTP status code patterns (401, 403, 404, 429, 500, etc.)
-    http_code_match = re.search(r"\b(4\d{2}|5\d{2})\b", error_str)
-    if http_code_match:
-        http_code = int(http_code_match.group(1))
-        if http_code in KNOWN_ERROR_CODES:
-            return dataclasses.replace(KNOWN_ERROR_CODES[http_code], original_error=error_str)
-
-    # Try pattern matching on error message
-    for pattern, friendly in ERROR_PATTERNS:
-        if pattern.search(error_str):
+    status = err.status if isinstance(err, ClientResponseError) else None
+    return _classify_error_string(str(err), status)
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def _classify_error_string(error_str: str, status: int | None) -> FriendlyError:
+    """Classify an error string in one scan; ``status`` is a ClientResponseError status.
+
+    Results are cached and shared, which is safe because FriendlyError is
+    frozen.
+    """
+    first: dict[str, str] = {}
+    for match in _ERROR_MATCHER.finditer(error_str):
+        group = match.lastgroup
+        if group is None:
+            continue
+        # The scan does not overlap matches, so an HTTP code that is part of
+        # any status or error code match, not just the first, is picked up here
+        if group in ("status", "code") and "http" not in first:
+            if http_match := _HTTP_CODE.match(error_str, match.start(group)):
+                first["http"] = http_match.group(1)
+        first.setdefault(group, match.group(group))
+
+    # A status or error code wins over message patterns, in this order
+    for group in ("status", "code", "http"):
+        if group in first and (known := KNOWN_ERROR_CODES.get(int(first[group]))):
+            return dataclasses.replace(known, original_error=error_str)
+
+    for index, (_, friendly) in enumerate(ERROR_PATTERNS):
+        if f"pattern{index}" in first:
             return dataclasses.replace(friendly, original_error=error_str)
 
-    # Check for ClientResponseError
-    if isinstance(err, ClientResponseError):
-        status = err.status
+    if status is not None:
         if status in KNOWN_ERROR_CODES:
             return dataclasses.replace(KNOWN_ERROR_CODES[status], original_error=error_str)
         if 400 <= status < 500:
@@ -252,6 +361,20 @@ def classify_error(err: Exception) -> FriendlyError:
     )
 
 
+def parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After value given either in seconds or as an HTTP date."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
 def friendly_error_for_command_failure(
     action: str,
     device_name: str,
@@ -0,0 +1,124 @@
+"""Per-field freshness of coordinator device state.
+
+A successful refresh does not mean the values are current: the cloud may
+answer with a status it cached hours ago. Coordinators record when each field
+of their state snapshot was really observed (the server timestamp of a cached
+status, the time of the response for a live one) and entities ask whether the
+fields they show are older than the configured maximum staleness.
+
+A field the cloud reports as None was not observed, so it keeps the time of
+its last real reading.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .change_tracking import path_prefixes
+
+
+class FieldFreshness:
+    """Track when each field path of a device was last observed."""
+
+    def __init__(self, max_staleness: float) -> None:
+        """Initialize the tracker; ``max_staleness=0`` never marks anything stale."""
+        self._max_staleness = max_staleness
+        self._observed: dict[str, datetime] = {}
+        self._prefixes: dict[str, list[str]] = {}
+
+    @property
+    def max_staleness(self) -> float:
+        """Return the age in seconds after which a field is stale."""
+        return self._max_staleness
+
+    @property
+    def observed_at(self) -> datetime | None:
+        """Return the newest observation of any field."""
+        return max(self._observed.values(), default=None)
+
+    def set_max_staleness(self, max_staleness: float) -> None:
+        """Change the age after which a field is stale."""
+        self._max_staleness = max_staleness
+
+    def record(
+        self, state: dict[str, Any], observed_at: datetime, now: datetime | None = None
+    ) -> frozenset[str]:
+        """Record a state snapshot observed at ``observed_at``.
+
+        Observations never move a field back in time. Returns the paths that
+        were stale before and are current now, so their listeners can be told.
+        """
+        now = now or dt_util.utcnow()
+        revived = []
+        for path, value in state.items():
+            if value is None:
+                continue
+            previous = self._observed.get(path)
+            if previous is not None and previous >= observed_at:
+                continue
+            if (
+                previous is not None
+                and self._expired(previous, now)
+                and not self._expired(observed_at, now)
+            ):
+                revived.append(path)
+            self._observed[path] = observed_at
+        return frozenset(revived)
+
+    def field_observed_at(self, paths: Iterable[str] | None = None) -> datetime | None:
+        """Return the newest observation of the given paths or anything nested under them."""
+        if paths is None:
+            return self.observed_at
+        wanted = set(paths)
+        return max(
+            (
+                observed_at
+                for path, observed_at in self._observed.items()
+                if not wanted.isdisjoint(self._path_prefixes(path))
+            ),
+            default=None,
+        )
+
+    def age(self, paths: Iterable[str] | None = None, now: datetime | None = None) -> float | None:
+        """Return the age in seconds of the given paths, or None if never observed."""
+        observed_at = self.field_observed_at(paths)
+        if observed_at is None:
+            return None
+        return max(((now or dt_util.utcnow()) - observed_at).total_seconds(), 0.0)
+
+    def is_stale(self, paths: Iterable[str] | None = None, now: datetime | None = None) -> bool:
+        """Return True when the given paths were last observed too long ago."""
+        observed_at = self.field_observed_at(paths)
+        return observed_at is not None and self._expired(observed_at, now or dt_util.utcnow())
+
+    def stale_paths(self, now: datetime | None = None) -> frozenset[str]:
+        """Return every path that is stale now."""
+        now = now or dt_util.utcnow()
+        return frozenset(
+            path for path, observed_at in self._observed.items() if self._expired(observed_at, now)
+        )
+
+    def next_expiry(self, now: datetime | None = None) -> float | None:
+        """Return the seconds until the next path goes stale, or None if none will."""
+        if not self._max_staleness:
+            return None
+        now = now or dt_util.utcnow()
+        delays = [
+            self._max_staleness - (now - observed_at).total_seconds()
+            for observed_at in self._observed.values()
+            if not self._expired(observed_at, now)
+        ]
+        return min(delays, default=None)
+
+    def _expired(self, observed_at: datetime, now: datetime) -> bool:
+        """Return True when an observation is older than the maximum staleness."""
+        return bool(self._max_staleness) and (now - observed_at).total_seconds() > self._max_staleness
+
+    def _path_prefixes(self, path: str) -> list[str]:
+        """Return the prefixes of a path, computed once per path."""
+        if (prefixes := self._prefixes.get(path)) is None:
+            prefixes = self._prefixes[path] = path_prefixes(path)
+        return prefixes
@@ -1,16 +1,17 @@
 """HWS (standalone Heat Pump Hot Water tank) device setup and coordination."""
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from aio_panasonic_comfort_cloud import ApiClient, PanasonicDeviceInfo
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..const import DOMAIN, MANUFACTURER
-from .const import HWS_COORDINATORS
+from ..discovery import DeviceDiscovery
+from ..runtime_data import PanasonicConfigEntry
+from .const import SIGNAL_HWS_DEVICE_DISCOVERED
 from .coordinator import HwsDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,13 +26,12 @@ PLATFORMS = [
 
 async def async_setup_hws(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
     panasonic_api: ApiClient,
 ) -> list[HwsDeviceCoordinator]:
     """Set up HWS devices: build coordinators from the shared ApiClient session and register devices."""
     hws_devices = panasonic_api.hws_devices
     if not hws_devices:
-        hass.data[DOMAIN][HWS_COORDINATORS] = []
         return []
 
     config = {**entry.data, **entry.options}
@@ -51,29 +51,35 @@ async def async_setup_hws(
                 exc_info=True,
             )
 
-    # Refresh all HWS coordinators in parallel
-    async def _init_hws(coordinator: HwsDeviceCoordinator, device_info: PanasonicDeviceInfo) -> None:
-        try:
-            await coordinator.async_config_entry_first_refresh()
-            hws_coordinators.append(coordinator)
-        except Exception as exc:
-            _LOGGER.warning(
-                "Failed to setup HWS device %s: %s",
-                device_info.name,
-                exc,
-                exc_info=True,
-            )
+    @callback
+    def _async_device_discovered(coordinator: HwsDeviceCoordinator) -> None:
+        """Attach a device that only responded after setup."""
+        hws_coordinators.append(coordinator)
+        entry.runtime_data.poller.async_add_coordinators([coordinator])
+        async_dispatcher_send(
+            hass, SIGNAL_HWS_DEVICE_DISCOVERED.format(entry.entry_id), coordinator
+        )
 
-    await asyncio.gather(
-        *(_init_hws(coordinator, device_info) for coordinator, device_info in hws_coordinators_uninitialized),
-        return_exceptions=True,
+    # Fetch every tank in parallel; slow or offline units keep retrying in the
+    # background instead of holding up setup
+    discovery = DeviceDiscovery(
+        hass,
+        f"HWS ({entry.title})",
+        _async_device_discovered,
+        entry.runtime_data.rate_limiter,
+    )
+    hws_coordinators.extend(
+        await discovery.async_discover(
+            coordinator for coordinator, _ in hws_coordinators_uninitialized
+        )
     )
 
-    hass.data[DOMAIN][HWS_COORDINATORS] = hws_coordinators
+    entry.runtime_data.hws_coordinators = hws_coordinators
+    entry.runtime_data.hws_discovery = discovery
 
-    # Register devices in device registry
+    # Register every device, including those that are still being discovered
     device_registry = dr.async_get(hass)
-    for coordinator in hws_coordinators:
+    for coordinator, _ in hws_coordinators_uninitialized:
         device_registry.async_get_or_create(
             config_entry_id=entry.entry_id,
             identifiers={(DOMAIN, coordinator.device_id)},
@@ -88,7 +94,7 @@ async def async_setup_hws(
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
     panasonic_api: ApiClient,
 ) -> bool:
     """Set up HWS from a config entry."""
@@ -104,7 +110,7 @@ async def async_setup_entry(
 
 async def async_unload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
 ) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -2,20 +2,67 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Any
 
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..runtime_data import PanasonicConfigEntry
+from .const import SIGNAL_HWS_DEVICE_DISCOVERED
 from .coordinator import HwsDeviceCoordinator
 
 
+@callback
+def async_add_device_entities(
+    hass: HomeAssistant,
+    entry: PanasonicConfigEntry,
+    async_add_entities: Any,
+    create_entities: Callable[[HwsDeviceCoordinator], Iterable[Entity]],
+) -> None:
+    """Add the entities of every device, including devices discovered later.
+
+    ``create_entities`` builds the entities of one device. It runs now for
+    every device that is set up and again for each device that only comes
+    online after setup.
+    """
+    async_add_entities([
+        entity
+        for coordinator in entry.runtime_data.hws_coordinators
+        for entity in create_entities(coordinator)
+    ])
+
+    @callback
+    def _async_device_discovered(coordinator: HwsDeviceCoordinator) -> None:
+        """Add the entities of a device that came online after setup."""
+        async_add_entities(list(create_entities(coordinator)))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_HWS_DEVICE_DISCOVERED.format(entry.entry_id), _async_device_discovered
+        )
+    )
+
+
 class HwsDataEntity(CoordinatorEntity[HwsDeviceCoordinator]):
     """Base class for HWS data entities."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: HwsDeviceCoordinator, key: str) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: HwsDeviceCoordinator,
+        key: str,
+        depends_on: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize the entity.
+
+        ``depends_on`` lists the device field paths the entity reads; when set,
+        the coordinator only calls the entity back when one of them changed.
+        """
+        super().__init__(coordinator, tuple(depends_on) if depends_on is not None else None)
         self._attr_translation_key = key
         self._attr_unique_id = f"{coordinator.device_id}-{key}"
         self._attr_device_info = self.coordinator.device_info
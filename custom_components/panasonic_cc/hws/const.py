@@ -1,6 +1,7 @@
 """Constants for HWS (standalone Heat Pump Hot Water tank) devices."""
 
-HWS_COORDINATORS = "hws_coordinators"
+# Sent with the coordinator of a device that came online after setup
+SIGNAL_HWS_DEVICE_DISCOVERED = "panasonic_cc_hws_device_discovered_{}"
 
 HWS_SWITCH_DELAY = 10.0
 HWS_WATER_HEATER_DELAY = 10.0
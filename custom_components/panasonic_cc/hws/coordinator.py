@@ -1,28 +1,45 @@
 """Coordinators for HWS (standalone Heat Pump Hot Water tank) devices."""
 import asyncio
 import logging
+from collections.abc import Iterable
 from datetime import timedelta
+from typing import Any
 
 from aiohttp import ClientResponseError
 from homeassistant.components.persistent_notification import async_create
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.entity import DeviceInfo
 
 from aio_panasonic_comfort_cloud import ApiClient, HwsDevice, PanasonicDeviceInfo
+from aio_panasonic_comfort_cloud.constants import AquareaOperationStatus
 
 from ..const import (
     DEFAULT_DEVICE_FETCH_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     CONF_DEVICE_FETCH_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
     DOMAIN,
     MANUFACTURER,
     NOTIFICATION_AUTH_EXPIRED,
 )
-from ..error_handler import classify_error, FriendlyError, ErrorCategory
+from ..change_tracking import FieldListenerRegistry, diff_state
+from ..error_handler import backoff_policy, classify_error, FriendlyError, ErrorCategory
+from ..rate_limiter import RequestPriority, current_priority, request_priority
+from ..request_stats import request_device
+from ..scheduler import AccountPoller, AdaptivePollInterval
 
 MAX_CONSECUTIVE_FAILURES = 5
-BACKOFF_MULTIPLIER = 2
-MAX_UPDATE_INTERVAL = 600  # seconds
+
+# HwsDeviceParameters attributes that make up the device state snapshot
+DEVICE_STATE_FIELDS = (
+    "hpu_operation_status",
+    "operation_mode",
+    "boost_mode",
+    "tank_temperature",
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,8 +80,19 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
             hass,
             _LOGGER,
             name=f"HWS Device Coordinator ({device_info.name})",
-            update_interval=timedelta(seconds=self._base_interval),
+            # Polling is driven by the account-level AccountPoller
+            update_interval=None,
+            # Only notify listeners when _update_id moves, i.e. the state changed
+            always_update=False,
         )
+        self.poll_interval = timedelta(seconds=self._base_interval)
+        self._poll_schedule = AdaptivePollInterval(
+            self._base_interval,
+            config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+        # Set by the AccountPoller that drives this coordinator
+        self.poller: AccountPoller | None = None
         self._api_client = api_client
         self._device_info = device_info
         self._device: HwsDevice | None = None
@@ -72,7 +100,9 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
         self._refresh_task: asyncio.Task | None = None
         self._consecutive_failures = 0
         self._auth_failed = False
-        self._last_device_state_hash: int | None = None
+        self._last_device_state: dict[str, Any] = {}
+        self._changed_fields: frozenset[str] | None = None
+        self._field_listeners = FieldListenerRegistry()
         self._last_error: FriendlyError | None = None
 
     @property
@@ -80,6 +110,11 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
         """Return the last error that occurred."""
         return self._last_error
 
+    @property
+    def changed_fields(self) -> frozenset[str] | None:
+        """Return the field paths changed by the last refresh (None means all)."""
+        return self._changed_fields
+
     @property
     def connection_status(self) -> str:
         """Return the current connection status."""
@@ -91,6 +126,13 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
             return "degraded"
         return "connected"
 
+    @property
+    def is_active(self) -> bool:
+        """Return True while the heat pump unit is running."""
+        if self._device is None:
+            return False
+        return self._device.parameters.hpu_operation_status == AquareaOperationStatus.On
+
     @property
     def device(self) -> HwsDevice:
         """Return the current device state."""
@@ -124,20 +166,44 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
             sw_version=self._api_client.app_version,
         )
 
-    def _device_state_hash(self) -> int:
-        """Compute a hash of the device state for change detection."""
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, optionally only for the field paths in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        paths = context if isinstance(context, Iterable) and not isinstance(context, str) else None
+        remove_field_listener = self._field_listeners.async_add(update_callback, paths)
+
+        @callback
+        def remove_listeners() -> None:
+            """Remove the listener from both registries."""
+            remove_field_listener()
+            remove_listener()
+
+        return remove_listeners
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call only the listeners subscribed to the fields that changed."""
+        for update_callback in self._field_listeners.listeners_for(self._changed_fields):
+            update_callback()
+
+    def _device_state_snapshot(self) -> dict[str, Any]:
+        """Flatten the device state into a snapshot keyed by field path."""
         if self._device is None:
-            return 0
+            return {}
         params = self._device.parameters
-        return hash((
-            params.hpu_operation_status,
-            params.operation_mode,
-            params.boost_mode,
-            params.tank_temperature,
-        ))
+        return {f"parameters.{name}": getattr(params, name) for name in DEVICE_STATE_FIELDS}
 
     async def _async_update_data(self) -> int:
         """Fetch data from API."""
+        # Treat everything as changed unless a successful diff narrows it down
+        self._changed_fields = None
+        # Refreshes at REFRESH priority follow a command sent by an entity
+        if current_priority() == RequestPriority.REFRESH:
+            self._poll_schedule.record_command()
+            self._async_update_poll_interval()
         if self._auth_failed:
             raise UpdateFailed("Authentication failed — coordinator disabled")
 
@@ -145,16 +211,22 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
             if self._device is None:
                 self._device = self._api_client.get_hws_device(self._device_info)
                 self._update_id = 1
-                self._last_device_state_hash = self._device_state_hash()
+                self._last_device_state = self._device_state_snapshot()
                 self._reset_backoff()
                 return self._update_id
             if await self._api_client.try_update_hws_device(self._device):
-                current_hash = self._device_state_hash()
-                if current_hash != self._last_device_state_hash:
-                    self._last_device_state_hash = current_hash
+                current_state = self._device_state_snapshot()
+                changed_fields = diff_state(self._last_device_state, current_state)
+                if changed_fields:
+                    self._last_device_state = current_state
+                    # After a failed refresh every entity must re-evaluate availability
+                    if self.last_update_success:
+                        self._changed_fields = changed_fields
                     self._update_id += 1
+                    self._poll_schedule.record_refresh(True)
                     self._reset_backoff()
                     return self._update_id
+            self._poll_schedule.record_refresh(False)
             self._reset_backoff()
         except Exception as err:
             if _is_auth_error(err):
@@ -172,7 +244,7 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
         return self._update_id
 
     def _reset_backoff(self) -> None:
-        """Reset circuit breaker and restore base polling interval."""
+        """Reset circuit breaker and return to the adaptive polling interval."""
         if self._consecutive_failures > 0:
             _LOGGER.debug(
                 "%s API recovered after %d consecutive failure(s)",
@@ -181,18 +253,59 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
             )
         self._consecutive_failures = 0
         self._last_error = None
-        self.update_interval = timedelta(seconds=self._base_interval)
+        self._async_update_poll_interval()
+
+    @property
+    def min_poll_interval(self) -> float:
+        """Return the shortest interval this device is polled at."""
+        return self._poll_schedule.minimum
+
+    @callback
+    def _async_update_poll_interval(self) -> None:
+        """Recompute the adaptive interval and let the poller pull the next poll in."""
+        self.poll_interval = self._poll_schedule.interval(self.is_active)
+        if self.poller is not None:
+            self.poller.async_reschedule(self)
+
+    @callback
+    def async_set_poll_options(self, config: dict) -> None:
+        """Apply changed fetch interval options without recreating the coordinator."""
+        self._base_interval = config.get(
+            CONF_DEVICE_FETCH_INTERVAL, DEFAULT_DEVICE_FETCH_INTERVAL
+        )
+        self._poll_schedule.set_bounds(
+            self._base_interval,
+            config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+        # A device that is backing off picks the new interval up once it recovers
+        if self._consecutive_failures == 0:
+            self._async_update_poll_interval()
 
     def _handle_failure(self, err: Exception | None = None) -> None:
-        """Handle API failure with exponential backoff."""
+        """Handle API failure with the backoff policy of its error category."""
         self._consecutive_failures += 1
+        friendly = classify_error(err) if err is not None else None
+        if friendly is not None:
+            self._last_error = friendly
+        policy = backoff_policy(friendly)
+        if friendly is not None and policy.account_wide:
+            # The account poller backs off every device at once for these
+            _LOGGER.warning(
+                "%s API failure %d/%d — %s: %s — left to the account poller",
+                self._device_info.name,
+                self._consecutive_failures,
+                MAX_CONSECUTIVE_FAILURES,
+                friendly.title,
+                friendly.message,
+            )
+            return
         new_interval = min(
-            self._base_interval * (BACKOFF_MULTIPLIER ** self._consecutive_failures),
-            MAX_UPDATE_INTERVAL,
+            self._base_interval * (policy.multiplier ** self._consecutive_failures),
+            policy.max_interval,
         )
-        self.update_interval = timedelta(seconds=new_interval)
+        self.poll_interval = timedelta(seconds=new_interval)
         if err is not None:
-            self._last_error = classify_error(err)
             _LOGGER.warning(
                 "%s API failure %d/%d — %s: %s — polling interval increased to %ds",
                 self._device_info.name,
@@ -220,10 +333,18 @@ class HwsDeviceCoordinator(DataUpdateCoordinator[int]):
         async def _delayed_refresh() -> None:
             try:
                 await asyncio.sleep(2)
-                await self.async_request_refresh()
+                with request_priority(RequestPriority.REFRESH), request_device(self.device_id):
+                    await self.async_request_refresh()
             except asyncio.CancelledError:
                 pass
             finally:
                 self._refresh_task = None
 
         self._refresh_task = self.hass.async_create_task(_delayed_refresh())
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending refresh on unload."""
+        await super().async_shutdown()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
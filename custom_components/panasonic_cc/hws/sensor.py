@@ -15,12 +15,10 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
 
-from ..const import DOMAIN
-from .base import HwsDataEntity
+from ..runtime_data import PanasonicConfigEntry
+from .base import HwsDataEntity, async_add_device_entities
 from .coordinator import HwsDeviceCoordinator
-from .const import HWS_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +27,7 @@ _LOGGER = logging.getLogger(__name__)
 class HwsSensorEntityDescription(SensorEntityDescription):
     """Describes HWS sensor entity."""
     get_state: Callable[[HwsDevice], Any]
+    depends_on: tuple[str, ...] | None = None
 
 
 HWS_TANK_TEMPERATURE_DESCRIPTION = HwsSensorEntityDescription(
@@ -40,6 +39,7 @@ HWS_TANK_TEMPERATURE_DESCRIPTION = HwsSensorEntityDescription(
     state_class=SensorStateClass.MEASUREMENT,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     get_state=lambda device: device.parameters.tank_temperature,
+    depends_on=("parameters.tank_temperature",),
 )
 
 HWS_HPU_STATUS_DESCRIPTION = HwsSensorEntityDescription(
@@ -51,6 +51,7 @@ HWS_HPU_STATUS_DESCRIPTION = HwsSensorEntityDescription(
     options=[status.name for status in AquareaOperationStatus],
     entity_category=EntityCategory.DIAGNOSTIC,
     get_state=lambda device: device.parameters.hpu_operation_status.name,
+    depends_on=("parameters.hpu_operation_status",),
 )
 
 # The meaning of operation_mode hasn't been confirmed against a real device
@@ -65,24 +66,33 @@ HWS_OPERATION_MODE_DESCRIPTION = HwsSensorEntityDescription(
     entity_category=EntityCategory.DIAGNOSTIC,
     entity_registry_enabled_default=False,
     get_state=lambda device: device.parameters.operation_mode,
+    depends_on=("parameters.operation_mode",),
 )
 
 # Connection status sensor options
 HWS_CONNECTION_STATUS_OPTIONS = ["connected", "degraded", "disconnected", "authentication_error"]
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+async def async_setup_entry(hass: HomeAssistant, entry: PanasonicConfigEntry, async_add_entities):
     """Set up the HWS sensors."""
-    entities = []
-    hws_coordinators: list[HwsDeviceCoordinator] = hass.data[DOMAIN][HWS_COORDINATORS]
+    discovery = entry.runtime_data.hws_discovery
 
-    for coordinator in hws_coordinators:
-        entities.append(HwsSensorEntity(coordinator, HWS_TANK_TEMPERATURE_DESCRIPTION))
-        entities.append(HwsSensorEntity(coordinator, HWS_HPU_STATUS_DESCRIPTION))
-        entities.append(HwsSensorEntity(coordinator, HWS_OPERATION_MODE_DESCRIPTION))
-        entities.append(HwsConnectionStatusSensor(coordinator))
+    def _create_entities(coordinator: HwsDeviceCoordinator) -> list[SensorEntity]:
+        return [
+            HwsSensorEntity(coordinator, HWS_TANK_TEMPERATURE_DESCRIPTION),
+            HwsSensorEntity(coordinator, HWS_HPU_STATUS_DESCRIPTION),
+            HwsSensorEntity(coordinator, HWS_OPERATION_MODE_DESCRIPTION),
+        ]
 
-    async_add_entities(entities)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
+
+    # Connection status sensors; devices that are still being discovered get
+    # theirs (unavailable) right away since it does not need device data
+    pending_coordinators = discovery.pending if discovery is not None else []
+    async_add_entities([
+        HwsConnectionStatusSensor(coordinator)
+        for coordinator in [*entry.runtime_data.hws_coordinators, *pending_coordinators]
+    ])
 
 
 class HwsSensorEntity(HwsDataEntity, SensorEntity):
@@ -93,7 +103,7 @@ class HwsSensorEntity(HwsDataEntity, SensorEntity):
     def __init__(self, coordinator: HwsDeviceCoordinator, description: HwsSensorEntityDescription):
         """Initialize the sensor."""
         self.entity_description = description  # type: ignore[reportIncompatibleVariableOverride]
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the sensor."""
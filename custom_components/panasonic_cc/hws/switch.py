@@ -6,7 +6,6 @@ import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.switch import (
     SwitchDeviceClass,
     SwitchEntity,
@@ -14,10 +13,11 @@ from homeassistant.components.switch import (
 
 from aio_panasonic_comfort_cloud.constants import AquareaOperationStatus
 
-from ..const import DOMAIN
-from .base import HwsDataEntity
+from .base import HwsDataEntity, async_add_device_entities
 from .coordinator import HwsDeviceCoordinator
-from .const import HWS_COORDINATORS, HWS_SWITCH_DELAY
+from .const import HWS_SWITCH_DELAY
+from ..rate_limiter import RequestPriority, request_priority
+from ..runtime_data import PanasonicConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class HwsBoostModeSwitch(HwsDataEntity, SwitchEntity):
 
     def __init__(self, coordinator: HwsDeviceCoordinator) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, "boost_mode")
+        super().__init__(coordinator, "boost_mode", ("parameters.boost_mode",))
         self._attr_translation_key = "boost_mode"
 
     @property
@@ -69,7 +69,8 @@ class HwsBoostModeSwitch(HwsDataEntity, SwitchEntity):
         await asyncio.sleep(delay)
         self._optimistic_is_on = None
         try:
-            await self.coordinator.async_request_refresh()
+            with request_priority(RequestPriority.REFRESH):
+                await self.coordinator.async_request_refresh()
         except Exception:
             _LOGGER.exception(
                 "Delayed refresh failed for device %s",
@@ -82,14 +83,12 @@ class HwsBoostModeSwitch(HwsDataEntity, SwitchEntity):
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
     async_add_entities: Any,
 ) -> None:
     """Set up the HWS switches."""
-    entities = []
-    hws_coordinators: list[HwsDeviceCoordinator] = hass.data[DOMAIN][HWS_COORDINATORS]
 
-    for coordinator in hws_coordinators:
-        entities.append(HwsBoostModeSwitch(coordinator))
+    def _create_entities(coordinator: HwsDeviceCoordinator) -> list[HwsBoostModeSwitch]:
+        return [HwsBoostModeSwitch(coordinator)]
 
-    async_add_entities(entities)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
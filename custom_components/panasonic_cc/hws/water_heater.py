@@ -12,14 +12,12 @@ from homeassistant.components.water_heater import (
 )
 from homeassistant.const import UnitOfTemperature, PRECISION_WHOLE, ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
 
 from aio_panasonic_comfort_cloud.constants import AquareaOperationStatus
 
-from ..const import DOMAIN
-from .base import HwsDataEntity
+from ..runtime_data import PanasonicConfigEntry
+from .base import HwsDataEntity, async_add_device_entities
 from .coordinator import HwsDeviceCoordinator
-from .const import HWS_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,21 +32,24 @@ DEFAULT_MAX_TEMP = 65
 class HwsWaterHeaterEntityDescription(WaterHeaterEntityDescription):
     """Describes an HWS Water Heater entity."""
 
+    depends_on: tuple[str, ...] | None = None
+
 
 HWS_WATER_TANK_DESCRIPTION = HwsWaterHeaterEntityDescription(
     key="tank",
     translation_key="tank",
     name="Tank",
+    depends_on=("parameters.tank_temperature", "parameters.hpu_operation_status"),
 )
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+async def async_setup_entry(hass: HomeAssistant, entry: PanasonicConfigEntry, async_add_entities):
     """Set up the HWS water heater."""
-    entities = []
-    hws_coordinators: list[HwsDeviceCoordinator] = hass.data[DOMAIN][HWS_COORDINATORS]
-    for coordinator in hws_coordinators:
-        entities.append(HwsWaterHeater(coordinator, HWS_WATER_TANK_DESCRIPTION))
-    async_add_entities(entities)
+
+    def _create_entities(coordinator: HwsDeviceCoordinator) -> list[HwsWaterHeater]:
+        return [HwsWaterHeater(coordinator, HWS_WATER_TANK_DESCRIPTION)]
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
 
 class HwsWaterHeater(HwsDataEntity, WaterHeaterEntity):
@@ -75,7 +76,7 @@ class HwsWaterHeater(HwsDataEntity, WaterHeaterEntity):
     ) -> None:
         """Initialize the water heater entity."""
         self.entity_description = description
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     def _async_update_attrs(self) -> None:
         """Update attributes."""
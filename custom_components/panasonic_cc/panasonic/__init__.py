@@ -6,25 +6,19 @@ import logging
 from typing import Any
 
 from aio_panasonic_comfort_cloud import ApiClient, PanasonicDeviceInfo
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..const import (
-    CONF_AUTO_POWER_ON,
-    CONF_DEVICE_FETCH_INTERVAL,
     CONF_ENABLE_DAILY_ENERGY_SENSOR,
-    CONF_ENERGY_FETCH_INTERVAL,
-    DEFAULT_AUTO_POWER_ON,
-    DEFAULT_DEVICE_FETCH_INTERVAL,
     DEFAULT_ENABLE_DAILY_ENERGY_SENSOR,
-    DEFAULT_ENERGY_FETCH_INTERVAL,
     DOMAIN,
     MANUFACTURER,
 )
-from .const import DATA_COORDINATORS, ENERGY_COORDINATORS
+from ..discovery import DeviceDiscovery
+from ..runtime_data import PanasonicConfigEntry
+from .const import SIGNAL_DEVICE_DISCOVERED, SIGNAL_ENERGY_ADDED, SIGNAL_ENERGY_REMOVED
 from .coordinator import (
     PanasonicDeviceCoordinator,
     PanasonicDeviceEnergyCoordinator,
@@ -45,25 +39,18 @@ PLATFORMS = [
 
 async def async_setup_panasonic(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
+    panasonic_api: ApiClient,
 ) -> tuple[list[PanasonicDeviceCoordinator], list[PanasonicDeviceEnergyCoordinator]]:
-    """Set up Panasonic devices: create API client, coordinators, and register devices."""
-    username = entry.data[CONF_USERNAME]
-    password = entry.data[CONF_PASSWORD]
+    """Set up Panasonic devices: build coordinators from the shared ApiClient session and register devices."""
     enable_daily_energy_sensor = entry.options.get(
         CONF_ENABLE_DAILY_ENERGY_SENSOR, DEFAULT_ENABLE_DAILY_ENERGY_SENSOR
     )
-    auto_power_on = entry.options.get(CONF_AUTO_POWER_ON, DEFAULT_AUTO_POWER_ON)
 
     # Merge data and options so coordinators can read fetch intervals from options
     config = {**entry.data, **entry.options}
 
-    client = async_get_clientsession(hass)
-    api = ApiClient(username, password, client, auto_power_on=auto_power_on)
-
-    await api.start_session()
-
-    devices = api.get_devices()
+    devices = panasonic_api.get_devices()
     _LOGGER.info("Got %s Panasonic devices", len(devices))
 
     data_coordinators: list[PanasonicDeviceCoordinator] = []
@@ -73,34 +60,54 @@ async def async_setup_panasonic(
     device_coordinators_uninitialized: list[tuple[PanasonicDeviceCoordinator, PanasonicDeviceInfo]] = []
     for device in devices:
         try:
-            device_coordinator = PanasonicDeviceCoordinator(hass, config, api, device)
+            device_coordinator = PanasonicDeviceCoordinator(hass, config, panasonic_api, device)
             device_coordinators_uninitialized.append((device_coordinator, device))
             if enable_daily_energy_sensor:
                 energy_coordinators.append(
-                    PanasonicDeviceEnergyCoordinator(hass, config, api, device)
+                    PanasonicDeviceEnergyCoordinator(hass, config, panasonic_api, device)
                 )
         except Exception as exc:
             _LOGGER.warning("Failed to create coordinator for device %s: %s", device.name, exc, exc_info=True)
 
-    # Refresh all device coordinators in parallel
-    async def _init_device(coordinator: PanasonicDeviceCoordinator, device_info: PanasonicDeviceInfo) -> None:
-        try:
-            await coordinator.async_config_entry_first_refresh()
+    # Start from the state persisted last time when there is one; the poller
+    # refreshes it from the cloud right after setup
+    restored = await asyncio.gather(
+        *(coordinator.async_restore_state() for coordinator, _ in device_coordinators_uninitialized),
+        return_exceptions=True,
+    )
+    undiscovered: list[PanasonicDeviceCoordinator] = []
+    for (coordinator, _), is_restored in zip(device_coordinators_uninitialized, restored):
+        if is_restored is True:
             data_coordinators.append(coordinator)
-        except Exception as exc:
-            _LOGGER.warning("Failed to setup device %s: %s", device_info.name, exc, exc_info=True)
+        else:
+            undiscovered.append(coordinator)
+
+    @callback
+    def _async_device_discovered(coordinator: PanasonicDeviceCoordinator) -> None:
+        """Attach a device that only responded after setup."""
+        data_coordinators.append(coordinator)
+        entry.runtime_data.poller.async_add_coordinators([coordinator])
+        async_dispatcher_send(
+            hass, SIGNAL_DEVICE_DISCOVERED.format(entry.entry_id), coordinator
+        )
 
-    await asyncio.gather(
-        *(_init_device(coordinator, device_info) for coordinator, device_info in device_coordinators_uninitialized),
-        return_exceptions=True,
+    # Fetch the rest in parallel; slow or offline units keep retrying in the
+    # background instead of holding up setup
+    discovery = DeviceDiscovery(
+        hass,
+        f"Panasonic Comfort Cloud ({entry.title})",
+        _async_device_discovered,
+        entry.runtime_data.rate_limiter,
     )
+    data_coordinators.extend(await discovery.async_discover(undiscovered))
 
-    hass.data[DOMAIN][DATA_COORDINATORS] = data_coordinators
-    hass.data[DOMAIN][ENERGY_COORDINATORS] = energy_coordinators
+    entry.runtime_data.data_coordinators = data_coordinators
+    entry.runtime_data.energy_coordinators = energy_coordinators
+    entry.runtime_data.data_discovery = discovery
 
-    # Register devices in device registry
+    # Register every device, including those that are still being discovered
     device_registry = dr.async_get(hass)
-    for coordinator in data_coordinators:
+    for coordinator, _ in device_coordinators_uninitialized:
         device_registry.async_get_or_create(
             config_entry_id=entry.entry_id,
             identifiers={(DOMAIN, coordinator.device_id)},
@@ -119,12 +126,48 @@ async def async_setup_panasonic(
     return data_coordinators, energy_coordinators
 
 
+async def async_set_energy_enabled(
+    hass: HomeAssistant,
+    entry: PanasonicConfigEntry,
+    panasonic_api: ApiClient,
+    enabled: bool,
+) -> None:
+    """Create or shut down the energy coordinators after the energy option changed."""
+    runtime = entry.runtime_data
+    if not enabled:
+        removed, runtime.energy_coordinators = runtime.energy_coordinators, []
+        runtime.poller.async_remove_coordinators(removed)
+        for coordinator in removed:
+            async_dispatcher_send(hass, SIGNAL_ENERGY_REMOVED.format(coordinator.device_id))
+        await asyncio.gather(
+            *(coordinator.async_shutdown() for coordinator in removed),
+            return_exceptions=True,
+        )
+        return
+    if runtime.energy_coordinators:
+        return
+
+    config = {**entry.data, **entry.options}
+    energy_coordinators = [
+        PanasonicDeviceEnergyCoordinator(hass, config, panasonic_api, device)
+        for device in panasonic_api.get_devices()
+    ]
+    await asyncio.gather(
+        *(coordinator.async_refresh() for coordinator in energy_coordinators),
+        return_exceptions=True,
+    )
+    runtime.energy_coordinators = energy_coordinators
+    runtime.poller.async_add_coordinators(energy_coordinators)
+    async_dispatcher_send(hass, SIGNAL_ENERGY_ADDED.format(entry.entry_id), energy_coordinators)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
+    panasonic_api: ApiClient,
 ) -> bool:
     """Set up Panasonic from a config entry."""
-    data_coordinators, energy_coordinators = await async_setup_panasonic(hass, entry)
+    data_coordinators, energy_coordinators = await async_setup_panasonic(hass, entry, panasonic_api)
 
     if not data_coordinators:
         _LOGGER.error("Could not find any Panasonic Comfort Cloud Heat Pumps")
@@ -137,7 +180,7 @@ async def async_setup_entry(
 
 async def async_unload_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
 ) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -2,27 +2,131 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Any
 
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..runtime_data import PanasonicConfigEntry
+from .const import SIGNAL_DEVICE_DISCOVERED, SIGNAL_ENERGY_ADDED, SIGNAL_ENERGY_REMOVED
 from .coordinator import (
     PanasonicDeviceCoordinator,
     PanasonicDeviceEnergyCoordinator,
 )
 
 
+@callback
+def async_add_device_entities(
+    hass: HomeAssistant,
+    entry: PanasonicConfigEntry,
+    async_add_entities: Any,
+    create_entities: Callable[[PanasonicDeviceCoordinator], Iterable[Entity]],
+) -> None:
+    """Add the entities of every device, including devices discovered later.
+
+    ``create_entities`` builds the entities of one device. It runs now for
+    every device that is set up and again for each device that only comes
+    online after setup.
+    """
+    async_add_entities([
+        entity
+        for coordinator in entry.runtime_data.data_coordinators
+        for entity in create_entities(coordinator)
+    ])
+
+    @callback
+    def _async_device_discovered(coordinator: PanasonicDeviceCoordinator) -> None:
+        """Add the entities of a device that came online after setup."""
+        async_add_entities(list(create_entities(coordinator)))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICE_DISCOVERED.format(entry.entry_id), _async_device_discovered
+        )
+    )
+
+
+@callback
+def async_add_energy_entities(
+    hass: HomeAssistant,
+    entry: PanasonicConfigEntry,
+    async_add_entities: Any,
+    create_entities: Callable[[PanasonicDeviceEnergyCoordinator], Iterable[Entity]],
+) -> None:
+    """Add the energy entities of every device, including after the energy option is turned on.
+
+    The entities remove themselves when it is turned off again; see
+    ``async_remove_with_energy``.
+    """
+    async_add_entities([
+        entity
+        for coordinator in entry.runtime_data.energy_coordinators
+        for entity in create_entities(coordinator)
+    ])
+
+    @callback
+    def _async_energy_added(coordinators: list[PanasonicDeviceEnergyCoordinator]) -> None:
+        """Add the entities of energy coordinators created after setup."""
+        async_add_entities([
+            entity for coordinator in coordinators for entity in create_entities(coordinator)
+        ])
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ENERGY_ADDED.format(entry.entry_id), _async_energy_added
+        )
+    )
+
+
+@callback
+def async_remove_with_energy(entity: Entity, device_id: str) -> None:
+    """Remove an energy entity once the energy option of its entry is turned off."""
+    entity.async_on_remove(
+        async_dispatcher_connect(
+            entity.hass, SIGNAL_ENERGY_REMOVED.format(device_id), entity.async_remove
+        )
+    )
+
 class PanasonicDataEntity(CoordinatorEntity[PanasonicDeviceCoordinator]):
     """Base class for Panasonic data entities."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: PanasonicDeviceCoordinator, key: str) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: PanasonicDeviceCoordinator,
+        key: str,
+        depends_on: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize the entity.
+
+        ``depends_on`` lists the device field paths the entity reads; when set,
+        the coordinator only calls the entity back when one of them changed.
+        """
+        super().__init__(coordinator, tuple(depends_on) if depends_on is not None else None)
         self._attr_translation_key = key
         self._attr_unique_id = f"{coordinator.device_id}-{key}"
         self._attr_device_info = self.coordinator.device_info
 
+    @property
+    def is_stale(self) -> bool:
+        """Return True when the fields the entity shows were observed too long ago.
+
+        Diagnostic entities describe the connection itself and stay available.
+        """
+        if self.entity_category is EntityCategory.DIAGNOSTIC:
+            return False
+        return self.coordinator.freshness.is_stale(self.coordinator_context)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and not self.is_stale
+
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
         await super().async_added_to_hass()
@@ -53,6 +157,7 @@ class PanasonicEnergyEntity(CoordinatorEntity[PanasonicDeviceEnergyCoordinator])
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
         await super().async_added_to_hass()
+        async_remove_with_energy(self, self.coordinator.device_id)
         self._async_update_attrs()
 
     def _handle_coordinator_update(self) -> None:
@@ -9,9 +9,8 @@ from homeassistant.core import HomeAssistant, cached_property
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.const import EntityCategory
 
-from ..const import DOMAIN
+from .base import async_add_device_entities, async_add_energy_entities, async_remove_with_energy
 from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator
-from .const import DATA_COORDINATORS, ENERGY_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,17 +52,19 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Panasonic button entities."""
-    entities = []
-    data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
-    energy_coordinators: list[PanasonicDeviceEnergyCoordinator] = hass.data[DOMAIN][ENERGY_COORDINATORS]
 
-    for coordinator in data_coordinators:
-        entities.append(PanasonicButtonEntity(coordinator, APP_VERSION_DESCRIPTION))
-        entities.append(CoordinatorUpdateButtonEntity(coordinator, UPDATE_DATA_DESCRIPTION))
-    for coordinator in energy_coordinators:
-        entities.append(CoordinatorUpdateEnergyButtonEntity(coordinator, UPDATE_ENERGY_DESCRIPTION))
+    def _create_entities(coordinator: PanasonicDeviceCoordinator) -> list[ButtonEntity]:
+        return [
+            PanasonicButtonEntity(coordinator, APP_VERSION_DESCRIPTION),
+            CoordinatorUpdateButtonEntity(coordinator, UPDATE_DATA_DESCRIPTION),
+        ]
 
-    async_add_entities(entities)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
+
+    def _create_energy_entities(coordinator: PanasonicDeviceEnergyCoordinator) -> list[ButtonEntity]:
+        return [CoordinatorUpdateEnergyButtonEntity(coordinator, UPDATE_ENERGY_DESCRIPTION)]
+
+    async_add_energy_entities(hass, entry, async_add_entities, _create_energy_entities)
 
 
 class PanasonicButtonEntity(ButtonEntity):
@@ -147,6 +148,11 @@ class CoordinatorUpdateEnergyButtonEntity(ButtonEntity):
         """Return if the button is available."""
         return self._coordinator.last_update_success
 
+    async def async_added_to_hass(self) -> None:
+        """Call when entity is added to hass."""
+        await super().async_added_to_hass()
+        async_remove_with_energy(self, self._coordinator.device_id)
+
     async def async_press(self) -> None:
         """Press the button."""
         await self._coordinator.async_request_refresh()
@@ -8,7 +8,6 @@ from typing import Any
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityDescription,
-    HVACAction,
     HVACMode,
 )
 from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
@@ -16,17 +15,15 @@ from homeassistant.components.climate.const import ClimateEntityFeature
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
-from aio_panasonic_comfort_cloud import PanasonicDeviceParameters, ChangeRequestBuilder, constants
+from aio_panasonic_comfort_cloud import ChangeRequestBuilder, constants
 
 from ..const import (
     CONF_USE_PANASONIC_PRESET_NAMES,
     DEFAULT_USE_PANASONIC_PRESET_NAMES,
-    DOMAIN,
 )
-from .base import PanasonicDataEntity
-from .coordinator import PanasonicDeviceCoordinator
+from .base import PanasonicDataEntity, async_add_device_entities
+from .coordinator import PanasonicDeviceCoordinator, convert_state_to_hvac_action
 from .const import (
-    DATA_COORDINATORS,
     SUPPORT_FLAGS,
     PRESET_8_15,
     PRESET_NONE,
@@ -43,6 +40,8 @@ _LOGGER = logging.getLogger(__name__)
 class PanasonicClimateEntityDescription(ClimateEntityDescription):
     """Describes a Panasonic climate entity."""
 
+    depends_on: tuple[str, ...] | None = None
+
 
 def convert_operation_mode_to_hvac_mode(
     operation_mode: constants.OperationMode, iauto: bool
@@ -78,46 +77,20 @@ def convert_hvac_mode_to_operation_mode(
             return constants.OperationMode.Heat
 
 
-def convert_state_to_hvac_action(state: PanasonicDeviceParameters) -> HVACAction | None:
-    """Convert state to HVAC action."""
-    if state.power == constants.Power.Off:
-        return HVACAction.OFF
-
-    target_temp = state.target_temperature
-    inside_temp = state.inside_temperature
-
-    if target_temp is None or inside_temp is None:
-        return None
-
-    match state.mode:
-        case constants.OperationMode.Auto:
-            auto_diff = target_temp - inside_temp
-            if auto_diff >= 1:
-                return HVACAction.HEATING
-            if auto_diff <= -1:
-                return HVACAction.COOLING
-            return HVACAction.IDLE
-        case constants.OperationMode.Cool:
-            return (
-                HVACAction.COOLING
-                if target_temp < inside_temp
-                else HVACAction.IDLE
-            )
-        case constants.OperationMode.Dry:
-            return HVACAction.DRYING
-        case constants.OperationMode.Fan:
-            return HVACAction.IDLE
-        case constants.OperationMode.Heat:
-            return (
-                HVACAction.HEATING
-                if target_temp > inside_temp
-                else HVACAction.IDLE
-            )
-
-
 PANASONIC_CLIMATE_DESCRIPTION = PanasonicClimateEntityDescription(
     key="climate",
     translation_key="climate",
+    depends_on=(
+        "parameters.power",
+        "parameters.mode",
+        "parameters.iautox_mode",
+        "parameters.target_temperature",
+        "parameters.inside_temperature",
+        "parameters.fan_speed",
+        "parameters.eco_mode",
+        "parameters.vertical_swing_mode",
+        "parameters.horizontal_swing_mode",
+    ),
 )
 
 
@@ -191,7 +164,7 @@ class PanasonicClimateEntity(PanasonicDataEntity, ClimateEntity):
                 if opt != constants.AirSwingLR.Unavailable
             ]
 
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     def _async_update_attrs(self) -> None:
         """Update attributes."""
@@ -468,15 +441,15 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Panasonic climate entities."""
-    entities = []
-    data_coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
     use_panasonic_preset_names = entry.options.get(
         CONF_USE_PANASONIC_PRESET_NAMES, DEFAULT_USE_PANASONIC_PRESET_NAMES
     )
-    for coordinator in data_coordinators:
-        entities.append(
+
+    def _create_entities(coordinator: PanasonicDeviceCoordinator) -> list[PanasonicClimateEntity]:
+        return [
             PanasonicClimateEntity(
                 coordinator, PANASONIC_CLIMATE_DESCRIPTION, use_panasonic_preset_names
             )
-        )
-    async_add_entities(entities)
+        ]
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
@@ -57,8 +57,12 @@ SUPPORT_FLAGS = (
     ClimateEntityFeature.TURN_ON
 )
 
-DATA_COORDINATORS = "data_coordinators"
-ENERGY_COORDINATORS = "energy_coordinators"
+# Sent with the coordinator of a device that came online after setup
+SIGNAL_DEVICE_DISCOVERED = "panasonic_cc_device_discovered_{}"
+# Sent with the energy coordinators created when the energy option is turned on
+SIGNAL_ENERGY_ADDED = "panasonic_cc_energy_added_{}"
+# Sent per device when the energy option is turned off, to remove its energy entities
+SIGNAL_ENERGY_REMOVED = "panasonic_cc_energy_removed_{}"
 
 SELECT_HORIZONTAL_SWING = "horizontal_swing"
 SELECT_VERTICAL_SWING = "vertical_swing"
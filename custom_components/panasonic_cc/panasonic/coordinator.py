@@ -1,21 +1,30 @@
 """Coordinators for Panasonic Comfort Cloud devices."""
 import asyncio
+import copy
 import logging
-from datetime import timedelta
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from typing import Any
 
 from aiohttp import ClientResponseError
+from homeassistant.components.climate import HVACAction
 from homeassistant.components.persistent_notification import async_create, async_dismiss
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from aio_panasonic_comfort_cloud import (
     ApiClient,
     PanasonicDevice,
     PanasonicDeviceInfo,
     PanasonicDeviceEnergy,
+    PanasonicDeviceParameters,
+    PanasonicDeviceZone,
     ChangeRequestBuilder,
+    constants,
 )
 
 from ..const import (
@@ -24,14 +33,62 @@ from ..const import (
     NOTIFICATION_AUTH_EXPIRED,
     DEFAULT_DEVICE_FETCH_INTERVAL,
     DEFAULT_ENERGY_FETCH_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_MIN_POLL_INTERVAL,
     CONF_DEVICE_FETCH_INTERVAL,
     CONF_ENERGY_FETCH_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MAX_STALENESS,
+    CONF_MIN_POLL_INTERVAL,
 )
-from ..error_handler import classify_error, FriendlyError, ErrorCategory
+from ..api_client import PanasonicApiClient
+from ..change_tracking import FieldListenerRegistry, diff_state
+from ..command_queue import CommandQueue
+from ..energy_backfill import EnergyBackfill, EnergyStatisticDescription, parse_history_day
+from ..error_handler import backoff_policy, classify_error, FriendlyError, ErrorCategory
+from ..freshness import FieldFreshness
+from ..rate_limiter import RequestPriority, request_priority
+from ..request_stats import request_device
+from ..scheduler import AccountPoller, AdaptivePollInterval
 
 MAX_CONSECUTIVE_FAILURES = 5
-BACKOFF_MULTIPLIER = 2
-MAX_UPDATE_INTERVAL = 600  # seconds
+# Changes applied within this many seconds of each other are sent as one write
+COMMAND_COALESCE_WINDOW = 0.5
+# How long optimistic state survives polls that still return pre-command data
+OPTIMISTIC_STATE_TIMEOUT = 120  # seconds
+# Persisted device state is written at most this often
+STATE_CACHE_SAVE_DELAY = 60  # seconds
+
+# Daily history imported into long-term statistics by the energy backfill
+ENERGY_STATISTICS = (
+    EnergyStatisticDescription(key="energy", name="Energy"),
+)
+
+# HVAC actions during which the device is polled at its base interval
+ACTIVE_HVAC_ACTIONS = (HVACAction.HEATING, HVACAction.COOLING, HVACAction.DRYING)
+
+# PanasonicDeviceParameters attributes that make up the device state snapshot
+DEVICE_STATE_FIELDS = (
+    "power",
+    "mode",
+    "fan_speed",
+    "horizontal_swing_mode",
+    "vertical_swing_mode",
+    "eco_mode",
+    "nanoe_mode",
+    "eco_navi_mode",
+    "eco_function_mode",
+    "target_temperature",
+    "inside_temperature",
+    "outside_temperature",
+    "iautox_mode",
+    "air_direction",
+    "air_quality",
+    "last_setting_mode",
+    "inside_cleaning",
+    "fireplace",
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +101,116 @@ def _is_auth_error(err: Exception) -> bool:
     return any(kw in error_str for kw in ["401", "unauthorized", "authentication", "token", "expired", "invalid session"])
 
 
+def _merge_change_request(pending: dict[str, Any], changes: dict[str, Any]) -> None:
+    """Merge a ChangeRequestBuilder payload into a pending one, last writer wins.
+
+    Top-level parameters are simply overwritten. Zone parameters are merged
+    per zone id so changes to different zones (or different fields of the
+    same zone) are all kept.
+    """
+    for key, value in changes.items():
+        if key != "zoneParameters":
+            pending[key] = value
+            continue
+        zones = {zone["zoneId"]: zone for zone in pending.setdefault("zoneParameters", [])}
+        for zone in value:
+            if zone["zoneId"] in zones:
+                zones[zone["zoneId"]].update(zone)
+            else:
+                pending["zoneParameters"].append(dict(zone))
+
+
+def _apply_change_request(parameters: PanasonicDeviceParameters, changes: dict[str, Any]) -> None:
+    """Apply a ChangeRequestBuilder payload to device parameters in place.
+
+    The payload uses the same keys as the device status response, so the
+    library's own loaders do the work. Zones are loaded one by one because
+    loading ``zoneParameters`` as a whole replaces the zone list.
+    """
+    values = {
+        # The builder writes "iauto" but the status response reads "iAuto"
+        ("iAuto" if key == "iauto" else key): value
+        for key, value in changes.items()
+        if key != "zoneParameters"
+    }
+    parameters.load(values)
+    for zone_changes in changes.get("zoneParameters", ()):
+        try:
+            parameters.get_zone(zone_changes["zoneId"]).load(zone_changes)
+        except KeyError:
+            continue
+
+
+def _restore_parameters(
+    parameters: PanasonicDeviceParameters,
+    source: PanasonicDeviceParameters,
+    changes: dict[str, Any],
+) -> None:
+    """Put the fields a change request touched back to their values in ``source``.
+
+    Fields the request did not touch, such as the temperature readings, keep
+    whatever the last refresh put there.
+    """
+    changed = copy.deepcopy(source)
+    _apply_change_request(changed, changes)
+    for name in DEVICE_STATE_FIELDS:
+        if getattr(changed, name) != getattr(source, name):
+            setattr(parameters, name, getattr(source, name))
+    for zone_changes in changes.get("zoneParameters", ()):
+        try:
+            target = parameters.get_zone(zone_changes["zoneId"])
+            zone = source.get_zone(zone_changes["zoneId"])
+        except KeyError:
+            continue
+        target.mode = zone.mode
+        target.level = zone.level
+
+
+def find_zone(device: PanasonicDevice, zone_id: int) -> PanasonicDeviceZone | None:
+    """Return a zone of the device, or None if the last status did not include it."""
+    try:
+        return device.parameters.get_zone(zone_id)
+    except KeyError:
+        return None
+
+
+def convert_state_to_hvac_action(state: PanasonicDeviceParameters) -> HVACAction | None:
+    """Convert state to HVAC action."""
+    if state.power == constants.Power.Off:
+        return HVACAction.OFF
+
+    target_temp = state.target_temperature
+    inside_temp = state.inside_temperature
+
+    if target_temp is None or inside_temp is None:
+        return None
+
+    match state.mode:
+        case constants.OperationMode.Auto:
+            auto_diff = target_temp - inside_temp
+            if auto_diff >= 1:
+                return HVACAction.HEATING
+            if auto_diff <= -1:
+                return HVACAction.COOLING
+            return HVACAction.IDLE
+        case constants.OperationMode.Cool:
+            return (
+                HVACAction.COOLING
+                if target_temp < inside_temp
+                else HVACAction.IDLE
+            )
+        case constants.OperationMode.Dry:
+            return HVACAction.DRYING
+        case constants.OperationMode.Fan:
+            return HVACAction.IDLE
+        case constants.OperationMode.Heat:
+            return (
+                HVACAction.HEATING
+                if target_temp > inside_temp
+                else HVACAction.IDLE
+            )
+
+
 def _create_auth_expired_notification(hass: HomeAssistant) -> None:
     """Create a persistent notification for expired authentication."""
     async_create(
@@ -61,7 +228,7 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
         self,
         hass: HomeAssistant,
         config: dict,
-        api_client: ApiClient,
+        api_client: PanasonicApiClient,
         device_info: PanasonicDeviceInfo,
     ) -> None:
         """Initialize the coordinator."""
@@ -72,29 +239,88 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             hass,
             _LOGGER,
             name=f"Panasonic Device Coordinator ({device_info.name})",
-            update_interval=timedelta(seconds=self._base_interval),
+            # Polling is driven by the account-level AccountPoller
+            update_interval=None,
+            # Only notify listeners when _update_id moves, i.e. the state changed
+            always_update=False,
         )
+        self.poll_interval = timedelta(seconds=self._base_interval)
+        self._poll_schedule = AdaptivePollInterval(
+            self._base_interval,
+            config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+        # Set by the AccountPoller that drives this coordinator
+        self.poller: AccountPoller | None = None
         self._api_client = api_client
         self._device_info = device_info
         self._device: PanasonicDevice | None = None
         self._update_id = 0
         self._store = Store(hass, version=1, key=f"panasonic_cc_{device_info.id}")
+        self._state_store = Store(hass, version=1, key=f"panasonic_cc_{device_info.id}_state")
+        # True when the device was built from persisted state at startup
+        self.restored_from_cache = False
         self._refresh_task: asyncio.Task | None = None
+        self._pending_changes: dict[str, Any] = {}
+        self._pending_waiters: list[asyncio.Future[None]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._command_queue = CommandQueue(
+            hass,
+            device_info.id,
+            device_info.name,
+            self._async_send_changes,
+            _merge_change_request,
+            self._async_command_queue_changed,
+            self._async_command_queue_settled,
+        )
+        # What the last refresh fetched, under the optimistic values
+        self._fetched_parameters: PanasonicDeviceParameters | None = None
+        # Writes on their way to the cloud, and how many have finished so far
+        self._writes_in_flight = 0
+        self._writes_finished = 0
+        self._optimistic_changes: dict[str, Any] = {}
+        self._optimistic_since = dt_util.utcnow()
         self._consecutive_failures = 0
         self._auth_failed = False
         self._last_error: FriendlyError | None = None
         self._last_command_error: FriendlyError | None = None
+        self._last_device_state: dict[str, Any] = {}
+        self._changed_fields: frozenset[str] | None = None
+        self._field_listeners = FieldListenerRegistry()
+        self._last_cached_timestamp: datetime | None = None
+        self._freshness = FieldFreshness(config.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS))
+        self._staleness_unsub: CALLBACK_TYPE | None = None
 
     @property
     def last_error(self) -> FriendlyError | None:
         """Return the last error that occurred."""
         return self._last_error
 
+    @property
+    def changed_fields(self) -> frozenset[str] | None:
+        """Return the field paths changed by the last refresh (None means all)."""
+        return self._changed_fields
+
+    @property
+    def freshness(self) -> FieldFreshness:
+        """Return when each field of the device state was last observed."""
+        return self._freshness
+
     @property
     def last_command_error(self) -> FriendlyError | None:
         """Return the last command error that occurred."""
         return self._last_command_error
 
+    @property
+    def pending_commands(self) -> dict[str, Any]:
+        """Return the writes queued for retry after a recoverable failure."""
+        return self._command_queue.pending
+
+    @property
+    def pending_command_attempts(self) -> int:
+        """Return how many retries of the queued writes have failed."""
+        return self._command_queue.attempts
+
     @property
     def connection_status(self) -> str:
         """Return the current connection status."""
@@ -106,6 +332,13 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             return "degraded"
         return "connected"
 
+    @property
+    def is_active(self) -> bool:
+        """Return True while the device is heating, cooling or drying."""
+        if self._device is None:
+            return False
+        return convert_state_to_hvac_action(self._device.parameters) in ACTIVE_HVAC_ACTIONS
+
     @property
     def device(self) -> PanasonicDevice:
         """Return the current device state."""
@@ -134,14 +367,110 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             sw_version=self._api_client.app_version,
         )
 
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, optionally only for the field paths in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        paths = context if isinstance(context, Iterable) and not isinstance(context, str) else None
+        remove_field_listener = self._field_listeners.async_add(update_callback, paths)
+
+        @callback
+        def remove_listeners() -> None:
+            """Remove the listener from both registries."""
+            remove_field_listener()
+            remove_listener()
+
+        return remove_listeners
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call only the listeners subscribed to the fields that changed."""
+        for update_callback in self._field_listeners.listeners_for(self._changed_fields):
+            update_callback()
+
+    def _device_state_snapshot(self) -> dict[str, Any]:
+        """Flatten the device state into a snapshot keyed by field path."""
+        if self._device is None:
+            return {}
+        params = self._device.parameters
+        state: dict[str, Any] = {
+            f"parameters.{name}": getattr(params, name) for name in DEVICE_STATE_FIELDS
+        }
+        for zone in params.zones:
+            prefix = f"parameters.zones[{zone.id}]"
+            state[f"{prefix}.name"] = zone.name
+            state[f"{prefix}.mode"] = zone.mode
+            state[f"{prefix}.level"] = zone.level
+            state[f"{prefix}.spill"] = zone.spill
+            state[f"{prefix}.temperature"] = zone.temperature
+        state["info.status_data_mode"] = self._device.info.status_data_mode
+        # The server timestamp only matters (and is only shown) for cached data;
+        # live responses carry a fresh one on every poll
+        if self._device.info.status_data_mode == constants.StatusDataMode.CACHED:
+            state["timestamp"] = self._device.timestamp
+        return state
+
     def get_change_request_builder(self) -> ChangeRequestBuilder:
         """Get a change request builder for the current device."""
         return ChangeRequestBuilder(self.device)
 
     async def async_apply_changes(self, request_builder: ChangeRequestBuilder) -> None:
-        """Apply changes to the device."""
+        """Apply changes to the device.
+
+        Changes arriving within COMMAND_COALESCE_WINDOW of each other (a scene
+        setting mode, temperature, fan and swing) are merged into a single
+        set_device_raw call. Every caller waits for that write and sees its
+        outcome.
+
+        A write that fails with a recoverable error is queued and retried in
+        the background instead, so the callers see it succeed and the
+        optimistic state stays until the cloud takes it.
+        """
+        changes = request_builder.build()
+        self._poll_schedule.record_command()
+        self._async_update_poll_interval()
+        self._apply_optimistic_changes(changes)
+        _merge_change_request(self._pending_changes, changes)
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending_waiters.append(waiter)
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush_changes(),
+                f"{self._device_info.name} command flush",
+            )
+        await waiter
+
+    async def _async_flush_changes(self) -> None:
+        """Send the changes collected during the coalescing window."""
         try:
-            await self._api_client.set_device_raw(self.device, request_builder.build())
+            await asyncio.sleep(COMMAND_COALESCE_WINDOW)
+        except asyncio.CancelledError:
+            for waiter in self._pending_waiters:
+                waiter.cancel()
+            raise
+        finally:
+            changes, self._pending_changes = self._pending_changes, {}
+            waiters, self._pending_waiters = self._pending_waiters, []
+            self._flush_task = None
+
+        # Writes still queued from an earlier failure go out with this one;
+        # fields written again take the new value
+        if queued := self._command_queue.async_take():
+            _merge_change_request(queued, changes)
+            changes = queued
+
+        try:
+            if len(waiters) > 1:
+                _LOGGER.debug(
+                    "%s Merged %d commands into one write: %s",
+                    self._device_info.name,
+                    len(waiters),
+                    changes,
+                )
+            with request_device(self.device_id):
+                await self._async_send_changes(changes)
             # Clear command error on success
             self._last_command_error = None
         except Exception as err:
@@ -150,15 +479,172 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             # Also track the failure in the consecutive failures counter
             # so the connection status sensor reflects the device state
             self._handle_failure(err)
+            if friendly.is_recoverable:
+                _LOGGER.warning(
+                    "%s Command failed: %s — queued for retry",
+                    self._device_info.name,
+                    friendly.title,
+                )
+                self._command_queue.async_enqueue(changes)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+                return
             _LOGGER.warning(
                 "%s Command failed: %s — %s",
                 self._device_info.name,
                 friendly.title,
                 friendly.message,
             )
-            # Notify listeners so the connection status sensor updates immediately
+            # Undo the optimistic state and notify listeners so both the
+            # affected entities and the connection status sensor update now
+            self._changed_fields = self._rollback_optimistic_changes()
             self.async_update_listeners()
-            raise
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+        finally:
+            # Never leave a caller hanging if the write itself was cancelled
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.cancel()
+
+    async def _async_send_changes(self, changes: dict[str, Any]) -> None:
+        """Write a change request to the device."""
+        self._writes_in_flight += 1
+        try:
+            await self._api_client.set_device_raw(self.device, changes)
+        finally:
+            self._writes_in_flight -= 1
+            self._writes_finished += 1
+
+    @property
+    def _changes_in_flight(self) -> bool:
+        """Return True while written changes may not have reached the cloud yet.
+
+        That covers changes waiting in the coalescing window, a flush about to
+        send them, a write waiting on the rate limiter or the network, and
+        writes queued for retry after a recoverable failure.
+        """
+        return bool(
+            self._pending_changes
+            or self._flush_task is not None
+            or self._writes_in_flight
+            or self._command_queue.pending
+        )
+
+    @callback
+    def _async_resume_commands(self) -> None:
+        """Show and retry the writes still queued from before a restart."""
+        if not self._command_queue.pending:
+            return
+        self._apply_optimistic_changes(self._command_queue.pending)
+        self._command_queue.async_resume()
+
+    @callback
+    def _async_command_queue_changed(self) -> None:
+        """Let the connection status sensor show the queued writes."""
+        self._changed_fields = frozenset()
+        self.async_update_listeners()
+
+    @callback
+    def _async_command_queue_settled(self, error: Exception | None) -> None:
+        """Handle the queue emptying, because the writes went out or were dropped."""
+        if error is None:
+            self._last_command_error = None
+            self._changed_fields = frozenset()
+        else:
+            self._last_command_error = classify_error(error)
+            self._changed_fields = self._rollback_optimistic_changes()
+        self.async_update_listeners()
+
+    @callback
+    def _apply_optimistic_changes(self, changes: dict[str, Any]) -> None:
+        """Show a command's result right away, before the cloud confirms it."""
+        if self._device is None or not changes:
+            return
+        parameters = self._device.parameters
+        if self._fetched_parameters is None:
+            self._fetched_parameters = copy.deepcopy(parameters)
+        _merge_change_request(self._optimistic_changes, changes)
+        self._optimistic_since = dt_util.utcnow()
+        _apply_change_request(parameters, changes)
+        self._publish_device_state()
+
+    @callback
+    def _rollback_optimistic_changes(self) -> frozenset[str]:
+        """Put the commanded fields back to the last fetched state.
+
+        Returns the paths that moved back.
+        """
+        fetched = self._fetched_parameters
+        changes = self._optimistic_changes
+        self._fetched_parameters = None
+        self._optimistic_changes = {}
+        if fetched is None or self._device is None:
+            return frozenset()
+        _restore_parameters(self._device.parameters, fetched, changes)
+        current_state = self._device_state_snapshot()
+        changed_fields = diff_state(self._last_device_state, current_state)
+        self._last_device_state = current_state
+        if changed_fields:
+            self._update_id += 1
+            self.data = self._update_id
+        return changed_fields
+
+    def _reconcile_optimistic_changes(self, write_raced: bool = False) -> None:
+        """Check freshly fetched cloud state against the optimistic state.
+
+        Matching state confirms the commands. While changes are still on
+        their way to the cloud, or a write finished while the status was being
+        fetched (``write_raced``), the status cannot show them yet. Data that
+        predates the last write (cached responses) keeps the optimistic values
+        for up to OPTIMISTIC_STATE_TIMEOUT. Any other mismatch means the
+        device did not take the change, so the cloud state wins.
+        """
+        parameters = self.device.parameters
+        fetched = copy.deepcopy(parameters)
+        fetched_state = self._device_state_snapshot()
+        _apply_change_request(parameters, self._optimistic_changes)
+        mismatched = diff_state(fetched_state, self._device_state_snapshot())
+        if mismatched:
+            timestamp = self.device.timestamp
+            predates_write = (
+                self.device.info.status_data_mode == constants.StatusDataMode.CACHED
+                and (timestamp is None or timestamp < self._optimistic_since)
+            )
+            age = (dt_util.utcnow() - self._optimistic_since).total_seconds()
+            if self._changes_in_flight or write_raced or (
+                predates_write and age < OPTIMISTIC_STATE_TIMEOUT
+            ):
+                # A later rollback starts from this refresh, not an older one
+                self._fetched_parameters = fetched
+                return
+            _LOGGER.debug(
+                "%s Cloud state does not match the last command, rolling back: %s",
+                self._device_info.name,
+                ", ".join(sorted(mismatched)),
+            )
+            _restore_parameters(parameters, fetched, self._optimistic_changes)
+        self._fetched_parameters = None
+        self._optimistic_changes = {}
+
+    @callback
+    def _publish_device_state(self) -> None:
+        """Notify the listeners of the fields changed outside a refresh."""
+        current_state = self._device_state_snapshot()
+        changed_fields = diff_state(self._last_device_state, current_state)
+        if not changed_fields:
+            return
+        self._last_device_state = current_state
+        self._changed_fields = changed_fields
+        self._update_id += 1
+        self.data = self._update_id
+        self.async_update_listeners()
 
     async def async_schedule_refresh(self) -> None:
         """Schedule a debounced refresh of device data."""
@@ -166,10 +652,16 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             self._refresh_task.cancel()
             self._refresh_task = None
 
+        # A successful write is already shown through the optimistic state;
+        # the next regular poll reconciles it with the cloud
+        if self._optimistic_changes and self._last_command_error is None:
+            return
+
         async def _delayed_refresh() -> None:
             try:
                 await asyncio.sleep(2)
-                await self.async_request_refresh()
+                with request_priority(RequestPriority.REFRESH), request_device(self.device_id):
+                    await self.async_request_refresh()
             except asyncio.CancelledError:
                 pass
             finally:
@@ -177,6 +669,25 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
 
         self._refresh_task = self.hass.async_create_task(_delayed_refresh())
 
+    async def async_shutdown(self) -> None:
+        """Cancel every pending task and write out the cached state on unload."""
+        await super().async_shutdown()
+        if self._staleness_unsub is not None:
+            self._staleness_unsub()
+            self._staleness_unsub = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        # Queued writes stay persisted and are retried after the next setup
+        self._command_queue.async_cancel()
+        # Save now rather than after the save delay, so a write from this
+        # coordinator cannot land after the entry has been set up again
+        if self._api_client.last_status(self.device_id) is not None:
+            await self._state_store.async_save(self._state_to_store())
+
     async def async_get_stored_data(self) -> dict:
         """Get stored data."""
         data = await self._store.async_load()
@@ -186,8 +697,63 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
         """Store data."""
         await self._store.async_save(data)
 
+    async def async_restore_state(self) -> bool:
+        """Build the device from the status response persisted last time.
+
+        Returns True when the entities can start from it; the poller then
+        brings the device up to date in the background.
+        """
+        await self._command_queue.async_load()
+        data = await self._state_store.async_load()
+        if not data or not data.get("status"):
+            return False
+        try:
+            device = PanasonicDevice(self._device_info, data["status"])
+            _LOGGER.debug(
+                "%s Restored cached state from %s - Nanoe: %s, Eco Navi: %s, AI Eco: %s",
+                self._device_info.name,
+                data.get("saved_at"),
+                device.has_nanoe,
+                device.has_eco_navi,
+                device.has_eco_function,
+            )
+            self._device = device
+            self._last_device_state = self._device_state_snapshot()
+            observed_at = dt_util.parse_datetime(data.get("observed_at") or data.get("saved_at") or "")
+            if observed_at is not None:
+                self._freshness.record(self._last_device_state, observed_at)
+                self._async_schedule_staleness_check()
+        except Exception as err:
+            _LOGGER.debug(
+                "%s Ignoring unusable cached state: %s", self._device_info.name, err
+            )
+            self._device = None
+            return False
+        self._update_id = 1
+        self.restored_from_cache = True
+        self.async_set_updated_data(self._update_id)
+        self._async_resume_commands()
+        return True
+
+    @callback
+    def _async_save_state(self) -> None:
+        """Persist the last status response once the save delay has passed."""
+        self._state_store.async_delay_save(self._state_to_store, STATE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _state_to_store(self) -> dict[str, Any]:
+        """Return the data written to the state store."""
+        observed_at = self._freshness.observed_at
+        return {
+            "status": self._api_client.last_status(self.device_id),
+            "saved_at": dt_util.utcnow().isoformat(),
+            "observed_at": observed_at.isoformat() if observed_at is not None else None,
+        }
+
     async def _async_update_data(self) -> int:
         """Fetch data from API."""
+        # Treat everything as changed unless a successful diff narrows it down
+        self._changed_fields = None
         if self._auth_failed:
             raise UpdateFailed("Authentication failed — coordinator disabled")
 
@@ -202,12 +768,41 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
                     self._device.has_eco_function,
                 )
                 self._update_id = 1
+                self._last_device_state = self._device_state_snapshot()
+                self._record_observation()
+                self._async_save_state()
                 self._reset_backoff()
+                self._async_resume_commands()
                 return self._update_id
-            if await self._api_client.try_update_device(self._device):
+            # try_update_device reports a change on every response with zone
+            # parameters, so diff the flattened state to see what really moved
+            writes_finished = self._writes_finished
+            updated = await self._api_client.try_update_device(self._device)
+            # Before the optimistic values are laid over what the cloud sent
+            revived = self._record_observation()
+            if self._optimistic_changes:
+                self._reconcile_optimistic_changes(self._writes_finished != writes_finished)
+                updated = True
+            if updated:
+                current_state = self._device_state_snapshot()
+                changed_fields = diff_state(self._last_device_state, current_state)
+                if changed_fields:
+                    self._last_device_state = current_state
+                    # After a failed refresh every entity must re-evaluate availability
+                    if self.last_update_success:
+                        self._changed_fields = changed_fields | revived
+                    self._update_id += 1
+                    self._async_save_state()
+                    self._record_freshness(True)
+                    self._reset_backoff()
+                    return self._update_id
+            if revived:
+                # Nothing moved, but fields that had gone stale are current again
+                if self.last_update_success:
+                    self._changed_fields = revived
                 self._update_id += 1
-                self._reset_backoff()
-                return self._update_id
+            self._record_freshness(False)
+            self._reset_backoff()
         except Exception as err:
             if _is_auth_error(err):
                 self._auth_failed = True
@@ -223,8 +818,85 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             raise UpdateFailed(f"{friendly.title}: {friendly.message}") from err
         return self._update_id
 
+    def _record_freshness(self, changed: bool) -> None:
+        """Tell the adaptive interval whether the refresh returned live or cached status."""
+        if self.device.info.status_data_mode != constants.StatusDataMode.CACHED:
+            self._last_cached_timestamp = None
+            self._poll_schedule.record_refresh(changed)
+            return
+        # The server timestamp tells when the cloud last heard from the device;
+        # only a newer one is worth following up on
+        timestamp = self.device.timestamp
+        advanced = timestamp is not None and timestamp != self._last_cached_timestamp
+        self._last_cached_timestamp = timestamp
+        self._poll_schedule.record_cached(
+            (dt_util.utcnow() - timestamp).total_seconds() if advanced else None
+        )
+        _LOGGER.debug(
+            "%s Cloud returned cached status from %s", self._device_info.name, timestamp
+        )
+
+    def _record_observation(self) -> frozenset[str]:
+        """Record when the cloud really observed the state it just returned.
+
+        Live status is as old as the response. Cached status is as old as its
+        server timestamp, and without one it tells nothing new. Returns the
+        fields that were stale and are current again.
+        """
+        now = dt_util.utcnow()
+        if self.device.info.status_data_mode == constants.StatusDataMode.CACHED:
+            if self.device.timestamp is None:
+                return frozenset()
+            observed_at = min(self.device.timestamp, now)
+        else:
+            observed_at = now
+        revived = self._freshness.record(self._device_state_snapshot(), observed_at, now)
+        self._async_schedule_staleness_check()
+        return revived
+
+    @callback
+    def _async_schedule_staleness_check(self) -> None:
+        """Wake up when the next field goes stale, even if no poll happens by then."""
+        if self._staleness_unsub is not None:
+            self._staleness_unsub()
+            self._staleness_unsub = None
+        delay = self._freshness.next_expiry()
+        if delay is None:
+            return
+        self._staleness_unsub = async_call_later(
+            self.hass,
+            # Just past the limit, so the fields are stale when the check runs
+            delay + 1,
+            HassJob(self._async_staleness_check, cancel_on_shutdown=True),
+        )
+
+    @callback
+    def _async_staleness_check(self, _now: datetime) -> None:
+        """Let the entities of fields that went stale re-evaluate their availability."""
+        self._staleness_unsub = None
+        stale = self._freshness.stale_paths()
+        if stale:
+            _LOGGER.debug(
+                "%s Data older than %ds: %s",
+                self._device_info.name,
+                self._freshness.max_staleness,
+                ", ".join(sorted(stale)),
+            )
+            self._changed_fields = stale
+            self.async_update_listeners()
+        self._async_schedule_staleness_check()
+
+    @callback
+    def async_set_max_staleness(self, max_staleness: float) -> None:
+        """Change the age after which entities treat their data as stale."""
+        self._freshness.set_max_staleness(max_staleness)
+        # Availability may have flipped either way for any field
+        self._changed_fields = None
+        self.async_update_listeners()
+        self._async_schedule_staleness_check()
+
     def _reset_backoff(self) -> None:
-        """Reset circuit breaker and restore base polling interval."""
+        """Reset circuit breaker and return to the adaptive polling interval."""
         if self._consecutive_failures > 0:
             _LOGGER.debug(
                 "%s API recovered after %d consecutive failure(s)",
@@ -233,18 +905,59 @@ class PanasonicDeviceCoordinator(DataUpdateCoordinator[int]):
             )
         self._consecutive_failures = 0
         self._last_error = None
-        self.update_interval = timedelta(seconds=self._base_interval)
+        self._async_update_poll_interval()
+
+    @property
+    def min_poll_interval(self) -> float:
+        """Return the shortest interval this device is polled at."""
+        return self._poll_schedule.minimum
+
+    @callback
+    def _async_update_poll_interval(self) -> None:
+        """Recompute the adaptive interval and let the poller pull the next poll in."""
+        self.poll_interval = self._poll_schedule.interval(self.is_active)
+        if self.poller is not None:
+            self.poller.async_reschedule(self)
+
+    @callback
+    def async_set_poll_options(self, config: dict) -> None:
+        """Apply changed fetch interval options without recreating the coordinator."""
+        self._base_interval = config.get(
+            CONF_DEVICE_FETCH_INTERVAL, DEFAULT_DEVICE_FETCH_INTERVAL
+        )
+        self._poll_schedule.set_bounds(
+            self._base_interval,
+            config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+        # A device that is backing off picks the new interval up once it recovers
+        if self._consecutive_failures == 0:
+            self._async_update_poll_interval()
 
     def _handle_failure(self, err: Exception | None = None) -> None:
-        """Handle API failure with exponential backoff."""
+        """Handle API failure with the backoff policy of its error category."""
         self._consecutive_failures += 1
+        friendly = classify_error(err) if err is not None else None
+        if friendly is not None:
+            self._last_error = friendly
+        policy = backoff_policy(friendly)
+        if friendly is not None and policy.account_wide:
+            # The account poller backs off every device at once for these
+            _LOGGER.warning(
+                "%s API failure %d/%d — %s: %s — left to the account poller",
+                self._device_info.name,
+                self._consecutive_failures,
+                MAX_CONSECUTIVE_FAILURES,
+                friendly.title,
+                friendly.message,
+            )
+            return
         new_interval = min(
-            self._base_interval * (BACKOFF_MULTIPLIER ** self._consecutive_failures),
-            MAX_UPDATE_INTERVAL,
+            self._base_interval * (policy.multiplier ** self._consecutive_failures),
+            policy.max_interval,
         )
-        self.update_interval = timedelta(seconds=new_interval)
+        self.poll_interval = timedelta(seconds=new_interval)
         if err is not None:
-            self._last_error = classify_error(err)
             _LOGGER.warning(
                 "%s API failure %d/%d — %s: %s — polling interval increased to %ds",
                 self._device_info.name,
@@ -282,12 +995,23 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
             hass,
             _LOGGER,
             name=f"Panasonic Energy Coordinator ({device_info.name})",
-            update_interval=timedelta(seconds=self._base_interval),
+            # Polling is driven by the account-level AccountPoller
+            update_interval=None,
         )
+        self.poll_interval = timedelta(seconds=self._base_interval)
+        # Set by the AccountPoller that drives this coordinator
+        self.poller: AccountPoller | None = None
         self._api_client = api_client
         self._device_info = device_info
         self._energy: PanasonicDeviceEnergy | None = None
         self._update_id = 0
+        self._backfill = EnergyBackfill(
+            hass,
+            device_info.id,
+            device_info.name,
+            ENERGY_STATISTICS,
+            self._async_fetch_energy_month,
+        )
         self._consecutive_failures = 0
         self._auth_failed = False
         self._last_error: FriendlyError | None = None
@@ -334,10 +1058,29 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
             sw_version=self._api_client.app_version,
         )
 
+    async def async_shutdown(self) -> None:
+        """Stop an energy history backfill in progress on unload."""
+        await super().async_shutdown()
+        self._backfill.async_cancel()
+
+    async def _async_fetch_energy_month(self, month: date) -> dict[date, dict[str, float | None]]:
+        """Return the daily consumption of one month for the energy backfill."""
+        history = await self._api_client.history(
+            self._device_info.id, constants.DataMode.Month, month.strftime("%Y%m%d")
+        )
+        days: dict[date, dict[str, float | None]] = {}
+        for item in (history or {}).get("parameters", {}).get("historyDataList", []):
+            day = parse_history_day(item.get("dataTime"))
+            if day is not None:
+                days[day] = {"energy": item.get("consumption")}
+        return days
+
     async def _async_update_data(self) -> int:
         """Fetch energy data from API."""
         if self._auth_failed:
             raise UpdateFailed("Authentication failed — coordinator disabled")
+        # Closed days missed while Home Assistant was down go to the statistics
+        self._backfill.async_schedule()
 
         try:
             if self._energy is None:
@@ -364,6 +1107,17 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
             raise UpdateFailed(f"{friendly.title}: {friendly.message}") from err
         return self._update_id
 
+    @callback
+    def async_set_poll_options(self, config: dict) -> None:
+        """Apply a changed energy fetch interval without recreating the coordinator."""
+        self._base_interval = config.get(
+            CONF_ENERGY_FETCH_INTERVAL, DEFAULT_ENERGY_FETCH_INTERVAL
+        )
+        if self._consecutive_failures == 0:
+            self.poll_interval = timedelta(seconds=self._base_interval)
+            if self.poller is not None:
+                self.poller.async_reschedule(self)
+
     def _reset_backoff(self) -> None:
         """Reset circuit breaker and restore base polling interval."""
         if self._consecutive_failures > 0:
@@ -374,18 +1128,32 @@ class PanasonicDeviceEnergyCoordinator(DataUpdateCoordinator[int]):
             )
         self._consecutive_failures = 0
         self._last_error = None
-        self.update_interval = timedelta(seconds=self._base_interval)
+        self.poll_interval = timedelta(seconds=self._base_interval)
 
     def _handle_failure(self, err: Exception | None = None) -> None:
-        """Handle API failure with exponential backoff."""
+        """Handle API failure with the backoff policy of its error category."""
         self._consecutive_failures += 1
+        friendly = classify_error(err) if err is not None else None
+        if friendly is not None:
+            self._last_error = friendly
+        policy = backoff_policy(friendly)
+        if friendly is not None and policy.account_wide:
+            # The account poller backs off every device at once for these
+            _LOGGER.warning(
+                "%s Energy API failure %d/%d — %s: %s — left to the account poller",
+                self._device_info.name,
+                self._consecutive_failures,
+                MAX_CONSECUTIVE_FAILURES,
+                friendly.title,
+                friendly.message,
+            )
+            return
         new_interval = min(
-            self._base_interval * (BACKOFF_MULTIPLIER ** self._consecutive_failures),
-            MAX_UPDATE_INTERVAL,
+            self._base_interval * (policy.multiplier ** self._consecutive_failures),
+            policy.max_interval,
         )
-        self.update_interval = timedelta(seconds=new_interval)
+        self.poll_interval = timedelta(seconds=new_interval)
         if err is not None:
-            self._last_error = classify_error(err)
             _LOGGER.warning(
                 "%s Energy API failure %d/%d — %s: %s — polling interval increased to %ds",
                 self._device_info.name,
@@ -15,10 +15,8 @@ from homeassistant.components.number import (
 
 from aio_panasonic_comfort_cloud import PanasonicDevice, PanasonicDeviceZone, ChangeRequestBuilder
 
-from ..const import DOMAIN
-from .base import PanasonicDataEntity
-from .coordinator import PanasonicDeviceCoordinator
-from .const import DATA_COORDINATORS
+from .base import PanasonicDataEntity, async_add_device_entities
+from .coordinator import PanasonicDeviceCoordinator, find_zone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,8 +25,9 @@ _LOGGER = logging.getLogger(__name__)
 class PanasonicNumberEntityDescription(NumberEntityDescription):
     """Describes a Panasonic number entity."""
 
-    get_value: Callable[[PanasonicDevice], int]
+    get_value: Callable[[PanasonicDevice], int | None]
     set_value: Callable[[ChangeRequestBuilder, int], ChangeRequestBuilder]
+    depends_on: tuple[str, ...] | None = None
 
 
 def create_zone_damper_description(zone: PanasonicDeviceZone) -> PanasonicNumberEntityDescription:
@@ -43,8 +42,11 @@ def create_zone_damper_description(zone: PanasonicDeviceZone) -> PanasonicNumber
         native_min_value=0,
         native_step=10,
         mode=NumberMode.SLIDER,
-        get_value=lambda device, z=zone: z.level,
-        set_value=lambda builder, value, z=zone: builder.set_zone_damper(z.id, value),
+        get_value=lambda device, z=zone.id: (
+            found.level if (found := find_zone(device, z)) is not None else None
+        ),
+        set_value=lambda builder, value, z=zone.id: builder.set_zone_damper(z, value),
+        depends_on=(f"parameters.zones[{zone.id}].level",),
     )
 
 
@@ -54,9 +56,9 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Panasonic number entities."""
-    devices = []
-    data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
-    for data_coordinator in data_coordinators:
+
+    def _create_entities(data_coordinator: PanasonicDeviceCoordinator) -> list[PanasonicNumberEntity]:
+        devices = []
         if data_coordinator.device.has_zones:
             for zone in data_coordinator.device.parameters.zones:
                 devices.append(
@@ -64,8 +66,9 @@ async def async_setup_entry(
                         data_coordinator, create_zone_damper_description(zone)
                     )
                 )
+        return devices
 
-    async_add_entities(devices)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
 
 class PanasonicNumberEntity(PanasonicDataEntity, NumberEntity):
@@ -80,7 +83,7 @@ class PanasonicNumberEntity(PanasonicDataEntity, NumberEntity):
     ) -> None:
         """Initialize the number entity."""
         self.entity_description = description
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
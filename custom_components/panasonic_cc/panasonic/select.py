@@ -11,10 +11,8 @@ from homeassistant.components.select import SelectEntity, SelectEntityDescriptio
 
 from aio_panasonic_comfort_cloud import PanasonicDevice, ChangeRequestBuilder, constants
 
-from ..const import DOMAIN
-from .base import PanasonicDataEntity
+from .base import PanasonicDataEntity, async_add_device_entities
 from .coordinator import PanasonicDeviceCoordinator
-from .const import DATA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +25,7 @@ class PanasonicSelectEntityDescription(SelectEntityDescription):
     get_current_option: Callable[[PanasonicDevice], str]
     is_available: Callable[[PanasonicDevice], bool]
     get_options: Callable[[PanasonicDevice], list[str]] | None = None
+    depends_on: tuple[str, ...] | None = None
 
 
 HORIZONTAL_SWING_DESCRIPTION = PanasonicSelectEntityDescription(
@@ -42,6 +41,7 @@ HORIZONTAL_SWING_DESCRIPTION = PanasonicSelectEntityDescription(
     set_option=lambda builder, new_value: builder.set_horizontal_swing(new_value),
     get_current_option=lambda device: device.parameters.horizontal_swing_mode.name,
     is_available=lambda device: device.has_horizontal_swing,
+    depends_on=("parameters.horizontal_swing_mode",),
 )
 VERTICAL_SWING_DESCRIPTION = PanasonicSelectEntityDescription(
     key="vertical_swing",
@@ -56,6 +56,7 @@ VERTICAL_SWING_DESCRIPTION = PanasonicSelectEntityDescription(
     set_option=lambda builder, new_value: builder.set_vertical_swing(new_value),
     get_current_option=lambda device: device.parameters.vertical_swing_mode.name,
     is_available=lambda device: True,
+    depends_on=("parameters.vertical_swing_mode",),
 )
 
 
@@ -65,13 +66,14 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Panasonic select entities."""
-    entities = []
-    data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
-    for coordinator in data_coordinators:
-        entities.append(PanasonicSelectEntity(coordinator, HORIZONTAL_SWING_DESCRIPTION))
-        entities.append(PanasonicSelectEntity(coordinator, VERTICAL_SWING_DESCRIPTION))
 
-    async_add_entities(entities)
+    def _create_entities(coordinator: PanasonicDeviceCoordinator) -> list[PanasonicSelectEntity]:
+        return [
+            PanasonicSelectEntity(coordinator, HORIZONTAL_SWING_DESCRIPTION),
+            PanasonicSelectEntity(coordinator, VERTICAL_SWING_DESCRIPTION),
+        ]
+
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
 
 class PanasonicSelectEntity(PanasonicDataEntity, SelectEntity):
@@ -88,12 +90,12 @@ class PanasonicSelectEntity(PanasonicDataEntity, SelectEntity):
         self.entity_description = description
         if description.get_options is not None:
             self._attr_options = description.get_options(coordinator.device)
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.entity_description.is_available(self.coordinator.device)
+        return not self.is_stale and self.entity_description.is_available(self.coordinator.device)
 
     async def async_select_option(self, option: str) -> None:
         """Select a new option."""
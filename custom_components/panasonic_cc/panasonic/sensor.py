@@ -5,7 +5,7 @@ from datetime import datetime
 import logging
 from typing import Any
 
-from homeassistant.const import UnitOfEnergy, UnitOfTemperature, EntityCategory
+from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfTime, EntityCategory
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
@@ -17,10 +17,13 @@ from homeassistant.config_entries import ConfigEntry
 
 from aio_panasonic_comfort_cloud import PanasonicDevice, PanasonicDeviceEnergy, PanasonicDeviceZone, constants
 
-from ..const import DOMAIN
-from .base import PanasonicDataEntity, PanasonicEnergyEntity
-from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator
-from .const import DATA_COORDINATORS, ENERGY_COORDINATORS
+from .base import (
+    PanasonicDataEntity,
+    PanasonicEnergyEntity,
+    async_add_device_entities,
+    async_add_energy_entities,
+)
+from .coordinator import PanasonicDeviceCoordinator, PanasonicDeviceEnergyCoordinator, find_zone
 from ..error_handler import ErrorCategory
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +33,7 @@ class PanasonicSensorEntityDescription(SensorEntityDescription):
     """Describes Panasonic sensor entity."""
     get_state: Callable[[PanasonicDevice], Any] | None = None
     is_available: Callable[[PanasonicDevice], bool] | None = None
+    depends_on: tuple[str, ...] | None = None
 
 @dataclass(frozen=True, kw_only=True)
 class PanasonicEnergySensorEntityDescription(SensorEntityDescription):
@@ -46,6 +50,7 @@ INSIDE_TEMPERATURE_DESCRIPTION = PanasonicSensorEntityDescription(
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     get_state=lambda device: device.parameters.inside_temperature,
     is_available=lambda device: device.parameters.inside_temperature is not None,
+    depends_on=("parameters.inside_temperature",),
 )
 OUTSIDE_TEMPERATURE_DESCRIPTION = PanasonicSensorEntityDescription(
     key="outside_temperature",
@@ -57,6 +62,7 @@ OUTSIDE_TEMPERATURE_DESCRIPTION = PanasonicSensorEntityDescription(
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     get_state=lambda device: device.parameters.outside_temperature,
     is_available=lambda device: device.parameters.outside_temperature is not None,
+    depends_on=("parameters.outside_temperature",),
 )
 LAST_UPDATE_TIME_DESCRIPTION = PanasonicSensorEntityDescription(
     key="last_update",
@@ -83,6 +89,19 @@ DATA_AGE_DESCRIPTION = PanasonicSensorEntityDescription(
     get_state=lambda device: device.timestamp,
     is_available=lambda device: device.info.status_data_mode == constants.StatusDataMode.CACHED,
     entity_registry_enabled_default=False,
+    depends_on=("info.status_data_mode", "timestamp"),
+)
+STATUS_AGE_DESCRIPTION = SensorEntityDescription(
+    key="status_age",
+    translation_key="status_age",
+    name="Data Age",
+    icon="mdi:timer-sand",
+    device_class=SensorDeviceClass.DURATION,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+    suggested_display_precision=0,
+    entity_registry_enabled_default=False,
 )
 DATA_MODE_DESCRIPTION = PanasonicSensorEntityDescription(
     key="status_data_mode",
@@ -96,6 +115,7 @@ DATA_MODE_DESCRIPTION = PanasonicSensorEntityDescription(
     get_state=lambda device: device.info.status_data_mode.name,
     is_available=lambda device: True,
     entity_registry_enabled_default=True,
+    depends_on=("info.status_data_mode",),
 )
 
 # Connection status sensor options
@@ -186,39 +206,59 @@ def create_zone_temperature_description(zone: PanasonicDeviceZone):
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        get_state=lambda device: zone.temperature,
-        is_available=lambda device: zone.has_temperature
+        get_state=lambda device, z=zone.id: (
+            found.temperature if (found := find_zone(device, z)) is not None else None
+        ),
+        is_available=lambda device, z=zone.id: (
+            (found := find_zone(device, z)) is not None and found.has_temperature
+        ),
+        depends_on=(f"parameters.zones[{zone.id}]",),
     )
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     entities = []
-    data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][DATA_COORDINATORS]
-    energy_coordinators: list[PanasonicDeviceEnergyCoordinator] = hass.data[DOMAIN][ENERGY_COORDINATORS]
-
-    for coordinator in data_coordinators:
-        entities.append(PanasonicSensorEntity(coordinator, INSIDE_TEMPERATURE_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, OUTSIDE_TEMPERATURE_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, LAST_UPDATE_TIME_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, DATA_AGE_DESCRIPTION))
-        entities.append(PanasonicSensorEntity(coordinator, DATA_MODE_DESCRIPTION))
-        entities.append(PanasonicConnectionStatusSensor(coordinator))
+    data_coordinators: list[PanasonicDeviceCoordinator] = entry.runtime_data.data_coordinators
+    discovery = entry.runtime_data.data_discovery
+
+    def _create_entities(coordinator: PanasonicDeviceCoordinator) -> list[PanasonicSensorEntity]:
+        device_entities = [
+            PanasonicSensorEntity(coordinator, INSIDE_TEMPERATURE_DESCRIPTION),
+            PanasonicSensorEntity(coordinator, OUTSIDE_TEMPERATURE_DESCRIPTION),
+            PanasonicSensorEntity(coordinator, LAST_UPDATE_TIME_DESCRIPTION),
+            PanasonicSensorEntity(coordinator, DATA_AGE_DESCRIPTION),
+            PanasonicStatusAgeSensor(coordinator),
+            PanasonicSensorEntity(coordinator, DATA_MODE_DESCRIPTION),
+        ]
         if coordinator.device.has_zones:
             for zone in coordinator.device.parameters.zones:
-                entities.append(PanasonicSensorEntity(
+                device_entities.append(PanasonicSensorEntity(
                     coordinator,
                     create_zone_temperature_description(zone)))
+        return device_entities
 
-    for coordinator in energy_coordinators:
-        entities.append(PanasonicEnergySensorEntity(coordinator, DAILY_ENERGY_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, DAILY_COOLING_ENERGY_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, DAILY_HEATING_ENERGY_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, POWER_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, COOLING_POWER_DESCRIPTION))
-        entities.append(PanasonicEnergySensorEntity(coordinator, HEATING_POWER_DESCRIPTION))
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
+
+    # The connection status does not need device data, so devices that are
+    # still being discovered get it (unavailable) right away
+    pending_coordinators = discovery.pending if discovery is not None else []
+    for coordinator in [*data_coordinators, *pending_coordinators]:
+        entities.append(PanasonicConnectionStatusSensor(coordinator))
 
     async_add_entities(entities)
 
+    def _create_energy_entities(coordinator: PanasonicDeviceEnergyCoordinator) -> list[PanasonicEnergySensorEntity]:
+        return [
+            PanasonicEnergySensorEntity(coordinator, DAILY_ENERGY_DESCRIPTION),
+            PanasonicEnergySensorEntity(coordinator, DAILY_COOLING_ENERGY_DESCRIPTION),
+            PanasonicEnergySensorEntity(coordinator, DAILY_HEATING_ENERGY_DESCRIPTION),
+            PanasonicEnergySensorEntity(coordinator, POWER_DESCRIPTION),
+            PanasonicEnergySensorEntity(coordinator, COOLING_POWER_DESCRIPTION),
+            PanasonicEnergySensorEntity(coordinator, HEATING_POWER_DESCRIPTION),
+        ]
+
+    async_add_energy_entities(hass, entry, async_add_entities, _create_energy_entities)
+
 
 class PanasonicSensorEntityBase(SensorEntity):
     """Base class for all sensor entities."""
@@ -235,11 +275,13 @@ class PanasonicSensorEntity(PanasonicDataEntity, PanasonicSensorEntityBase):
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description  # type: ignore[reportIncompatibleVariableOverride]
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     @property  # type: ignore[reportIncompatibleOverride]
     def available(self) -> bool:
         """Return if entity is available."""
+        if self.is_stale:
+            return False
         if self.entity_description.is_available is None:
             return True
         return self.entity_description.is_available(self.coordinator.device)
@@ -279,6 +321,38 @@ class PanasonicEnergySensorEntity(PanasonicEnergyEntity, SensorEntity):
         self._attr_native_value = value  # type: ignore[assignment]
 
 
+class PanasonicStatusAgeSensor(PanasonicDataEntity, SensorEntity):
+    """Sensor that reports how long ago the cloud last observed the device state.
+
+    The age grows between polls, so unlike the other sensors it is also
+    recomputed on Home Assistant's entity polling; that only reads the
+    freshness the coordinator already tracks and sends no request.
+    """
+
+    def __init__(self, coordinator: PanasonicDeviceCoordinator) -> None:
+        """Initialize the data age sensor."""
+        self.entity_description = STATUS_AGE_DESCRIPTION
+        super().__init__(coordinator, STATUS_AGE_DESCRIPTION.key)
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll to keep the age current between coordinator updates."""
+        return True
+
+    async def async_update(self) -> None:
+        """Recompute the age without refreshing the coordinator."""
+        self._async_update_attrs()
+
+    def _async_update_attrs(self) -> None:
+        """Update the attributes of the sensor."""
+        self._attr_native_value = self.coordinator.freshness.age()
+        observed_at = self.coordinator.freshness.observed_at
+        self._attr_extra_state_attributes = {
+            "observed_at": observed_at.isoformat() if observed_at is not None else None,
+            "max_staleness": self.coordinator.freshness.max_staleness,
+        }
+
+
 class PanasonicConnectionStatusSensor(PanasonicDataEntity, SensorEntity):
     """Sensor that reports the connection status and error information for a Panasonic device."""
 
@@ -301,6 +375,8 @@ class PanasonicConnectionStatusSensor(PanasonicDataEntity, SensorEntity):
         # Build extra attributes with error details
         attrs = {}
         attrs["consecutive_failures"] = self.coordinator._consecutive_failures
+        attrs["pending_commands"] = self.coordinator.pending_commands
+        attrs["pending_command_attempts"] = self.coordinator.pending_command_attempts
 
         if self.coordinator.last_error is not None:
             err = self.coordinator.last_error
@@ -22,11 +22,9 @@ from aio_panasonic_comfort_cloud import (
 from ..const import (
     CONF_FORCE_ENABLE_NANOE,
     DEFAULT_FORCE_ENABLE_NANOE,
-    DOMAIN,
 )
-from .base import PanasonicDataEntity
-from .coordinator import PanasonicDeviceCoordinator
-from .const import DATA_COORDINATORS
+from .base import PanasonicDataEntity, async_add_device_entities
+from .coordinator import PanasonicDeviceCoordinator, find_zone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +37,7 @@ class PanasonicSwitchEntityDescription(SwitchEntityDescription):
     off_func: Callable[[ChangeRequestBuilder], ChangeRequestBuilder]
     get_state: Callable[[PanasonicDevice], bool]
     is_available: Callable[[PanasonicDevice], bool]
+    depends_on: tuple[str, ...] | None = None
 
 
 NANOE_DESCRIPTION = PanasonicSwitchEntityDescription(
@@ -55,6 +54,7 @@ NANOE_DESCRIPTION = PanasonicSwitchEntityDescription(
         constants.NanoeMode.All,
     ],
     is_available=lambda device: device.has_nanoe,
+    depends_on=("parameters.nanoe_mode",),
 )
 ECONAVI_DESCRIPTION = PanasonicSwitchEntityDescription(
     key="eco-navi",
@@ -66,6 +66,7 @@ ECONAVI_DESCRIPTION = PanasonicSwitchEntityDescription(
     get_state=lambda device: device.parameters.eco_navi_mode
     == constants.EcoNaviMode.On,
     is_available=lambda device: device.has_eco_navi,
+    depends_on=("parameters.eco_navi_mode",),
 )
 ECO_FUNCTION_DESCRIPTION = PanasonicSwitchEntityDescription(
     key="eco-function",
@@ -81,6 +82,7 @@ ECO_FUNCTION_DESCRIPTION = PanasonicSwitchEntityDescription(
     get_state=lambda device: device.parameters.eco_function_mode
     == constants.EcoFunctionMode.On,
     is_available=lambda device: device.has_eco_function,
+    depends_on=("parameters.eco_function_mode",),
 )
 IAUTOX_DESCRIPTION = PanasonicSwitchEntityDescription(
     key="iauto-x",
@@ -93,6 +95,7 @@ IAUTOX_DESCRIPTION = PanasonicSwitchEntityDescription(
     == constants.IAutoXMode.On
     and device.parameters.mode == constants.OperationMode.Auto,
     is_available=lambda device: device.has_iauto_x,
+    depends_on=("parameters.iautox_mode", "parameters.mode"),
 )
 
 
@@ -109,11 +112,12 @@ def create_zone_mode_description(zone: PanasonicDeviceZone) -> PanasonicSwitchEn
         on_func=lambda builder, z=zone.id: builder.set_zone_mode(
             z, constants.ZoneMode.On
         ),
-        get_state=lambda device, z=zone.id: device.parameters.get_zone(
-            z
-        ).mode
-        == constants.ZoneMode.On,
-        is_available=lambda device: True,
+        get_state=lambda device, z=zone.id: (
+            (found := find_zone(device, z)) is not None
+            and found.mode == constants.ZoneMode.On
+        ),
+        is_available=lambda device, z=zone.id: find_zone(device, z) is not None,
+        depends_on=(f"parameters.zones[{zone.id}].mode",),
     )
 
 
@@ -123,14 +127,12 @@ async def async_setup_entry(
     async_add_entities: Any,
 ) -> None:
     """Set up the Panasonic switches."""
-    devices = []
-    data_coordinators: list[PanasonicDeviceCoordinator] = hass.data[DOMAIN][
-        DATA_COORDINATORS
-    ]
     force_enable_nanoe = entry.options.get(
         CONF_FORCE_ENABLE_NANOE, DEFAULT_FORCE_ENABLE_NANOE
     )
-    for data_coordinator in data_coordinators:
+
+    def _create_entities(data_coordinator: PanasonicDeviceCoordinator) -> list[PanasonicSwitchEntity]:
+        devices = []
         devices.append(
             PanasonicSwitchEntity(
                 data_coordinator, NANOE_DESCRIPTION, always_available=force_enable_nanoe
@@ -148,8 +150,9 @@ async def async_setup_entry(
                         data_coordinator, create_zone_mode_description(zone)
                     )
                 )
+        return devices
 
-    async_add_entities(devices)
+    async_add_device_entities(hass, entry, async_add_entities, _create_entities)
 
 
 class PanasonicSwitchEntity(PanasonicDataEntity, SwitchEntity):
@@ -167,11 +170,13 @@ class PanasonicSwitchEntity(PanasonicDataEntity, SwitchEntity):
         """Initialize the switch entity."""
         self.entity_description = description
         self._always_available = always_available
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.depends_on)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        if self.is_stale:
+            return False
         return self._always_available or self.entity_description.is_available(
             self.coordinator.device
         )
@@ -0,0 +1,264 @@
+"""Account-level request budget for the Panasonic Comfort Cloud API."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+# Tokens that can be spent back to back before the refill rate applies
+RATE_LIMIT_BURST = 10
+# Weight of the newest sample in the rolling average wait time
+WAIT_AVERAGE_WEIGHT = 0.2
+# Longest server-requested pause that is honoured
+RETRY_AFTER_MAX = 900  # seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority of a queued API request; lower values are served first."""
+    # Changes requested by a user, automation or service call
+    COMMAND = 0
+    # Follow-up fetches confirming the result of a command
+    REFRESH = 1
+    # Background polling of device state and energy
+    POLL = 2
+
+
+_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "panasonic_cc_request_priority", default=RequestPriority.COMMAND
+)
+
+
+def current_priority() -> RequestPriority:
+    """Return the priority of API requests made from the current task."""
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Issue every API request made inside the block at the given priority.
+
+    The priority lives in a context variable, so it follows the calling task
+    into the ApiClient without threading it through every library call.
+    Anything that does not set one is treated as a user command.
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class AccountRateLimiter:
+    """Token bucket shared by every API request made for one account.
+
+    The bucket refills at ``requests_per_minute`` and holds up to
+    ``RATE_LIMIT_BURST`` tokens. Requests that find it empty wait in a
+    priority queue, so a command issued while polls are backed up is sent
+    with the next free token instead of behind them.
+
+    When the server asks for a pause (a ``Retry-After`` header), no token is
+    handed out until it is over; queued commands and polls resume together.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str, requests_per_minute: int) -> None:
+        """Initialize the limiter."""
+        self._hass = hass
+        self._name = name
+        self._rate = requests_per_minute / 60
+        self._tokens = float(RATE_LIMIT_BURST)
+        self._last_refill = hass.loop.time()
+        self._resume_at = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._drain_task: asyncio.Task | None = None
+        self._listeners: dict[CALLBACK_TYPE, None] = {}
+        self._total_requests = 0
+        self._throttled_requests = 0
+        self._last_wait = 0.0
+        self._average_wait = 0.0
+
+    @property
+    def requests_per_minute(self) -> int:
+        """Return the configured request budget."""
+        return round(self._rate * 60)
+
+    @property
+    def resume_at(self) -> float:
+        """Return the loop time until which the server asked to be left alone."""
+        return self._resume_at
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @property
+    def last_wait(self) -> float:
+        """Return how long the last request waited for a token, in seconds."""
+        return self._last_wait
+
+    @property
+    def average_wait(self) -> float:
+        """Return the rolling average wait for a token, in seconds."""
+        return self._average_wait
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests that went through the limiter."""
+        return self._total_requests
+
+    @property
+    def throttled_requests(self) -> int:
+        """Return the number of requests that had to wait for a token."""
+        return self._throttled_requests
+
+    @callback
+    def async_set_budget(self, requests_per_minute: int) -> None:
+        """Change the refill rate; tokens accrued so far are kept."""
+        self._refill()
+        self._rate = requests_per_minute / 60
+
+    @callback
+    def async_defer(self, delay: float) -> None:
+        """Hold every request until the server's requested pause is over."""
+        delay = min(delay, RETRY_AFTER_MAX)
+        resume_at = self._hass.loop.time() + delay
+        if resume_at <= self._resume_at:
+            return
+        self._resume_at = resume_at
+        _LOGGER.debug("%s: server asked to retry after %.0fs", self._name, delay)
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for queue depth and wait time changes."""
+        self._listeners[update_callback] = None
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._listeners.pop(update_callback, None)
+
+        return remove_listener
+
+    async def async_acquire(self, priority: RequestPriority | None = None) -> None:
+        """Wait until the budget allows one more request."""
+        if priority is None:
+            priority = current_priority()
+        self._total_requests += 1
+        self._refill()
+        if (
+            not self._waiters
+            and self._tokens >= 1
+            and self._hass.loop.time() >= self._resume_at
+        ):
+            self._tokens -= 1
+            self._record_wait(0.0)
+            return
+
+        started = self._hass.loop.time()
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._throttled_requests += 1
+        _LOGGER.debug(
+            "%s: %s request queued behind %d other(s)",
+            self._name,
+            priority.name.lower(),
+            len(self._waiters) - 1,
+        )
+        self._start_drain()
+        self._async_notify_listeners()
+        try:
+            await future
+        finally:
+            # A cancelled waiter stays in the heap and is skipped when drained
+            self._record_wait(self._hass.loop.time() - started)
+
+    async def async_wait_ready(self) -> None:
+        """Wait until a request would be sent without queueing.
+
+        Nothing is reserved: callers wait here before taking a resource they
+        share with other accounts, such as a poll worker, so a pause or an
+        empty bucket on this account does not hold it.
+        """
+        while True:
+            self._refill()
+            now = self._hass.loop.time()
+            if now < self._resume_at:
+                delay = self._resume_at - now
+            elif self.queue_depth:
+                # Queued requests go first; one token later, look again
+                delay = 1 / self._rate
+            elif self._tokens >= 1:
+                return
+            else:
+                delay = (1 - self._tokens) / self._rate
+            await asyncio.sleep(delay)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop handing out tokens and fail any queued requests."""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        for _, _, future in self._waiters:
+            if not future.done():
+                future.cancel()
+        self._waiters.clear()
+        self._listeners.clear()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = self._hass.loop.time()
+        self._tokens = min(
+            float(RATE_LIMIT_BURST), self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def _record_wait(self, wait: float) -> None:
+        """Update the wait statistics with one sample."""
+        self._last_wait = wait
+        self._average_wait += WAIT_AVERAGE_WEIGHT * (wait - self._average_wait)
+        if wait > 0:
+            self._async_notify_listeners()
+
+    @callback
+    def _start_drain(self) -> None:
+        """Start releasing queued requests if nothing else is doing so."""
+        if self._drain_task is None and self._waiters:
+            self._drain_task = self._hass.async_create_background_task(
+                self._async_drain(), f"{self._name} rate limiter"
+            )
+
+    async def _async_drain(self) -> None:
+        """Release queued requests in priority order as tokens accrue."""
+        try:
+            while self._waiters:
+                if (pause := self._resume_at - self._hass.loop.time()) > 0:
+                    await asyncio.sleep(pause)
+                    continue
+                self._refill()
+                while self._waiters and self._tokens >= 1:
+                    _, _, future = heapq.heappop(self._waiters)
+                    if future.done():
+                        continue
+                    self._tokens -= 1
+                    future.set_result(None)
+                if self._waiters:
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+        finally:
+            self._drain_task = None
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Call every listener."""
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,194 @@
+"""Latency and outcome statistics of the requests made to the Panasonic cloud."""
+from __future__ import annotations
+
+import json
+import math
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from aiohttp import ClientResponse
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .error_handler import ErrorCategory, classify_error
+
+# Latency samples kept per series for the rolling percentiles
+REQUEST_STATS_SAMPLES = 100
+# Requests not made on behalf of one device (login, device list) are kept under this key
+ACCOUNT_STATS_KEY = "account"
+
+_request_device: ContextVar[str | None] = ContextVar(
+    "panasonic_cc_request_device", default=None
+)
+
+
+@contextmanager
+def request_device(device_id: str) -> Iterator[None]:
+    """Attribute every API request made inside the block to a device."""
+    token = _request_device.set(device_id)
+    try:
+        yield
+    finally:
+        _request_device.reset(token)
+
+
+def payload_size(payload: Any) -> int:
+    """Return the approximate size in bytes of a request or response payload.
+
+    The library hands back parsed JSON, so its compact re-serialised length
+    stands in for the bytes on the wire.
+    """
+    if payload is None:
+        return 0
+    if isinstance(payload, ClientResponse):
+        return payload.content_length or 0
+    return len(json.dumps(payload, separators=(",", ":")))
+
+
+def percentile(samples: Iterable[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of the samples, or None without any."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class LatencyStats:
+    """Rolling latency samples and outcome counts of one series of requests."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.samples: deque[float] = deque(maxlen=REQUEST_STATS_SAMPLES)
+        self.successes = 0
+        self.errors: Counter[ErrorCategory] = Counter()
+        self.bytes = 0
+
+    def record(self, latency: float, error: ErrorCategory | None = None, size: int = 0) -> None:
+        """Record the outcome of one request."""
+        self.samples.append(latency)
+        self.bytes += size
+        if error is None:
+            self.successes += 1
+        else:
+            self.errors[error] += 1
+
+    def percentiles(self) -> dict[str, float | None]:
+        """Return the rolling latency percentiles in milliseconds."""
+        return {
+            "p50_ms": _milliseconds(percentile(self.samples, 0.5)),
+            "p95_ms": _milliseconds(percentile(self.samples, 0.95)),
+            "p99_ms": _milliseconds(percentile(self.samples, 0.99)),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for attributes and diagnostics."""
+        return {
+            **self.percentiles(),
+            "successes": self.successes,
+            "errors": {
+                category.name.lower(): count for category, count in self.errors.items()
+            },
+            "bytes": self.bytes,
+        }
+
+
+class DeviceRequestStats:
+    """Request statistics of one device, per endpoint, and its update latency.
+
+    The update latency runs from the start of a poll to the moment the
+    changed state has been written, so it includes the rate limiter wait,
+    the request itself and every listener the coordinator called.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.endpoints: dict[str, LatencyStats] = defaultdict(LatencyStats)
+        self.updates = LatencyStats()
+
+    def latency_percentile(self, fraction: float) -> float | None:
+        """Return a latency percentile across every endpoint, in milliseconds."""
+        return _milliseconds(
+            percentile(
+                (sample for stats in self.endpoints.values() for sample in stats.samples),
+                fraction,
+            )
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for attributes and diagnostics."""
+        return {
+            "endpoints": {
+                endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()
+            },
+            "update_latency": {
+                **self.updates.percentiles(),
+                "updates": self.updates.successes,
+            },
+        }
+
+
+class RequestStats:
+    """Latency and outcome statistics of every request on one account.
+
+    The ApiClient records each request against the device set with
+    ``request_device`` and the endpoint the library names it by, and the
+    poller records how long each changed poll took to reach the state
+    machine. Listeners registered per device are called after each record.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self._devices: dict[str, DeviceRequestStats] = defaultdict(DeviceRequestStats)
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = defaultdict(list)
+
+    def device(self, device_id: str) -> DeviceRequestStats:
+        """Return the statistics of a device."""
+        return self._devices[device_id]
+
+    @callback
+    def async_add_listener(self, device_id: str, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for new records of a device."""
+        self._listeners[device_id].append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners[device_id].remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_record_request(
+        self,
+        endpoint: str,
+        latency: float,
+        error: Exception | None = None,
+        size: int = 0,
+    ) -> None:
+        """Record one request made from the current task."""
+        device_id = _request_device.get() or ACCOUNT_STATS_KEY
+        category = classify_error(error).category if error is not None else None
+        self._devices[device_id].endpoints[endpoint].record(latency, category, size)
+        self._async_notify_listeners(device_id)
+
+    @callback
+    def async_record_update(self, device_id: str, latency: float) -> None:
+        """Record the time from the start of a poll to its state write."""
+        self._devices[device_id].updates.record(latency)
+        self._async_notify_listeners(device_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of every device for diagnostics."""
+        return {device_id: stats.as_dict() for device_id, stats in self._devices.items()}
+
+    @callback
+    def _async_notify_listeners(self, device_id: str) -> None:
+        """Call the listeners of a device."""
+        for update_callback in list(self._listeners.get(device_id, ())):
+            update_callback()
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert a latency to rounded milliseconds."""
+    return round(seconds * 1000, 1) if seconds is not None else None
@@ -0,0 +1,100 @@
+"""Runtime data of one Panasonic Comfort Cloud config entry."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+
+if TYPE_CHECKING:
+    from .api_client import PanasonicApiClient
+    from .aquarea.coordinator import AquareaConsumptionCoordinator, AquareaDeviceCoordinator
+    from .discovery import DeviceDiscovery
+    from .hws.coordinator import HwsDeviceCoordinator
+    from .panasonic.coordinator import (
+        PanasonicDeviceCoordinator,
+        PanasonicDeviceEnergyCoordinator,
+    )
+    from .rate_limiter import AccountRateLimiter
+    from .request_stats import RequestStats
+    from .scheduler import AccountPoller
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PanasonicRuntimeData:
+    """Everything one account runs, kept on its config entry.
+
+    Each entry has its own client, rate limiter, poller and coordinators, so
+    several accounts can be set up side by side; the slices fill in their
+    coordinator lists during setup and the platforms read them from here.
+    ``async_shutdown`` is the single place that stops all of it on unload.
+    """
+    api: PanasonicApiClient
+    rate_limiter: AccountRateLimiter
+    poller: AccountPoller
+    data_coordinators: list[PanasonicDeviceCoordinator] = field(default_factory=list)
+    energy_coordinators: list[PanasonicDeviceEnergyCoordinator] = field(default_factory=list)
+    data_discovery: DeviceDiscovery | None = None
+    aquarea_coordinators: list[AquareaDeviceCoordinator] = field(default_factory=list)
+    aquarea_energy_coordinators: list[AquareaConsumptionCoordinator] = field(default_factory=list)
+    aquarea_discovery: DeviceDiscovery | None = None
+    hws_coordinators: list[HwsDeviceCoordinator] = field(default_factory=list)
+    hws_discovery: DeviceDiscovery | None = None
+    # Options currently applied, to tell which ones an options update changed
+    options: dict[str, Any] = field(default_factory=dict)
+    # Login, discovery and first refreshes; what a cold start costs
+    setup_duration: float | None = None
+
+    @property
+    def request_stats(self) -> RequestStats:
+        """Return the request statistics of the account."""
+        return self.api.request_stats
+
+    @property
+    def device_coordinators(self) -> list:
+        """Return the device coordinators of every slice."""
+        return [
+            *self.data_coordinators,
+            *self.aquarea_coordinators,
+            *self.hws_coordinators,
+        ]
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, cancel the work of every coordinator and drop them.
+
+        Devices still being discovered are shut down too, so nothing started
+        by this entry keeps running or polling after it unloads.
+        """
+        self.poller.async_stop()
+        coordinators = [
+            *self.device_coordinators,
+            *self.energy_coordinators,
+            *self.aquarea_energy_coordinators,
+        ]
+        for discovery in (self.data_discovery, self.aquarea_discovery, self.hws_discovery):
+            if discovery is not None:
+                coordinators.extend(discovery.pending)
+                discovery.async_shutdown()
+        results = await asyncio.gather(
+            *(coordinator.async_shutdown() for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(coordinators, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to shut down %s: %s", coordinator.name, result)
+        self.data_coordinators = []
+        self.energy_coordinators = []
+        self.data_discovery = None
+        self.aquarea_coordinators = []
+        self.aquarea_energy_coordinators = []
+        self.aquarea_discovery = None
+        self.hws_coordinators = []
+        self.hws_discovery = None
+        _LOGGER.debug("Released %d coordinator(s)", len(coordinators))
+
+
+PanasonicConfigEntry = ConfigEntry[PanasonicRuntimeData]
@@ -0,0 +1,621 @@
+"""Account-level poll scheduling for Panasonic Comfort Cloud coordinators."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import weakref
+import zlib
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .error_handler import backoff_policy
+from .rate_limiter import AccountRateLimiter, RequestPriority, request_priority
+from .request_stats import RequestStats, request_device
+
+# Maximum number of device fetches in flight at once, across every account
+POLL_WORKER_LIMIT = 4
+# Coordinators falling due within this many seconds of each other share a cycle
+POLL_BATCH_WINDOW = 5.0
+# Each poll is moved by up to this fraction of its interval, either way
+POLL_JITTER_FRACTION = 0.1
+# Weight of the newest refresh in a coordinator's rolling change rate
+CHANGE_RATE_WEIGHT = 0.3
+# Poll at the minimum interval for this long after a user command
+COMMAND_FOLLOW_UP_PERIOD = 300  # seconds
+# Idle devices are polled this many times less often than active ones
+IDLE_INTERVAL_FACTOR = 4
+# Roughly how often the cloud refreshes the status it serves from its cache
+CACHED_STATUS_PERIOD = 60  # seconds
+# Slack after the cached status is due, so a jittered follow-up does not arrive early
+CACHED_FOLLOW_UP_MARGIN = 10  # seconds
+# Each live poll in a row without a change stretches the interval by this much
+QUIET_POLL_STEP = 0.25
+# Up to this multiple of the adaptive interval
+QUIET_POLL_MAX_FACTOR = 2.0
+# Number of recent polling cycles summarised in diagnostics
+POLL_STATS_HISTORY = 50
+# Consecutive account-wide poll failures that open the circuit
+BREAKER_FAILURE_THRESHOLD = 5
+# How long the circuit stays open before a canary poll probes the cloud
+BREAKER_OPEN_INITIAL = 60  # seconds
+# The open period doubles after every failed probe, up to this
+BREAKER_OPEN_MAX = 900  # seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every coordinator a poller has driven, for as long as anything still holds it;
+# more of them than are registered means an unloaded entry was not released
+_LIVE_COORDINATORS: weakref.WeakSet[DataUpdateCoordinator] = weakref.WeakSet()
+
+
+def poll_phase(coordinator: DataUpdateCoordinator) -> float:
+    """Return a stable fraction in [0, 1) that places a coordinator in its interval.
+
+    It is derived from the coordinator type and device id, so a device keeps
+    the same slot across restarts and the device and energy coordinators of
+    one unit do not share it.
+    """
+    device_id = getattr(coordinator, "device_id", coordinator.name)
+    key = f"{type(coordinator).__name__}:{device_id}"
+    return zlib.crc32(key.encode()) / 2**32
+
+
+def _is_cloud_failure(coordinator: DataUpdateCoordinator) -> bool:
+    """Return True if a coordinator's last refresh failed for the whole account."""
+    if coordinator.last_update_success:
+        return False
+    last_error = getattr(coordinator, "last_error", None)
+    return last_error is not None and backoff_policy(last_error).account_wide
+
+
+@dataclass(frozen=True, kw_only=True)
+class PollCycleStats:
+    """What one polling cycle cost and what it changed."""
+    refreshed: int
+    updated: int
+    requests: int
+    duration: float
+
+
+class BreakerState(StrEnum):
+    """State of the account circuit breaker."""
+    # Polls run normally
+    CLOSED = "closed"
+    # The cloud is considered down; no polls run
+    OPEN = "open"
+    # One canary poll is probing whether the cloud is back
+    HALF_OPEN = "half_open"
+
+
+class AccountCircuitBreaker:
+    """Pause every poll on an account while the cloud keeps failing.
+
+    ``BREAKER_FAILURE_THRESHOLD`` polls in a row failing with an account-wide
+    error (server errors, rate limits, network), with no answer from the
+    cloud for any device in between, open the circuit. A device-level error
+    such as an unplugged unit is an answer and does not count. After the open period a single
+    canary poll is let through: if it succeeds the circuit closes, otherwise
+    it opens again for twice as long, up to ``BREAKER_OPEN_MAX``.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the breaker."""
+        self._name = name
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._open_duration = float(BREAKER_OPEN_INITIAL)
+        self._retry_at = 0.0
+
+    @property
+    def state(self) -> BreakerState:
+        """Return the state of the breaker."""
+        return self._state
+
+    @property
+    def retry_at(self) -> float:
+        """Return the loop time at which an open circuit lets a canary through."""
+        return self._retry_at
+
+    def try_half_open(self, now: float) -> bool:
+        """Move an open circuit to half-open once its open period is over."""
+        if self._state is BreakerState.OPEN and now >= self._retry_at:
+            self._state = BreakerState.HALF_OPEN
+            _LOGGER.debug("%s circuit half-open, probing the cloud", self._name)
+        return self._state is not BreakerState.OPEN
+
+    def record_success(self) -> bool:
+        """Record a successful poll; return True if it closed the circuit."""
+        self._failures = 0
+        if self._state is BreakerState.CLOSED:
+            return False
+        self._state = BreakerState.CLOSED
+        self._open_duration = float(BREAKER_OPEN_INITIAL)
+        _LOGGER.info("%s cloud responded again, resuming polling", self._name)
+        return True
+
+    def record_failure(self, now: float, retry_at: float | None = None) -> None:
+        """Record a failed poll, opening the circuit when the threshold is hit.
+
+        ``retry_at`` is the end of a pause the server asked for; when given,
+        the canary is sent then instead of after the open period.
+        """
+        self._failures += 1
+        if self._state is BreakerState.HALF_OPEN:
+            self._open_duration = min(self._open_duration * 2, BREAKER_OPEN_MAX)
+        elif self._state is BreakerState.OPEN or self._failures < BREAKER_FAILURE_THRESHOLD:
+            return
+        else:
+            _LOGGER.warning(
+                "%s %d polls failed in a row, pausing polling for %ds",
+                self._name,
+                self._failures,
+                self._open_duration,
+            )
+        self._state = BreakerState.OPEN
+        self._retry_at = retry_at if retry_at is not None else now + self._open_duration
+
+
+class AccountPoller:
+    """Drive the polling of every coordinator that belongs to one account.
+
+    Coordinators are created with ``update_interval=None`` so they do not run
+    their own timers. They expose ``poll_interval`` instead (and are handed
+    the poller as ``poller`` so they can ask for an earlier poll), and the
+    poller keeps one timer for the whole account: each wake-up collects every
+    coordinator that is due (plus any that fall due within
+    ``POLL_BATCH_WINDOW``), refreshes them through a bounded worker pool and
+    lets each coordinator fan the result out to its own listeners.
+
+    The timer and the worker pool belong to the domain ``PollScheduler``,
+    which every account's poller registers with: the poller only reports
+    when it is next due through ``next_due`` and runs its cycle when the
+    scheduler calls ``async_start_cycle``.
+
+    An ``AccountCircuitBreaker`` watches the outcome of every poll. While it
+    is open no cycle runs; the first cycle after the open period only polls
+    the coordinator that is due first, and once that canary succeeds every
+    coordinator is polled again in the next cycle.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        scheduler: PollScheduler,
+        rate_limiter: AccountRateLimiter | None = None,
+        request_stats: RequestStats | None = None,
+    ) -> None:
+        """Initialize the poller."""
+        self._hass = hass
+        self._name = name
+        self._scheduler = scheduler
+        self._rate_limiter = rate_limiter
+        self._request_stats = request_stats
+        self._cycle_stats: deque[PollCycleStats] = deque(maxlen=POLL_STATS_HISTORY)
+        self._breaker = AccountCircuitBreaker(name)
+        self._coordinators: list[DataUpdateCoordinator] = []
+        self._next_poll: dict[DataUpdateCoordinator, float] = {}
+        self._cycle_task: asyncio.Task | None = None
+        self._running = False
+        self._cycle_count = 0
+
+    @property
+    def coordinators(self) -> list[DataUpdateCoordinator]:
+        """Return the coordinators driven by this poller."""
+        return self._coordinators
+
+    @property
+    def cycle_count(self) -> int:
+        """Return the number of polling cycles run so far."""
+        return self._cycle_count
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of API requests made on the account so far."""
+        return self._rate_limiter.total_requests if self._rate_limiter is not None else 0
+
+    @property
+    def next_due(self) -> float | None:
+        """Return the loop time of the next cycle, or None if none is due."""
+        if not self._running or not self._next_poll or self._cycle_task is not None:
+            return None
+        next_due = min(self._next_poll.values())
+        if self._breaker.state is BreakerState.OPEN:
+            next_due = max(next_due, self._breaker.retry_at)
+        # Nothing is sent before a pause the server asked for is over
+        if self._rate_limiter is not None:
+            next_due = max(next_due, self._rate_limiter.resume_at)
+        return next_due
+
+    def get_stats(self) -> dict[str, Any]:
+        """Summarise the recent polling cycles for diagnostics.
+
+        Requests per cycle, state updates per cycle and cycle duration are
+        the numbers to compare before and after a change to the polling.
+        """
+        cycles = list(self._cycle_stats)
+        stats: dict[str, Any] = {
+            "coordinators": len(self._coordinators),
+            "circuit": self._breaker.state,
+            "cycle_count": self._cycle_count,
+            "recent_cycles": len(cycles),
+        }
+        if not cycles:
+            return stats
+        stats["average_refreshed_per_cycle"] = round(
+            sum(cycle.refreshed for cycle in cycles) / len(cycles), 2
+        )
+        stats["average_updated_per_cycle"] = round(
+            sum(cycle.updated for cycle in cycles) / len(cycles), 2
+        )
+        stats["average_duration"] = round(
+            sum(cycle.duration for cycle in cycles) / len(cycles), 3
+        )
+        stats["max_duration"] = round(max(cycle.duration for cycle in cycles), 3)
+        if self._rate_limiter is not None:
+            stats["average_requests_per_cycle"] = round(
+                sum(cycle.requests for cycle in cycles) / len(cycles), 2
+            )
+        return stats
+
+    @callback
+    def async_add_coordinators(self, coordinators: Iterable[DataUpdateCoordinator]) -> None:
+        """Register coordinators, spreading their first polls over one interval.
+
+        Every coordinator has just done its first refresh during setup, so
+        its first poll falls between half and one and a half intervals from
+        now, at the offset given by poll_phase. Coordinators that started
+        from persisted state instead are polled in the first cycle.
+        """
+        now = self._hass.loop.time()
+        for coordinator in coordinators:
+            if coordinator in self._next_poll:
+                continue
+            self._coordinators.append(coordinator)
+            _LIVE_COORDINATORS.add(coordinator)
+            coordinator.poller = self
+            if getattr(coordinator, "restored_from_cache", False):
+                self._next_poll[coordinator] = now + POLL_BATCH_WINDOW * poll_phase(coordinator)
+                continue
+            interval = coordinator.poll_interval.total_seconds()
+            self._next_poll[coordinator] = now + interval * (0.5 + poll_phase(coordinator))
+        if self._running:
+            self._scheduler.async_schedule()
+
+    @callback
+    def async_remove_coordinators(self, coordinators: Iterable[DataUpdateCoordinator]) -> None:
+        """Stop polling coordinators that are being shut down."""
+        for coordinator in coordinators:
+            if self._next_poll.pop(coordinator, None) is None:
+                continue
+            self._coordinators.remove(coordinator)
+            coordinator.poller = None
+        if self._running:
+            self._scheduler.async_schedule()
+
+    @callback
+    def async_reschedule(self, coordinator: DataUpdateCoordinator) -> None:
+        """Bring a coordinator's next poll forward if its interval shrank."""
+        if coordinator not in self._next_poll:
+            return
+        due = self._hass.loop.time() + coordinator.poll_interval.total_seconds()
+        if due >= self._next_poll[coordinator]:
+            return
+        self._next_poll[coordinator] = due
+        if self._running:
+            self._scheduler.async_schedule()
+
+    @callback
+    def async_start(self) -> None:
+        """Register with the scheduler and start polling."""
+        self._running = True
+        self._scheduler.async_add_poller(self)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling, cancel any cycle in progress and let go of the coordinators."""
+        self._running = False
+        self._scheduler.async_remove_poller(self)
+        if self._cycle_task is not None:
+            self._cycle_task.cancel()
+            self._cycle_task = None
+        for coordinator in self._coordinators:
+            coordinator.poller = None
+        self._coordinators.clear()
+        self._next_poll.clear()
+
+    @callback
+    def async_start_cycle(self) -> None:
+        """Start a polling cycle; called by the scheduler when this poller is due."""
+        self._cycle_task = self._hass.async_create_background_task(
+            self._async_run_cycle(), f"{self._name} poll cycle"
+        )
+
+    async def _async_run_cycle(self) -> None:
+        """Refresh every due coordinator through the worker pool."""
+        try:
+            now = self._hass.loop.time()
+            if not self._breaker.try_half_open(now):
+                return
+            horizon = now + POLL_BATCH_WINDOW
+            due = [
+                coordinator
+                for coordinator in self._coordinators
+                if self._next_poll[coordinator] <= horizon
+            ]
+            if self._breaker.state is BreakerState.HALF_OPEN:
+                # Only the canary probes the cloud; the rest stay paused
+                due = [min(self._coordinators, key=self._next_poll.__getitem__)]
+            self._cycle_count += 1
+            _LOGGER.debug(
+                "%s poll cycle %d: refreshing %d of %d coordinator(s)",
+                self._name,
+                self._cycle_count,
+                len(due),
+                len(self._coordinators),
+            )
+            started = self._hass.loop.time()
+            requests_before = self.total_requests
+            data_before = [coordinator.data for coordinator in due]
+            await asyncio.gather(
+                *(self._async_poll(coordinator) for coordinator in due),
+                return_exceptions=True,
+            )
+            self._cycle_stats.append(
+                PollCycleStats(
+                    refreshed=len(due),
+                    # Device coordinators only move their data when the state changed
+                    updated=sum(
+                        1
+                        for coordinator, data in zip(due, data_before)
+                        if coordinator.data != data
+                    ),
+                    requests=self.total_requests - requests_before,
+                    duration=self._hass.loop.time() - started,
+                )
+            )
+        finally:
+            self._cycle_task = None
+            if self._running:
+                self._scheduler.async_schedule()
+
+    def _retry_at(self) -> float | None:
+        """Return the end of a pause the server asked for, if one is pending."""
+        if self._rate_limiter is None:
+            return None
+        resume_at = self._rate_limiter.resume_at
+        return resume_at if resume_at > self._hass.loop.time() else None
+
+    async def _async_poll(self, coordinator: DataUpdateCoordinator) -> None:
+        """Refresh one coordinator and compute its next due time."""
+        started = self._hass.loop.time()
+        data_before = coordinator.data
+        # The workers are shared by every account, so a pause or an empty
+        # bucket on this one is waited out before taking one
+        if self._rate_limiter is not None:
+            await self._rate_limiter.async_wait_ready()
+            if coordinator not in self._next_poll:
+                return
+        async with self._scheduler.workers:
+            try:
+                # Background polls yield to user commands in the rate limiter
+                with request_priority(RequestPriority.POLL), request_device(coordinator.device_id):
+                    await coordinator.async_refresh()
+                if _is_cloud_failure(coordinator):
+                    self._breaker.record_failure(self._hass.loop.time(), self._retry_at())
+                elif self._breaker.record_success():
+                    self._async_resume()
+                # The refresh has called every listener, so the new state is written
+                if self._request_stats is not None and coordinator.data != data_before:
+                    self._request_stats.async_record_update(
+                        coordinator.device_id, self._hass.loop.time() - started
+                    )
+            finally:
+                # Read the interval after the refresh so backoff applies immediately;
+                # the jitter keeps devices that share an interval from falling into step.
+                # A poller stopped during the refresh no longer tracks the coordinator.
+                if coordinator in self._next_poll:
+                    interval = coordinator.poll_interval.total_seconds()
+                    jitter = random.uniform(-POLL_JITTER_FRACTION, POLL_JITTER_FRACTION)
+                    delay = interval * (1 + jitter)
+                    # Jitter never takes a device below its configured minimum
+                    if (minimum := getattr(coordinator, "min_poll_interval", None)) is not None:
+                        delay = max(delay, minimum)
+                    self._next_poll[coordinator] = self._hass.loop.time() + delay
+
+    @callback
+    def _async_resume(self) -> None:
+        """Make every coordinator due once the circuit has closed.
+
+        They are spread over one batch window by their poll phase, so the
+        whole account comes back in the next cycle without a burst.
+        """
+        now = self._hass.loop.time()
+        for coordinator in self._coordinators:
+            self._next_poll[coordinator] = now + POLL_BATCH_WINDOW * poll_phase(coordinator)
+
+
+class PollScheduler:
+    """Run the polling of every account from one timer and one worker pool.
+
+    There is one scheduler per Home Assistant instance, shared by every
+    config entry. Each account keeps its own ``AccountPoller``, rate limiter
+    and coordinators, so accounts cannot touch each other's devices or
+    budgets; the scheduler only decides when each poller runs. Its single
+    timer fires for the account that is due first and starts the cycle of
+    every account due within ``POLL_BATCH_WINDOW`` of it, and all of them
+    draw from one pool of ``POLL_WORKER_LIMIT`` workers, so adding accounts
+    adds neither timers nor concurrent fetches. A poll only takes a worker
+    once its account's rate limiter would let a request through, so an
+    account that is throttled or paused never holds workers the others need.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._pollers: list[AccountPoller] = []
+        self._workers = asyncio.Semaphore(POLL_WORKER_LIMIT)
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def pollers(self) -> list[AccountPoller]:
+        """Return the pollers of every account."""
+        return self._pollers
+
+    @property
+    def workers(self) -> asyncio.Semaphore:
+        """Return the worker pool shared by every account."""
+        return self._workers
+
+    def get_stats(self) -> dict[str, Any]:
+        """Summarise the polling of every account for diagnostics.
+
+        ``live_coordinators`` counts the coordinators still in memory; if it
+        keeps growing past ``coordinators`` across reloads, something holds
+        on to the coordinators of unloaded entries.
+        """
+        return {
+            "accounts": len(self._pollers),
+            "coordinators": sum(len(poller.coordinators) for poller in self._pollers),
+            "live_coordinators": len(_LIVE_COORDINATORS),
+            "total_requests": sum(poller.total_requests for poller in self._pollers),
+        }
+
+    @callback
+    def async_add_poller(self, poller: AccountPoller) -> None:
+        """Register the poller of an account."""
+        if poller not in self._pollers:
+            self._pollers.append(poller)
+        self.async_schedule()
+
+    @callback
+    def async_remove_poller(self, poller: AccountPoller) -> None:
+        """Unregister the poller of an account, stopping the timer with the last one."""
+        if poller in self._pollers:
+            self._pollers.remove(poller)
+        self.async_schedule()
+
+    @callback
+    def async_schedule(self) -> None:
+        """Arm the timer for the account that is due first."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        due = [next_due for poller in self._pollers if (next_due := poller.next_due) is not None]
+        if not due:
+            return
+        delay = max(0.0, min(due) - self._hass.loop.time())
+        self._unsub_timer = async_call_later(
+            self._hass, delay, HassJob(self._handle_timer, cancel_on_shutdown=True)
+        )
+
+    @callback
+    def _handle_timer(self, _now) -> None:
+        """Start the cycle of every account that is due."""
+        self._unsub_timer = None
+        horizon = self._hass.loop.time() + POLL_BATCH_WINDOW
+        for poller in list(self._pollers):
+            if (next_due := poller.next_due) is not None and next_due <= horizon:
+                poller.async_start_cycle()
+        self.async_schedule()
+
+
+class AdaptivePollInterval:
+    """Choose a coordinator's poll interval from how busy its device is.
+
+    Right after a user command the device is polled at ``minimum`` so the
+    result shows up quickly. Otherwise an active device (powered on and
+    heating, cooling or drying) starts from ``base`` and an idle one from
+    ``base * IDLE_INTERVAL_FACTOR``. That value is then scaled by the rolling
+    share of polls that found a change: half the interval for a device that
+    changes on every poll, one and a half times it for one that never does.
+    Live polls in a row that found nothing new stretch it further.
+
+    Cached status says nothing about whether the device changed, so it does
+    not count towards the change rate. When a cached status is newer than the
+    previous one, the next poll is timed for when the cloud should have
+    refreshed it again; a cached status that stopped moving falls back to the
+    normal interval. The result is always kept between ``minimum`` and
+    ``maximum``.
+    """
+
+    def __init__(self, base: float, minimum: float, maximum: float) -> None:
+        """Initialize the interval."""
+        self._base = base
+        self._minimum = minimum
+        # Bounds saved before they were validated may be the wrong way round
+        self._maximum = max(maximum, minimum)
+        self._change_rate = 0.5
+        self._quiet_polls = 0
+        self._last_command: float | None = None
+        self._follow_up_at: float | None = None
+
+    @property
+    def change_rate(self) -> float:
+        """Return the rolling share of refreshes that found a change."""
+        return self._change_rate
+
+    def set_bounds(self, base: float, minimum: float, maximum: float) -> None:
+        """Change the base interval and the bounds."""
+        self._base = base
+        self._minimum = minimum
+        self._maximum = max(maximum, minimum)
+
+    @property
+    def minimum(self) -> float:
+        """Return the shortest interval the coordinator is polled at."""
+        return self._minimum
+
+    @property
+    def quiet_polls(self) -> int:
+        """Return the number of live refreshes in a row that found no change."""
+        return self._quiet_polls
+
+    def record_refresh(self, changed: bool) -> None:
+        """Record whether a successful refresh of live status found any change."""
+        self._change_rate += CHANGE_RATE_WEIGHT * (float(changed) - self._change_rate)
+        self._quiet_polls = 0 if changed else self._quiet_polls + 1
+        self._follow_up_at = None
+
+    def record_cached(self, age: float | None) -> None:
+        """Record a refresh that returned cached status.
+
+        ``age`` is how old the cached status was when it arrived, or None when
+        it is unknown or no newer than the previous one.
+        """
+        self._quiet_polls = 0
+        if age is None:
+            self._follow_up_at = None
+            return
+        delay = CACHED_STATUS_PERIOD - age % CACHED_STATUS_PERIOD + CACHED_FOLLOW_UP_MARGIN
+        self._follow_up_at = time.monotonic() + delay
+
+    def record_command(self) -> None:
+        """Record that a user command was just sent to the device."""
+        self._last_command = time.monotonic()
+
+    def interval(self, active: bool) -> timedelta:
+        """Return the interval until the next poll."""
+        if (
+            self._last_command is not None
+            and time.monotonic() - self._last_command < COMMAND_FOLLOW_UP_PERIOD
+        ):
+            seconds = self._minimum
+        else:
+            seconds = self._base if active else self._base * IDLE_INTERVAL_FACTOR
+            seconds *= 1.5 - self._change_rate
+            seconds *= min(1 + QUIET_POLL_STEP * self._quiet_polls, QUIET_POLL_MAX_FACTOR)
+        if self._follow_up_at is not None:
+            # Only ever brings the next poll forward
+            seconds = min(seconds, self._follow_up_at - time.monotonic())
+        return timedelta(seconds=min(max(seconds, self._minimum), self._maximum))
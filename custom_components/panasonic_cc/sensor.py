@@ -3,20 +3,53 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+from .account_sensor import (
+    ACCOUNT_RATE_LIMITER_SENSOR_DESCRIPTIONS,
+    DEVICE_REQUEST_STATS_SENSOR_DESCRIPTIONS,
+    AccountRateLimiterSensor,
+    DeviceRequestStatsSensor,
+)
 from .panasonic.sensor import async_setup_entry as panasonic_setup
 from .aquarea.sensor import async_setup_entry as aquarea_setup
 from .hws.sensor import async_setup_entry as hws_setup
+from .runtime_data import PanasonicConfigEntry
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: PanasonicConfigEntry,
     async_add_entities: Any,
 ) -> None:
     """Set up the sensor entities for Panasonic, Aquarea and HWS."""
     await panasonic_setup(hass, entry, async_add_entities)
     await aquarea_setup(hass, entry, async_add_entities)
     await hws_setup(hass, entry, async_add_entities)
+
+    runtime = entry.runtime_data
+    coordinators = runtime.device_coordinators
+    # Request statistics are kept per device, so every device gets its own
+    async_add_entities(
+        DeviceRequestStatsSensor(
+            runtime.request_stats,
+            coordinator.device_id,
+            coordinator.device_info,
+            description,
+        )
+        for coordinator in coordinators
+        for description in DEVICE_REQUEST_STATS_SENSOR_DESCRIPTIONS
+    )
+
+    # Account-wide diagnostics hang off the first device of whichever slice has one
+    if not coordinators:
+        return
+    async_add_entities(
+        AccountRateLimiterSensor(
+            runtime.rate_limiter,
+            coordinators[0].device_id,
+            coordinators[0].device_info,
+            description,
+        )
+        for description in ACCOUNT_RATE_LIMITER_SENSOR_DESCRIPTIONS
+    )
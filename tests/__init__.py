@@ -0,0 +1 @@
+"""Tests for the Panasonic Comfort Cloud integration."""
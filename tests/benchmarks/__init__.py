@@ -0,0 +1 @@
+"""Timing benchmarks, deselected by default; run with ``pytest -m benchmark -s``."""
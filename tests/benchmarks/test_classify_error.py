@@ -0,0 +1,50 @@
+"""Benchmark the error classifier with and without its cache."""
+from __future__ import annotations
+
+from timeit import timeit
+
+import pytest
+
+from custom_components.panasonic_cc.error_handler import (
+    _classify_error_string,
+    classify_error,
+)
+
+pytestmark = pytest.mark.benchmark
+
+# What an outage looks like: the same few failures over and over
+OUTAGE = [
+    Exception('{"code":5005,"message":"Adapter Communication error"}'),
+    Exception("Expected status code '200' but received '503'"),
+    Exception("Connection timed out"),
+    Exception("Cannot connect to host accsmart.panasonic.com:443 ssl:default"),
+]
+ROUNDS = 20_000
+
+
+def _per_call(classify, errors: list[Exception]) -> float:
+    """Return the mean time in microseconds of one classification."""
+    total = timeit(lambda: [classify(err) for err in errors], number=ROUNDS)
+    return total / (ROUNDS * len(errors)) * 1e6
+
+
+def _classify_uncached(err: Exception):
+    """Classify an error with a full scan, bypassing the cache."""
+    return _classify_error_string.__wrapped__(str(err), None)
+
+
+def test_repeated_errors() -> None:
+    """Compare classifying the repeated failures of an outage with and without the cache."""
+    uncached = _per_call(_classify_uncached, OUTAGE)
+    cached = _per_call(classify_error, OUTAGE)
+    print(f"\nrepeated errors: uncached {uncached:.2f} µs, cached {cached:.2f} µs per call")
+
+    assert cached < uncached
+
+
+def test_distinct_errors() -> None:
+    """Time classifying errors that are never seen twice, so the cache never hits."""
+    errors = [Exception(f"{err} (request {index})") for index, err in enumerate(OUTAGE * 250)]
+    _classify_error_string.cache_clear()
+    total = timeit(lambda: [classify_error(err) for err in errors], number=20)
+    print(f"\ndistinct errors: {total * 1e6 / (20 * len(errors)):.2f} µs per call")
@@ -0,0 +1,137 @@
+"""Measure what an account costs as it grows, against the mock cloud.
+
+For a growing number of devices this reports setup time, the requests and
+state writes of one polling cycle, and the memory each device takes, the
+numbers to compare before and after a change to setup or polling.
+"""
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.panasonic_cc.const import CONF_REQUEST_BUDGET
+
+from ..common import async_poll_account
+from ..mock_cloud import MockComfortCloud
+
+pytestmark = pytest.mark.benchmark
+
+# Every tenth device is an Aquarea unit, the rest air conditioners
+AQUAREA_SHARE = 10
+# Share of devices whose state moves between two polls
+CHANGED_SHARE = 10
+# Round trip of every request to the mock cloud, in seconds
+LATENCY = 0.005
+# High enough that the limiter never holds a request back
+BUDGET = 100_000
+# Measurement noise left out of the memory per device
+_IGNORED_TRACES = [
+    tracemalloc.Filter(False, "*/logging/*"),
+    tracemalloc.Filter(False, "*/_pytest/*"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+
+def _add_devices(cloud: MockComfortCloud, devices: int) -> None:
+    """Add a mix of air conditioners and Aquarea units."""
+    for index in range(devices):
+        if index % AQUAREA_SHARE == AQUAREA_SHARE - 1:
+            cloud.add_aquarea()
+        else:
+            cloud.add_air_conditioner()
+
+
+async def _async_setup(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
+    """Set up the account with a budget that never throttles."""
+    hass.config_entries.async_update_entry(config_entry, options={CONF_REQUEST_BUDGET: BUDGET})
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("devices", [10, 100, 300])
+async def test_setup_and_poll(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    devices: int,
+) -> None:
+    """Report setup time and what one polling cycle sends and writes."""
+    mock_cloud.latency = LATENCY
+    _add_devices(mock_cloud, devices)
+
+    started = time.perf_counter()
+    await _async_setup(hass, config_entry)
+    setup_time = time.perf_counter() - started
+    setup_requests = mock_cloud.total_requests
+    runtime = config_entry.runtime_data
+    assert len(runtime.device_coordinators) == devices
+
+    writes = 0
+
+    def count_write(event) -> None:
+        nonlocal writes
+        writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+
+    # Nothing changed in the cloud
+    requests = mock_cloud.total_requests
+    started = time.perf_counter()
+    await async_poll_account(hass, config_entry)
+    quiet_time = time.perf_counter() - started
+    quiet_requests = mock_cloud.total_requests - requests
+    quiet_writes = writes
+
+    # A share of the air conditioners report a new temperature
+    changed = 0
+    for index, device in enumerate(mock_cloud.devices.values()):
+        if device.kind == "ac" and index % CHANGED_SHARE == 0:
+            device.state["parameters"]["insideTemperature"] += 1
+            changed += 1
+    writes = 0
+    requests = mock_cloud.total_requests
+    await async_poll_account(hass, config_entry)
+    busy_requests = mock_cloud.total_requests - requests
+
+    print(
+        f"\n{devices} devices: setup {setup_time:.2f}s with {setup_requests} requests,"
+        f" {len(hass.states.async_all())} entities"
+        f"\n  quiet poll: {quiet_requests} requests, {quiet_writes} state writes,"
+        f" {quiet_time:.2f}s"
+        f"\n  poll with {changed} changed: {busy_requests} requests, {writes} state writes"
+    )
+    # One request per device and cycle, and only changed devices write state
+    assert quiet_requests == devices
+    assert quiet_writes == 0
+    assert busy_requests == devices
+    assert 0 < writes <= changed * 2
+
+
+@pytest.mark.parametrize("devices", [10, 100, 300])
+async def test_memory_per_device(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    devices: int,
+) -> None:
+    """Report the memory one device takes once the account is set up."""
+    _add_devices(mock_cloud, devices)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        await _async_setup(hass, config_entry)
+        await async_poll_account(hass, config_entry)
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+    finally:
+        tracemalloc.stop()
+
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"\n{devices} devices: {growth / devices / 1024:.1f} KiB per device")
@@ -0,0 +1,105 @@
+"""Reload an account over and over and watch what it leaves behind.
+
+Every reload should release the coordinators, tasks and timers of the entry
+it replaces, so memory, live coordinators and the requests a reload sends
+stay flat however often the entry is reloaded.
+"""
+from __future__ import annotations
+
+import gc
+import logging
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_platform, storage
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.panasonic_cc import scheduler
+from custom_components.panasonic_cc.const import CONF_REQUEST_BUDGET, DOMAIN
+
+from ..common import async_poll_account
+from ..mock_cloud import MockComfortCloud
+
+pytestmark = pytest.mark.benchmark
+
+DEVICES = 20
+RELOADS = 100
+SAMPLE_EVERY = 10
+# Allowed growth between the first and the last sample, in bytes per reload
+MAX_GROWTH_PER_RELOAD = 4096
+_IGNORED_TRACES = [
+    tracemalloc.Filter(False, "*/logging/*"),
+    tracemalloc.Filter(False, "*/_pytest/*"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+
+def _forget_harness_calls(aioclient_mock: AiohttpClientMocker) -> None:
+    """Drop the calls the mocks record, they keep every old Store and response alive."""
+    aioclient_mock.mock_calls.clear()
+    storage.Store._async_load.reset_mock()
+    storage.Store._async_write_data.reset_mock()
+    storage.Store.async_remove.reset_mock()
+
+
+async def test_reload_is_flat(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Report memory, live coordinators and requests across many reloads."""
+    for _ in range(DEVICES):
+        mock_cloud.add_air_conditioner()
+    hass.config_entries.async_update_entry(config_entry, options={CONF_REQUEST_BUDGET: 100_000})
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    samples: list[tuple[int, int, int, int]] = []
+    # Captured log records, and what they log, are kept for the test report
+    logging.disable(logging.INFO)
+    tracemalloc.start()
+    try:
+        for reload in range(1, RELOADS + 1):
+            requests = mock_cloud.total_requests
+            platforms = entity_platform.async_get_platforms(hass, DOMAIN)
+            unloaded = list(platforms)
+            assert await hass.config_entries.async_reload(config_entry.entry_id)
+            await hass.async_block_till_done()
+            # Home Assistant resets the platforms of an unloaded entry but keeps
+            # them listed, empty, which is not ours to measure
+            for platform in unloaded:
+                platforms.remove(platform)
+            await async_poll_account(hass, config_entry)
+            _forget_harness_calls(aioclient_mock)
+            if reload % SAMPLE_EVERY:
+                continue
+            gc.collect()
+            memory = sum(
+                stat.size
+                for stat in tracemalloc.take_snapshot()
+                .filter_traces(_IGNORED_TRACES)
+                .statistics("filename")
+            )
+            samples.append(
+                (reload, memory, len(scheduler._LIVE_COORDINATORS), mock_cloud.total_requests - requests)
+            )
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+
+    print()
+    for reload, memory, live, requests in samples:
+        print(
+            f"reload {reload:3d}: {memory / 1024:8.0f} KiB traced,"
+            f" {live} live coordinators, {requests} requests"
+        )
+    first, last = samples[0], samples[-1]
+    growth = (last[1] - first[1]) / (last[0] - first[0])
+    print(f"growth: {growth:.0f} bytes per reload")
+
+    assert all(live == DEVICES for _, _, live, _ in samples)
+    assert len({requests for *_, requests in samples}) == 1
+    assert growth < MAX_GROWTH_PER_RELOAD
@@ -0,0 +1,64 @@
+"""Shared helpers for the Panasonic Comfort Cloud tests."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.panasonic_cc.error_handler import FriendlyError
+from custom_components.panasonic_cc.rate_limiter import AccountRateLimiter
+from custom_components.panasonic_cc.runtime_data import PanasonicConfigEntry
+
+
+class FakeCoordinator:
+    """Stand in for a device coordinator as far as the poll scheduler sees it.
+
+    Every refresh spends ``requests`` tokens of the account's rate limiter,
+    the way a device fetch goes through the ApiClient, then waits
+    ``latency`` seconds for the response. While ``error`` is set the
+    refresh fails with it.
+    """
+
+    def __init__(
+        self,
+        device_id: str,
+        rate_limiter: AccountRateLimiter | None = None,
+        interval: float = 60,
+        requests: int = 1,
+        latency: float = 0.0,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.name = device_id
+        self.device_id = device_id
+        self.data = 0
+        self.last_update_success = True
+        self.last_error: FriendlyError | None = None
+        self.error: FriendlyError | None = None
+        self.poller = None
+        self.poll_interval = timedelta(seconds=interval)
+        self.refreshes = 0
+        self._rate_limiter = rate_limiter
+        self._requests = requests
+        self._latency = latency
+
+    async def async_refresh(self) -> None:
+        """Fetch the device, one token per request."""
+        for _ in range(self._requests):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.async_acquire()
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        self.refreshes += 1
+        self.last_update_success = self.error is None
+        self.last_error = self.error
+        if self.error is None:
+            self.data += 1
+
+
+async def async_poll_account(hass: HomeAssistant, entry: PanasonicConfigEntry) -> None:
+    """Run one polling cycle of an account with every coordinator due."""
+    poller = entry.runtime_data.poller
+    poller._async_resume()
+    await poller._async_run_cycle()
+    await hass.async_block_till_done()
@@ -0,0 +1,47 @@
+"""Fixtures for the Panasonic Comfort Cloud tests."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.panasonic_cc.const import DOMAIN
+
+from .mock_cloud import MockComfortCloud
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def mock_cloud(
+    aioclient_mock: AiohttpClientMocker, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> MockComfortCloud:
+    """Return a mock cloud answering every request of the library."""
+    # The library keeps its tokens in ~/.panasonic-settings
+    monkeypatch.setenv("HOME", str(tmp_path))
+    cloud = MockComfortCloud(aioclient_mock)
+    cloud.register()
+    return cloud
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a config entry for one account, added to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="user@example.com",
+        data={CONF_USERNAME: "user@example.com", CONF_PASSWORD: "password"},
+        version=3,
+        minor_version=1,
+    )
+    entry.add_to_hass(hass)
+    return entry
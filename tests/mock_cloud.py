@@ -0,0 +1,416 @@
+"""In-process stand-in for the Panasonic Comfort Cloud and Aquarea services.
+
+``MockComfortCloud`` answers every request ``aio_panasonic_comfort_cloud``
+makes through Home Assistant's client session: the app version lookup, the
+login, the device list, air conditioner status, control and energy history,
+and the Aquarea and HWS status, control and consumption calls. It is
+registered on the ``aioclient_mock`` fixture, so the integration, the
+library and the session wrapper all run unchanged.
+
+Any number of synthetic devices can be added, every response can be delayed
+by a fixed latency, and the errors the real cloud returns (an adapter
+communication error 5005, a 429 with or without Retry-After, a 5xx) can be
+injected for a number of requests. Requests are counted per endpoint so
+tests and benchmarks can tell what a poll cost.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import json
+import re
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from aio_panasonic_comfort_cloud import constants, testdata
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
+
+# The errors that can be injected, as the cloud reports them
+ERROR_ADAPTER = 5005
+ERROR_RATE_LIMIT = 429
+TOKEN_LIFETIME = 86400  # seconds
+
+_DEVICE_GUID = re.compile(r"/deviceStatus/(?:now/)?(?P<guid>[^/?]+)$")
+_GWID = re.compile(r"gwid=(?P<guid>[^&]+)")
+
+
+@dataclass
+class MockDevice:
+    """One synthetic device and the state the cloud reports for it."""
+    guid: str
+    name: str
+    kind: str
+    state: dict[str, Any]
+    # Daily consumption in kWh, keyed by day
+    consumption: dict[date, float] = field(default_factory=dict)
+    # A device that does not take a change still has the write acknowledged
+    accepts_writes: bool = True
+
+    @property
+    def listing(self) -> dict[str, Any]:
+        """Return the device as the device list shows it."""
+        listing = {
+            "deviceGuid": self.guid,
+            "deviceName": self.name,
+            "deviceModuleNumber": f"MOCK-{self.kind.upper()}",
+            "permission": 3,
+            "summerHouse": 0,
+        }
+        if self.kind == "ac":
+            listing["deviceType"] = "3"
+            listing["parameters"] = copy.deepcopy(self.state["parameters"])
+        elif self.kind == "aquarea":
+            listing["deviceType"] = constants.AQUAREA_DEVICE_TYPE
+        else:
+            listing["deviceType"] = constants.HWS_DEVICE_TYPE
+            listing["parameters"] = copy.deepcopy(self.state)
+        return listing
+
+
+@dataclass
+class _InjectedError:
+    """An error returned instead of the next matching responses."""
+    error: int
+    remaining: int
+    guid: str | None
+    retry_after: str | None
+
+
+class MockComfortCloud:
+    """Answer the library's requests from a set of synthetic devices."""
+
+    def __init__(self, aioclient_mock: AiohttpClientMocker, latency: float = 0.0) -> None:
+        """Initialize the cloud; call ``register`` before setting up the integration."""
+        self._aioclient_mock = aioclient_mock
+        self.latency = latency
+        self.devices: dict[str, MockDevice] = {}
+        self.requests: Counter[str] = Counter()
+        self._errors: deque[_InjectedError] = deque()
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests answered so far."""
+        return sum(self.requests.values())
+
+    def add_air_conditioner(self, name: str | None = None, zones: bool = False) -> MockDevice:
+        """Add an air conditioner with the library's sample status."""
+        guid = f"CS-MOCK+{len(self.devices):04d}"
+        state = testdata.return_data()
+        if zones:
+            testdata.inject_zone_data(state["parameters"])
+        return self._add(MockDevice(guid, name or f"AC {len(self.devices)}", "ac", state))
+
+    def add_aquarea(self, name: str | None = None) -> MockDevice:
+        """Add an Aquarea heat pump with one heating zone and a tank."""
+        guid = f"{len(self.devices):012d}"
+        state = {
+            "operationStatus": 1,
+            "operationMode": 1,
+            "outdoorNow": 5,
+            "quietMode": 0,
+            "forceDHW": 0,
+            "forceHeater": 0,
+            "holidayTimer": 0,
+            "powerful": 0,
+            "specialStatus": 0,
+            "coolMode": 1,
+            "waterPressure": 1.8,
+            "tankStatus": {
+                "operationStatus": 1,
+                "temperatureNow": 48,
+                "heatMin": 40,
+                "heatMax": 65,
+                "heatSet": 50,
+            },
+            "zoneStatus": [
+                {
+                    "zoneId": 1,
+                    "zoneName": "House",
+                    "operationStatus": 1,
+                    "temperatureNow": 21,
+                    "heatMin": -5,
+                    "heatMax": 5,
+                    "heatSet": 0,
+                    "coolMin": -5,
+                    "coolMax": 5,
+                    "coolSet": 0,
+                }
+            ],
+        }
+        return self._add(MockDevice(guid, name or f"Aquarea {len(self.devices)}", "aquarea", state))
+
+    def add_hws(self, name: str | None = None) -> MockDevice:
+        """Add a standalone hot water tank."""
+        guid = f"HWS-MOCK+{len(self.devices):04d}"
+        state = {
+            "hpuOperationStatus": 1,
+            "operationMode": 1,
+            "boostMode": 0,
+            "tankTemperature": 50,
+        }
+        return self._add(MockDevice(guid, name or f"Water tank {len(self.devices)}", "hws", state))
+
+    def inject_error(
+        self,
+        error: int,
+        count: int = 1,
+        device: MockDevice | None = None,
+        retry_after: str | None = None,
+    ) -> None:
+        """Answer the next ``count`` device requests with an error.
+
+        ``error`` is ``ERROR_ADAPTER`` for a device that does not answer the
+        cloud, ``ERROR_RATE_LIMIT`` (optionally with a Retry-After) or any
+        5xx status. With ``device`` only that device's requests fail.
+        """
+        self._errors.append(
+            _InjectedError(error, count, device.guid if device else None, retry_after)
+        )
+
+    def register(self) -> None:
+        """Answer every request of the library on the mocked session."""
+        routes = [
+            ("get", r"^https://play\.google\.com/", self._app_version),
+            ("get", r"^https://authglb\.digital\.panasonic\.com/authorize", self._authorize),
+            ("post", r"^https://authglb\.digital\.panasonic\.com/oauth/token", self._token),
+            ("post", r"^https://accsmart\.panasonic\.com/auth/v2/login", self._login),
+            ("post", r"^https://accsmart\.panasonic\.com/auth/v2/logout", self._logout),
+            ("get", r"^https://accsmart\.panasonic\.com/device/group", self._group),
+            ("get", r"^https://accsmart\.panasonic\.com/deviceStatus/", self._status),
+            ("post", r"^https://accsmart\.panasonic\.com/deviceStatus/control", self._control),
+            ("post", r"^https://accsmart\.panasonic\.com/deviceHistoryData", self._history),
+            (
+                "post",
+                r"^https://accsmart\.panasonic\.com/remote/v1/app/common/transfer",
+                self._transfer,
+            ),
+        ]
+        for method, pattern, handler in routes:
+            self._aioclient_mock.request(
+                method, re.compile(pattern), side_effect=self._handler(handler)
+            )
+
+    def set_consumption(self, device: MockDevice, day: date, value: float) -> None:
+        """Report ``value`` kWh for one day of a device."""
+        device.consumption[day] = value
+
+    def _add(self, device: MockDevice) -> MockDevice:
+        """Register a device."""
+        self.devices[device.guid] = device
+        return device
+
+    def _handler(self, handler):
+        """Wrap a handler with the latency and the request count."""
+
+        async def side_effect(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            self.requests[handler.__name__.lstrip("_")] += 1
+            return handler(method, url, data)
+
+        return side_effect
+
+    def _failure(self, method: str, url: URL, guid: str | None) -> AiohttpClientMockResponse | None:
+        """Return an injected error for a device request, if one is pending."""
+        for injected in self._errors:
+            if injected.guid is not None and injected.guid != guid:
+                continue
+            injected.remaining -= 1
+            if injected.remaining <= 0:
+                self._errors.remove(injected)
+            if injected.error == ERROR_ADAPTER:
+                return _response(
+                    method, url, {"code": ERROR_ADAPTER, "message": "Adapter Communication error"}, 403
+                )
+            headers = {"Retry-After": injected.retry_after} if injected.retry_after else None
+            if injected.error == ERROR_RATE_LIMIT:
+                return _response(method, url, {"message": "Too many requests"}, 429, headers)
+            return _response(method, url, {"message": "Service Unavailable"}, injected.error, headers)
+        return None
+
+    def _app_version(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Return the store page the app version is read from."""
+        return AiohttpClientMockResponse(method, url, text='[["1.22.0"]]')
+
+    def _authorize(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Redirect straight back to the app with an authorization code."""
+        location = f"{constants.REDIRECT_URI}?code=mock-code&state={url.query.get('state', '')}"
+        return AiohttpClientMockResponse(method, url, status=302, headers={"Location": location})
+
+    def _token(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Issue an access token."""
+        claims = base64.urlsafe_b64encode(
+            json.dumps({"exp": int(time.time()) + TOKEN_LIFETIME}).encode()
+        ).decode().rstrip("=")
+        return _response(
+            method,
+            url,
+            {
+                "access_token": f"mock.{claims}.signature",
+                "refresh_token": "mock-refresh-token",
+                "expires_in": TOKEN_LIFETIME,
+                "scope": "openid offline_access",
+            },
+        )
+
+    def _login(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Return the Comfort Cloud client id."""
+        return _response(method, url, {"clientId": "mock-client-id"})
+
+    def _logout(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Log out."""
+        return _response(method, url, {"result": 0})
+
+    def _group(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Return every device in one group."""
+        if failure := self._failure(method, url, None):
+            return failure
+        return _response(
+            method,
+            url,
+            {
+                "groupCount": 1,
+                "groupList": [
+                    {
+                        "groupId": 1,
+                        "groupName": "Mock house",
+                        "deviceList": [device.listing for device in self.devices.values()],
+                    }
+                ],
+            },
+        )
+
+    def _status(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Return the status of an air conditioner."""
+        guid = _device_guid(url.path)
+        if failure := self._failure(method, url, guid):
+            return failure
+        device = self.devices[guid]
+        status = copy.deepcopy(device.state)
+        status["timestamp"] = int(time.time() * 1000)
+        return _response(method, url, status)
+
+    def _control(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Apply a change to an air conditioner or hot water tank."""
+        guid = data["deviceGuid"]
+        if failure := self._failure(method, url, guid):
+            return failure
+        device = self.devices[guid]
+        if device.accepts_writes:
+            parameters = device.state["parameters"] if device.kind == "ac" else device.state
+            parameters.update(data["parameters"])
+        return _response(method, url, {"result": 0})
+
+    def _history(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Return the daily consumption of the month an air conditioner asked for."""
+        guid = data["deviceGuid"]
+        if failure := self._failure(method, url, guid):
+            return failure
+        month = datetime.strptime(data["date"], "%Y%m%d").date().replace(day=1)
+        return _response(
+            method,
+            url,
+            {
+                "energyConsumption": 0,
+                "estimatedCost": 0,
+                "historyDataList": [
+                    {
+                        "dataNumber": day.day - 1,
+                        "dataTime": day.strftime("%Y%m%d"),
+                        "consumption": value,
+                        "heatConsumptionRate": -255,
+                        "coolConsumptionRate": -255,
+                    }
+                    for day, value in sorted(self.devices[guid].consumption.items())
+                    if day.replace(day=1) == month
+                ],
+            },
+        )
+
+    def _transfer(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Answer a request for an Aquarea device sent through the transfer proxy."""
+        api_name = data["apiName"]
+        body = data.get("bodyParam") or {}
+        guid = body.get("gwid") or (match := _GWID.search(api_name)) and match.group("guid")
+        if failure := self._failure(method, url, guid):
+            return failure
+        device = self.devices[guid]
+        if api_name.startswith("/remote/v1/api/consumption"):
+            return self._aquarea_consumption(method, url, device, body)
+        if data["requestMethod"] == "POST":
+            updates = {key: value for key, value in body.items() if key != "gwid"}
+            for zone_update in updates.pop("zoneStatus", []):
+                for zone in device.state["zoneStatus"]:
+                    if zone["zoneId"] == zone_update["zoneId"]:
+                        zone.update(zone_update)
+            if tank_update := updates.pop("tankStatus", None):
+                device.state["tankStatus"].update(tank_update)
+            device.state.update(updates)
+            return _response(method, url, {"result": 0})
+        return _response(
+            method,
+            url,
+            {
+                "operation": "mock",
+                "ownerFlg": True,
+                "a2wName": device.name,
+                "status": copy.deepcopy(device.state),
+            },
+        )
+
+    def _aquarea_consumption(
+        self, method: str, url: URL, device: MockDevice, body: dict[str, Any]
+    ) -> AiohttpClientMockResponse:
+        """Return the consumption of the day or month an Aquarea device asked for."""
+        requested = datetime.strptime(body["date"], "%Y%m%d").date()
+        if body["dataMode"] == constants.AquareaDataMode.Day.value:
+            days = [requested]
+        else:
+            month = requested.replace(day=1)
+            days = [
+                month + timedelta(days=offset)
+                for offset in range(31)
+                if (month + timedelta(days=offset)).month == month.month
+            ]
+        return _response(
+            method,
+            url,
+            {
+                "historyDataList": [
+                    {
+                        "dataTime": day.strftime("%Y%m%d"),
+                        "heatConsumption": device.consumption[day],
+                        "coolConsumption": 0,
+                        "tankConsumption": 0,
+                    }
+                    for day in days
+                    if day in device.consumption
+                ]
+            },
+        )
+
+
+def _device_guid(path: str) -> str:
+    """Return the device guid of a status request path."""
+    match = _DEVICE_GUID.search(path)
+    assert match is not None, path
+    return match.group("guid")
+
+
+def _response(
+    method: str,
+    url: URL,
+    body: Any,
+    status: int = 200,
+    headers: dict[str, str] | None = None,
+) -> AiohttpClientMockResponse:
+    """Return a JSON response."""
+    return AiohttpClientMockResponse(method, url, status=status, json=body, headers=headers)
@@ -0,0 +1,52 @@
+"""Tests for the ApiClient wrapper."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from custom_components.panasonic_cc.api_client import _RetryAfterSession
+from custom_components.panasonic_cc.rate_limiter import AccountRateLimiter
+
+URL = "https://accsmart.panasonic.com/deviceStatus/now/device"
+
+
+async def test_retry_after_pauses_the_account(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a rejected request's Retry-After reaches the rate limiter."""
+    aioclient_mock.get(URL, status=429, headers={"Retry-After": "120"})
+    limiter = AccountRateLimiter(hass, "test", 30)
+    session = _RetryAfterSession(async_get_clientsession(hass), limiter)
+
+    response = await session.get(URL)
+
+    assert response.status == 429
+    assert limiter.resume_at >= hass.loop.time() + 119
+
+
+async def test_retry_after_ignored_on_other_statuses(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test only responses that ask the client to back off pause the account."""
+    aioclient_mock.post(URL, status=500, headers={"Retry-After": "120"})
+    limiter = AccountRateLimiter(hass, "test", 30)
+    session = _RetryAfterSession(async_get_clientsession(hass), limiter)
+
+    await session.post(URL)
+
+    assert limiter.resume_at == 0
+
+
+async def test_attributes_reach_the_session(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test the Aquarea cookie jar swap goes to the wrapped session."""
+    client = async_get_clientsession(hass)
+    session = _RetryAfterSession(client, AccountRateLimiter(hass, "test", 30))
+    jar = object()
+
+    session._cookie_jar = jar
+
+    assert client._cookie_jar is jar
+    assert session.cookie_jar is jar
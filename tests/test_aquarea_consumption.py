@@ -0,0 +1,149 @@
+"""Tests for the Aquarea consumption cache."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from aio_panasonic_comfort_cloud import constants
+from aio_panasonic_comfort_cloud.models.aquarea import AquareaConsumption
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.panasonic_cc.aquarea.coordinator import (
+    CONSUMPTION_CACHE_MONTHS,
+    AquareaConsumptionCache,
+)
+
+TODAY = date(2026, 3, 10)
+
+
+class FakeConsumptionApi:
+    """Answer consumption queries, a day as hourly entries and a month as daily ones."""
+
+    def __init__(self) -> None:
+        """Initialize the api."""
+        # Heat consumption per hour, keyed by day
+        self.hours: dict[date, list[float]] = {}
+        self.queries: list[tuple[constants.AquareaDataMode, str]] = []
+
+    async def async_get_aquarea_consumption(
+        self, device_info: object, data_mode: constants.AquareaDataMode, data_time: str
+    ) -> list[AquareaConsumption]:
+        """Return the entries of one day or month."""
+        self.queries.append((data_mode, data_time))
+        requested = datetime.strptime(data_time, "%Y%m%d").date()
+        if data_mode is constants.AquareaDataMode.Day:
+            return [
+                AquareaConsumption({"dataTime": f"{data_time}{hour:02d}", "heatConsumption": value})
+                for hour, value in enumerate(self.hours.get(requested, []))
+            ]
+        return [
+            AquareaConsumption({"dataTime": day.strftime("%Y%m%d"), "heatConsumption": sum(values)})
+            for day, values in self.hours.items()
+            if (day.year, day.month) == (requested.year, requested.month)
+        ]
+
+
+@pytest.fixture
+def api() -> FakeConsumptionApi:
+    """Return the api of one Aquarea device."""
+    return FakeConsumptionApi()
+
+
+@pytest.fixture
+def cache(api: FakeConsumptionApi, freezer: FrozenDateTimeFactory) -> AquareaConsumptionCache:
+    """Return the consumption cache of the device, at noon on TODAY."""
+    freezer.move_to(f"{TODAY.isoformat()} 12:00:00")
+    return AquareaConsumptionCache(api, object())
+
+
+async def test_month_downloaded_once(api: FakeConsumptionApi, cache: AquareaConsumptionCache) -> None:
+    """Test closed days are served from memory after the first download."""
+    api.hours[TODAY - timedelta(days=1)] = [1.0, 2.0]
+
+    first = await cache.async_get_month(TODAY.replace(day=1))
+    second = await cache.async_get_month(TODAY.replace(day=1))
+
+    assert first is second
+    assert first["20260309"].heat_consumption == 3.0
+    assert api.queries == [(constants.AquareaDataMode.Month, "20260301")]
+
+
+async def test_only_today_is_refetched(api: FakeConsumptionApi, cache: AquareaConsumptionCache) -> None:
+    """Test later polls fetch today alone and add up its hours."""
+    api.hours[TODAY] = [1.0]
+    assert (await cache.async_get_today()).heat_consumption == 1.0
+
+    api.hours[TODAY] = [1.0, 0.5, 0.25]
+    today = await cache.async_get_today()
+
+    assert today.heat_consumption == 1.75
+    assert api.queries == [
+        (constants.AquareaDataMode.Month, "20260310"),
+        (constants.AquareaDataMode.Day, "20260310"),
+    ]
+
+
+async def test_closed_day_fetched_once_more(
+    api: FakeConsumptionApi, cache: AquareaConsumptionCache, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the day that just closed gets its final value after midnight."""
+    api.hours[TODAY] = [1.0]
+    await cache.async_get_today()
+    api.hours[TODAY] = [1.0, 4.0]
+    api.queries.clear()
+
+    freezer.tick(timedelta(days=1))
+    await cache.async_get_today()
+
+    month = await cache.async_get_month(TODAY.replace(day=1))
+    assert month["20260310"].heat_consumption == 5.0
+    assert api.queries == [
+        (constants.AquareaDataMode.Day, "20260310"),
+        (constants.AquareaDataMode.Day, "20260311"),
+    ]
+
+
+async def test_several_closed_days_downloaded_again(
+    api: FakeConsumptionApi, cache: AquareaConsumptionCache, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test days that closed without a poll get their final values from the month."""
+    api.hours[TODAY] = [1.0]
+    await cache.async_get_today()
+    api.hours[TODAY] = [1.0, 4.0]
+    api.hours[TODAY + timedelta(days=1)] = [2.0]
+    api.queries.clear()
+
+    freezer.tick(timedelta(days=3))
+    await cache.async_get_today()
+
+    month = await cache.async_get_month(TODAY.replace(day=1))
+    assert month["20260310"].heat_consumption == 5.0
+    assert month["20260311"].heat_consumption == 2.0
+    assert api.queries == [(constants.AquareaDataMode.Month, "20260313")]
+
+
+async def test_today_follows_the_home_assistant_time_zone(
+    hass: HomeAssistant, api: FakeConsumptionApi, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test today is the local day of Home Assistant, not of the system."""
+    await hass.config.async_set_time_zone("America/Los_Angeles")
+    # Still the evening before in Los Angeles
+    freezer.move_to(f"{TODAY.isoformat()} 02:00:00+00:00")
+    cache = AquareaConsumptionCache(api, object())
+
+    await cache.async_get_today()
+
+    assert api.queries == [(constants.AquareaDataMode.Month, "20260309")]
+
+
+async def test_old_months_are_dropped(api: FakeConsumptionApi, cache: AquareaConsumptionCache) -> None:
+    """Test the cache keeps only the most recent months."""
+    months = [date(2026, month, 1) for month in range(1, CONSUMPTION_CACHE_MONTHS + 2)]
+    for month in months:
+        await cache.async_get_month(month)
+    api.queries.clear()
+
+    await cache.async_get_month(months[0])
+
+    assert api.queries == [(constants.AquareaDataMode.Month, "20260101")]
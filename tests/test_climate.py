@@ -0,0 +1,129 @@
+"""Tests for air conditioner commands and their optimistic state."""
+from __future__ import annotations
+
+from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TEMPERATURE,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_TEMPERATURE,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.panasonic_cc import command_queue
+from custom_components.panasonic_cc.panasonic import coordinator
+
+from .common import async_poll_account
+from .mock_cloud import ERROR_ADAPTER, MockComfortCloud, MockDevice
+
+
+@pytest.fixture
+async def air_conditioner(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> MockDevice:
+    """Set up an account with one air conditioner, sending commands without delay."""
+    monkeypatch.setattr(coordinator, "COMMAND_COALESCE_WINDOW", 0)
+    device = mock_cloud.add_air_conditioner()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return device
+
+
+async def _async_set_temperature(hass: HomeAssistant, temperature: float) -> str:
+    """Set the target temperature of the air conditioner; return its entity id."""
+    entity_id = hass.states.async_entity_ids(CLIMATE_DOMAIN)[0]
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: temperature},
+        blocking=True,
+    )
+    return entity_id
+
+
+async def test_command_shown_before_the_next_poll(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    air_conditioner: MockDevice,
+) -> None:
+    """Test a command shows at once and the next poll confirms it."""
+    entity_id = await _async_set_temperature(hass, 24)
+
+    assert hass.states.get(entity_id).attributes[ATTR_TEMPERATURE] == 24
+    assert air_conditioner.state["parameters"]["temperatureSet"] == 24
+    assert mock_cloud.requests["control"] == 1
+
+    await async_poll_account(hass, config_entry)
+
+    assert hass.states.get(entity_id).attributes[ATTR_TEMPERATURE] == 24
+    assert not config_entry.runtime_data.data_coordinators[0]._optimistic_changes
+
+
+async def test_command_the_device_did_not_take(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    air_conditioner: MockDevice,
+) -> None:
+    """Test the cloud state wins when the device did not take a command."""
+    air_conditioner.accepts_writes = False
+    entity_id = await _async_set_temperature(hass, 24)
+    assert hass.states.get(entity_id).attributes[ATTR_TEMPERATURE] == 24
+
+    await async_poll_account(hass, config_entry)
+
+    assert hass.states.get(entity_id).attributes[ATTR_TEMPERATURE] == 22.5
+
+
+async def test_command_kept_while_the_write_is_queued(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    air_conditioner: MockDevice,
+) -> None:
+    """Test a write queued for retry keeps its state through polls that predate it."""
+    mock_cloud.inject_error(ERROR_ADAPTER, device=air_conditioner)
+    entity_id = await _async_set_temperature(hass, 24)
+    assert air_conditioner.state["parameters"]["temperatureSet"] == 22.5
+
+    await async_poll_account(hass, config_entry)
+
+    assert hass.states.get(entity_id).attributes[ATTR_TEMPERATURE] == 24
+    assert config_entry.runtime_data.data_coordinators[0].pending_commands
+
+
+async def test_dropped_write_rolls_back_to_the_last_poll(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    air_conditioner: MockDevice,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test dropping a queued write restores the commanded field alone, as last polled."""
+    mock_cloud.inject_error(ERROR_ADAPTER, device=air_conditioner)
+    entity_id = await _async_set_temperature(hass, 24)
+
+    # A poll lands while the write is queued
+    air_conditioner.state["parameters"]["insideTemperature"] = 25
+    await async_poll_account(hass, config_entry)
+    state = hass.states.get(entity_id)
+    assert state.attributes[ATTR_TEMPERATURE] == 24
+    assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 25
+
+    # The next retry finds the write too old and drops it
+    monkeypatch.setattr(command_queue, "COMMAND_RETRY_INITIAL", 0)
+    monkeypatch.setattr(command_queue, "COMMAND_QUEUE_MAX_AGE", 0)
+    queue = config_entry.runtime_data.data_coordinators[0]._command_queue
+    queue.async_cancel()
+    queue.async_resume()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = hass.states.get(entity_id)
+    assert state.attributes[ATTR_TEMPERATURE] == 22.5
+    assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 25
+    assert not config_entry.runtime_data.data_coordinators[0].pending_commands
@@ -0,0 +1,245 @@
+"""Tests for the energy history backfill."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.panasonic_cc.energy_backfill import (
+    ENERGY_BACKFILL_GRACE_DAYS,
+    ENERGY_BACKFILL_MAX_DAYS,
+    EnergyBackfill,
+    EnergyStatisticDescription,
+)
+
+TODAY = date(2026, 3, 10)
+STORAGE_KEY = "panasonic_cc_device_energy_backfill"
+DESCRIPTIONS = (EnergyStatisticDescription(key="energy", name="Energy"),)
+
+
+class FakeHistory:
+    """Serve the daily consumption the cloud has reported so far, a month at a time."""
+
+    def __init__(self) -> None:
+        """Initialize the history."""
+        self.days: dict[date, float] = {}
+        self.months: list[date] = []
+
+    async def async_fetch_month(self, month: date) -> dict[date, dict[str, float | None]]:
+        """Return the reported days of one month."""
+        self.months.append(month)
+        return {
+            day: {"energy": value}
+            for day, value in self.days.items()
+            if day.replace(day=1) == month
+        }
+
+
+@pytest.fixture
+def history() -> FakeHistory:
+    """Return the cloud history of one device."""
+    return FakeHistory()
+
+
+@pytest.fixture
+def imported() -> dict[str, list[Any]]:
+    """Capture the statistics handed to the recorder, by statistic id."""
+    rows: dict[str, list[Any]] = {}
+
+    def add_external_statistics(hass, metadata, statistics) -> None:
+        rows.setdefault(metadata["statistic_id"], []).extend(statistics)
+
+    with patch(
+        "custom_components.panasonic_cc.energy_backfill.async_add_external_statistics",
+        side_effect=add_external_statistics,
+    ):
+        yield rows
+
+
+@pytest.fixture
+def backfill(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, history: FakeHistory
+) -> EnergyBackfill:
+    """Return the backfill of one device, run at noon on TODAY."""
+    freezer.move_to(f"{TODAY.isoformat()} 12:00:00")
+    return EnergyBackfill(hass, "device", "Device", DESCRIPTIONS, history.async_fetch_month)
+
+
+def _report(history: FakeHistory, first: date, last: date, value: float = 1.0) -> None:
+    """Report ``value`` for every day from ``first`` to ``last``."""
+    day = first
+    while day <= last:
+        history.days[day] = value
+        day += timedelta(days=1)
+
+
+async def test_first_run_imports_up_to_yesterday(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+) -> None:
+    """Test the first run imports every closed day within the backfill window."""
+    _report(history, TODAY - timedelta(days=200), TODAY, 2.0)
+
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+
+    rows = imported["panasonic_cc:device_energy"]
+    assert len(rows) == ENERGY_BACKFILL_MAX_DAYS
+    assert rows[-1]["sum"] == ENERGY_BACKFILL_MAX_DAYS * 2.0
+    stored = hass_storage[STORAGE_KEY]["data"]
+    assert stored == {
+        "last_day": (TODAY - timedelta(days=1)).isoformat(),
+        "sums": {"energy": ENERGY_BACKFILL_MAX_DAYS * 2.0},
+    }
+
+
+async def test_history_shorter_than_the_window(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+) -> None:
+    """Test a device added recently imports the days it has."""
+    _report(history, TODAY - timedelta(days=3), TODAY - timedelta(days=1))
+
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+
+    assert len(imported["panasonic_cc:device_energy"]) == 3
+    assert hass_storage[STORAGE_KEY]["data"]["last_day"] == (TODAY - timedelta(days=1)).isoformat()
+
+
+@pytest.mark.parametrize("missing", [None, -255], ids=["absent", "not_reported"])
+async def test_mark_waits_for_a_recent_unreported_day(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+    missing: float | None,
+) -> None:
+    """Test days after a recent gap wait until the cloud fills it in."""
+    _report(history, TODAY - timedelta(days=10), TODAY - timedelta(days=1))
+    gap = TODAY - timedelta(days=ENERGY_BACKFILL_GRACE_DAYS)
+    if missing is None:
+        del history.days[gap]
+    else:
+        history.days[gap] = missing
+
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+
+    assert [row["start"].date() for row in imported["panasonic_cc:device_energy"]] == [
+        TODAY - timedelta(days=days) for days in range(10, ENERGY_BACKFILL_GRACE_DAYS, -1)
+    ]
+    assert hass_storage[STORAGE_KEY]["data"]["last_day"] == (gap - timedelta(days=1)).isoformat()
+
+
+@pytest.mark.parametrize("missing", [None, -255], ids=["absent", "not_reported"])
+async def test_mark_moves_past_an_old_unreported_day(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+    missing: float | None,
+) -> None:
+    """Test a day the cloud never reported does not hold back the days after it."""
+    _report(history, TODAY - timedelta(days=10), TODAY - timedelta(days=1))
+    gap = TODAY - timedelta(days=ENERGY_BACKFILL_GRACE_DAYS + 1)
+    if missing is None:
+        del history.days[gap]
+    else:
+        history.days[gap] = missing
+
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+
+    rows = imported["panasonic_cc:device_energy"]
+    assert gap not in [row["start"].date() for row in rows]
+    assert len(rows) == 9
+    assert rows[-1]["sum"] == 9.0
+    assert hass_storage[STORAGE_KEY]["data"]["last_day"] == (TODAY - timedelta(days=1)).isoformat()
+
+
+async def test_empty_history_moves_the_mark(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+) -> None:
+    """Test a device without history is not scanned back the whole window every day."""
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+
+    assert imported == {}
+    settled = TODAY - timedelta(days=ENERGY_BACKFILL_GRACE_DAYS)
+    assert hass_storage[STORAGE_KEY]["data"] == {
+        "last_day": (settled - timedelta(days=1)).isoformat(),
+        "sums": {},
+    }
+
+    history.months.clear()
+    freezer.tick(timedelta(days=1))
+    await backfill._async_backfill()
+
+    assert history.months == [TODAY.replace(day=1)]
+
+
+async def test_next_run_continues_from_the_mark(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+) -> None:
+    """Test a later run imports each day once and carries the sums on."""
+    _report(history, TODAY - timedelta(days=3), TODAY - timedelta(days=1))
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+    imported.clear()
+    history.months.clear()
+
+    # Two days later, with both new days reported
+    freezer.tick(timedelta(days=2))
+    _report(history, TODAY, TODAY + timedelta(days=1), 3.0)
+    await backfill._async_backfill()
+    await hass.async_block_till_done()
+
+    rows = imported["panasonic_cc:device_energy"]
+    assert [row["start"].date() for row in rows] == [TODAY, TODAY + timedelta(days=1)]
+    assert [row["sum"] for row in rows] == [6.0, 9.0]
+    # Only the month holding the mark is fetched again
+    assert history.months == [TODAY.replace(day=1)]
+    assert hass_storage[STORAGE_KEY]["data"]["sums"] == {"energy": 9.0}
+
+
+async def test_nothing_new_imports_nothing(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    backfill: EnergyBackfill,
+    history: FakeHistory,
+    imported: dict[str, list[Any]],
+) -> None:
+    """Test a run when yesterday is already imported fetches nothing."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"last_day": (TODAY - timedelta(days=1)).isoformat(), "sums": {"energy": 5.0}},
+    }
+
+    await backfill._async_backfill()
+
+    assert history.months == []
+    assert imported == {}
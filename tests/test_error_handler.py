@@ -0,0 +1,116 @@
+"""Tests for the error classifier."""
+from __future__ import annotations
+
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+import pytest
+from yarl import URL
+
+from custom_components.panasonic_cc.error_handler import (
+    _ERROR_MATCHER,
+    ERROR_PATTERNS,
+    ErrorCategory,
+    _first_characters,
+    classify_error,
+)
+
+_URL = URL("https://accsmart.panasonic.com/deviceStatus/now")
+
+
+def _response_error(status: int, message: str) -> ClientResponseError:
+    """Return a ClientResponseError the way aiohttp raises it."""
+    request_info = RequestInfo(_URL, "GET", CIMultiDictProxy(CIMultiDict()), _URL)
+    return ClientResponseError(request_info, (), status=status, message=message)
+
+
+@pytest.mark.parametrize(
+    ("message", "category", "title"),
+    [
+        ("Expected status code '200' but received '500'", ErrorCategory.SERVER_ERROR, "Server Error"),
+        ('received 503 after "code": 5005', ErrorCategory.SERVER_ERROR, "Service Unavailable"),
+        ("RECEIVED 503", ErrorCategory.SERVER_ERROR, "Service Unavailable"),
+        (
+            '{"code":5005,"message":"Adapter Communication error"}',
+            ErrorCategory.ADAPTER_COMMUNICATION,
+            "Device Communication Error",
+        ),
+        ('"Code": 5005', ErrorCategory.UNKNOWN, "Unknown Error"),
+        ('"code": 9999 timed out', ErrorCategory.NETWORK, "Connection Timeout"),
+        ("HTTP 429", ErrorCategory.RATE_LIMIT, "Rate Limited"),
+        ("x503 401x", ErrorCategory.UNKNOWN, "Unknown Error"),
+        ("error 418", ErrorCategory.UNKNOWN, "Unknown Error"),
+        ("adapter communication error", ErrorCategory.ADAPTER_COMMUNICATION, "Device Communication Error"),
+        ("Device not responding", ErrorCategory.ADAPTER_COMMUNICATION, "Device Not Responding"),
+        ("device responded late", ErrorCategory.ADAPTER_COMMUNICATION, "Device Not Responding"),
+        ("Connection timed out", ErrorCategory.NETWORK, "Connection Timeout"),
+        ("Timeout", ErrorCategory.NETWORK, "Connection Timeout"),
+        ("Unauthorized", ErrorCategory.AUTHENTICATION, "Authentication Error"),
+        ("authentication failed", ErrorCategory.AUTHENTICATION, "Authentication Error"),
+        ("invalid credentials", ErrorCategory.AUTHENTICATION, "Authentication Error"),
+        ("rate limit exceeded", ErrorCategory.RATE_LIMIT, "Rate Limited"),
+        ("Too many requests", ErrorCategory.RATE_LIMIT, "Rate Limited"),
+        ("Service Unavailable", ErrorCategory.SERVER_ERROR, "Service Unavailable"),
+        ("down for maintenance", ErrorCategory.SERVER_ERROR, "Service Unavailable"),
+        ("timed out: Unauthorized", ErrorCategory.NETWORK, "Connection Timeout"),
+        ("Cannot connect to host", ErrorCategory.UNKNOWN, "Unknown Error"),
+        ("", ErrorCategory.UNKNOWN, "Unknown Error"),
+    ],
+)
+def test_classify_message(message: str, category: ErrorCategory, title: str) -> None:
+    """Test a message is classified by its first known code, then by its patterns."""
+    result = classify_error(Exception(message))
+
+    assert (result.category, result.title) == (category, title)
+    assert result.original_error == message
+
+
+@pytest.mark.parametrize(
+    ("status", "message", "category", "title"),
+    [
+        (418, "", ErrorCategory.CLIENT_ERROR, "Client Error (418)"),
+        (599, "", ErrorCategory.SERVER_ERROR, "Server Error (599)"),
+        (503, "", ErrorCategory.SERVER_ERROR, "Service Unavailable"),
+        (302, "", ErrorCategory.UNKNOWN, "Unknown Error"),
+        (500, "Timeout", ErrorCategory.SERVER_ERROR, "Server Error"),
+        (429, "error 418", ErrorCategory.RATE_LIMIT, "Rate Limited"),
+        (401, "Unauthorized", ErrorCategory.AUTHENTICATION, "Authentication Failed"),
+    ],
+)
+def test_classify_response_error(
+    status: int, message: str, category: ErrorCategory, title: str
+) -> None:
+    """Test the response status is used when nothing in the message is known."""
+    result = classify_error(_response_error(status, message))
+
+    assert (result.category, result.title) == (category, title)
+
+
+def test_lookahead_covers_every_pattern() -> None:
+    """Test the scan's lookahead admits the first character of every message pattern."""
+    assert _ERROR_MATCHER.pattern.startswith("(?=[")
+    lookahead = _ERROR_MATCHER.pattern[4 : _ERROR_MATCHER.pattern.index("]")]
+    for pattern, _ in ERROR_PATTERNS:
+        first = _first_characters(pattern.pattern)
+        assert first is not None, pattern.pattern
+        assert first <= set(lookahead), pattern.pattern
+
+
+@pytest.mark.parametrize("pattern", [r"\s*error", r"(a|b)c", r"x?y", r"ab|[cd]e"])
+def test_no_lookahead_for_an_unknown_first_character(pattern: str) -> None:
+    """Test a pattern whose first character cannot be told gives no first characters."""
+    assert _first_characters(pattern) is None
+
+
+def test_later_error_code_still_yields_http_status() -> None:
+    """Test an HTTP code inside a repeated error code is not skipped."""
+    result = classify_error(Exception('"code": 4011 "code":503'))
+
+    assert result.title == "Service Unavailable"
+    assert result.category is ErrorCategory.SERVER_ERROR
+
+
+def test_results_are_cached() -> None:
+    """Test the repeated failures of an outage share one result."""
+    message = '{"code":5005,"message":"Adapter Communication error"}'
+
+    assert classify_error(Exception(message)) is classify_error(Exception(message))
@@ -0,0 +1,183 @@
+"""Tests for setting up, polling and unloading a config entry."""
+from __future__ import annotations
+
+import gc
+
+from aio_panasonic_comfort_cloud import ApiClient
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.panasonic_cc import discovery, scheduler
+from custom_components.panasonic_cc.const import (
+    CONF_REQUEST_BUDGET,
+    DATA_SCHEDULER,
+    DEFAULT_REQUEST_BUDGET,
+    DOMAIN,
+)
+from custom_components.panasonic_cc.panasonic.coordinator import MAX_CONSECUTIVE_FAILURES
+from custom_components.panasonic_cc.scheduler import BreakerState
+
+from .common import async_poll_account
+from .mock_cloud import ERROR_ADAPTER, ERROR_RATE_LIMIT, MockComfortCloud
+
+
+async def test_setup_and_unload(
+    hass: HomeAssistant, mock_cloud: MockComfortCloud, config_entry: MockConfigEntry
+) -> None:
+    """Test an account with every kind of device sets up and lets go of it all on unload."""
+    mock_cloud.add_air_conditioner()
+    mock_cloud.add_aquarea()
+    mock_cloud.add_hws()
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    runtime = config_entry.runtime_data
+    assert len(runtime.device_coordinators) == 3
+    assert hass.data[DATA_SCHEDULER].pollers == [runtime.poller]
+    assert runtime.setup_duration is not None
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+    assert DATA_SCHEDULER not in hass.data
+    assert runtime.device_coordinators == []
+    assert runtime.poller.coordinators == []
+    gc.collect()
+    assert len(scheduler._LIVE_COORDINATORS) == 0
+
+
+async def test_setup_without_devices(
+    hass: HomeAssistant, mock_cloud: MockComfortCloud, config_entry: MockConfigEntry
+) -> None:
+    """Test an account without devices does not set up."""
+    assert not await hass.config_entries.async_setup(config_entry.entry_id)
+
+    assert config_entry.state is ConfigEntryState.SETUP_ERROR
+
+
+async def test_options_applied_in_place(
+    hass: HomeAssistant, mock_cloud: MockComfortCloud, config_entry: MockConfigEntry
+) -> None:
+    """Test a changed request budget reaches the running rate limiter."""
+    mock_cloud.add_air_conditioner()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    runtime = config_entry.runtime_data
+    requests = mock_cloud.total_requests
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_REQUEST_BUDGET: DEFAULT_REQUEST_BUDGET * 2}
+    )
+    await hass.async_block_till_done()
+
+    assert config_entry.runtime_data is runtime
+    assert runtime.rate_limiter.requests_per_minute == DEFAULT_REQUEST_BUDGET * 2
+    # Nothing was set up again
+    assert mock_cloud.total_requests == requests
+
+
+async def test_poll_updates_changed_devices(
+    hass: HomeAssistant, mock_cloud: MockComfortCloud, config_entry: MockConfigEntry
+) -> None:
+    """Test a polling cycle fetches every device once and writes what changed."""
+    air_conditioner = mock_cloud.add_air_conditioner()
+    mock_cloud.add_aquarea()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity_id = hass.states.async_entity_ids("climate")[0]
+    assert hass.states.get(entity_id).attributes["current_temperature"] == 21
+
+    air_conditioner.state["parameters"]["insideTemperature"] = 24
+    requests = mock_cloud.total_requests
+    await async_poll_account(hass, config_entry)
+
+    assert hass.states.get(entity_id).attributes["current_temperature"] == 24
+    assert mock_cloud.total_requests - requests == 2
+    stats = config_entry.runtime_data.poller.get_stats()
+    assert stats["average_requests_per_cycle"] == 2
+    assert stats["average_updated_per_cycle"] == 1
+
+
+async def test_unreachable_device_leaves_the_account_polling(
+    hass: HomeAssistant, mock_cloud: MockComfortCloud, config_entry: MockConfigEntry
+) -> None:
+    """Test a device the cloud cannot reach only affects that device."""
+    unplugged = mock_cloud.add_air_conditioner("Unplugged")
+    mock_cloud.add_air_conditioner("Online")
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Every failed live fetch is retried from cached status; keep the budget out of the way
+    config_entry.runtime_data.rate_limiter.async_set_budget(6000)
+    mock_cloud.inject_error(ERROR_ADAPTER, count=100, device=unplugged)
+    for _ in range(MAX_CONSECUTIVE_FAILURES):
+        await async_poll_account(hass, config_entry)
+
+    coordinators = {
+        coordinator.device_id: coordinator
+        for coordinator in config_entry.runtime_data.data_coordinators
+    }
+    statuses = sorted(coordinator.connection_status for coordinator in coordinators.values())
+    assert statuses == ["connected", "disconnected"]
+    assert config_entry.runtime_data.poller.get_stats()["circuit"] is BreakerState.CLOSED
+
+
+async def test_late_water_tank_added_once_it_responds(
+    hass: HomeAssistant,
+    mock_cloud: MockComfortCloud,
+    config_entry: MockConfigEntry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a water tank that misses setup is added when its first refresh succeeds."""
+    monkeypatch.setattr(discovery, "DISCOVERY_SETUP_TIMEOUT", 0)
+    monkeypatch.setattr(discovery, "DISCOVERY_RETRY_INITIAL", 0.01)
+    mock_cloud.add_hws("Tank")
+    get_hws_device = ApiClient.get_hws_device
+    listed = False
+
+    def get_listed_hws_device(self, device_info):
+        if not listed:
+            raise RuntimeError("Tank not in the device snapshot yet")
+        return get_hws_device(self, device_info)
+
+    monkeypatch.setattr(ApiClient, "get_hws_device", get_listed_hws_device)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+
+    runtime_data = config_entry.runtime_data
+    assert runtime_data.hws_coordinators == []
+    [pending] = runtime_data.hws_discovery.pending
+    assert dr.async_get(hass).async_get_device({(DOMAIN, pending.device_id)}) is not None
+    assert not hass.states.async_entity_ids("water_heater")
+
+    listed = True
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(runtime_data.hws_coordinators) == 1
+    assert runtime_data.hws_discovery.pending == []
+    assert hass.states.async_entity_ids("water_heater")
+    assert runtime_data.hws_coordinators[0] in runtime_data.poller.coordinators
+
+
+async def test_retry_after_pauses_the_account(
+    hass: HomeAssistant, mock_cloud: MockComfortCloud, config_entry: MockConfigEntry
+) -> None:
+    """Test a 429 from the cloud holds the account's requests for as long as it asked."""
+    mock_cloud.add_air_conditioner()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_cloud.inject_error(ERROR_RATE_LIMIT, retry_after="1")
+    requests = mock_cloud.requests["status"]
+    started = hass.loop.time()
+    await async_poll_account(hass, config_entry)
+
+    # The library falls back to cached status, which waits out the pause
+    assert mock_cloud.requests["status"] - requests == 2
+    assert hass.loop.time() - started >= 1
+    assert config_entry.runtime_data.rate_limiter.throttled_requests == 1
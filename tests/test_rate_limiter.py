@@ -0,0 +1,143 @@
+"""Tests for the account rate limiter."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.panasonic_cc.rate_limiter import (
+    RATE_LIMIT_BURST,
+    AccountRateLimiter,
+    RequestPriority,
+    request_priority,
+)
+
+
+@pytest.fixture
+async def limiter(hass: HomeAssistant) -> AsyncGenerator[AccountRateLimiter]:
+    """Return a limiter handing out a token every 100ms once the burst is spent."""
+    limiter = AccountRateLimiter(hass, "test", 600)
+    yield limiter
+    limiter.async_shutdown()
+
+
+async def _spend_burst(limiter: AccountRateLimiter) -> None:
+    """Take every token the bucket starts with."""
+    for _ in range(RATE_LIMIT_BURST):
+        await limiter.async_acquire()
+
+
+async def test_burst_then_queue(hass: HomeAssistant, limiter: AccountRateLimiter) -> None:
+    """Test a full bucket is sent at once and the next request waits."""
+    await _spend_burst(limiter)
+    assert limiter.throttled_requests == 0
+
+    waiting = hass.async_create_task(limiter.async_acquire())
+    await asyncio.sleep(0)
+
+    assert not waiting.done()
+    assert limiter.queue_depth == 1
+    await asyncio.wait_for(waiting, timeout=1)
+    assert limiter.total_requests == RATE_LIMIT_BURST + 1
+    assert limiter.throttled_requests == 1
+
+
+async def test_commands_overtake_queued_polls(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test a command queued behind polls gets the next token."""
+    await _spend_burst(limiter)
+    order: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        with request_priority(priority):
+            await limiter.async_acquire()
+        order.append(name)
+
+    tasks = [
+        hass.async_create_task(request(f"poll {index}", RequestPriority.POLL))
+        for index in range(3)
+    ]
+    tasks.append(hass.async_create_task(request("refresh", RequestPriority.REFRESH)))
+    tasks.append(hass.async_create_task(request("command", RequestPriority.COMMAND)))
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+
+    assert order == ["command", "refresh", "poll 0", "poll 1", "poll 2"]
+
+
+async def test_server_pause_holds_every_request(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test no token is handed out before a requested pause is over."""
+    limiter.async_defer(0.2)
+    started = hass.loop.time()
+
+    await asyncio.wait_for(limiter.async_acquire(), timeout=1)
+
+    assert hass.loop.time() - started >= 0.2
+    assert limiter.throttled_requests == 1
+
+
+async def test_shorter_pause_does_not_shorten_a_longer_one(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test a Retry-After only ever extends the pause."""
+    limiter.async_defer(60)
+    resume_at = limiter.resume_at
+
+    limiter.async_defer(1)
+
+    assert limiter.resume_at == resume_at
+
+
+async def test_wait_ready_takes_no_token(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test waiting until a request could be sent does not spend one."""
+    for _ in range(RATE_LIMIT_BURST * 2):
+        await asyncio.wait_for(limiter.async_wait_ready(), timeout=0.05)
+
+    assert limiter.total_requests == 0
+    await _spend_burst(limiter)
+    assert limiter.throttled_requests == 0
+
+
+async def test_wait_ready_lets_queued_requests_go_first(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test a caller waiting to take a worker lets queued requests through first."""
+    await _spend_burst(limiter)
+    queued = hass.async_create_task(limiter.async_acquire())
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(limiter.async_wait_ready(), timeout=1)
+
+    assert queued.done()
+
+
+async def test_wait_ready_waits_out_a_pause(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test a paused account is not ready until the pause is over."""
+    limiter.async_defer(0.2)
+    started = hass.loop.time()
+
+    await asyncio.wait_for(limiter.async_wait_ready(), timeout=1)
+
+    assert hass.loop.time() - started >= 0.2
+
+
+async def test_shutdown_fails_queued_requests(
+    hass: HomeAssistant, limiter: AccountRateLimiter
+) -> None:
+    """Test unloading the account does not leave requests waiting forever."""
+    await _spend_burst(limiter)
+    queued = hass.async_create_task(limiter.async_acquire())
+    await asyncio.sleep(0)
+
+    limiter.async_shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await queued
@@ -0,0 +1,255 @@
+"""Tests for the account poll scheduler."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.panasonic_cc.error_handler import backoff_policy, classify_error
+from custom_components.panasonic_cc.rate_limiter import (
+    RATE_LIMIT_BURST,
+    RETRY_AFTER_MAX,
+    AccountRateLimiter,
+)
+from custom_components.panasonic_cc.scheduler import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN_INITIAL,
+    BREAKER_OPEN_MAX,
+    POLL_BATCH_WINDOW,
+    POLL_WORKER_LIMIT,
+    AccountCircuitBreaker,
+    AccountPoller,
+    AdaptivePollInterval,
+    BreakerState,
+    PollScheduler,
+)
+
+from .common import FakeCoordinator
+
+
+async def test_paused_account_does_not_hold_workers(hass: HomeAssistant) -> None:
+    """Test a server-requested pause on one account leaves the workers to the others."""
+    scheduler = PollScheduler(hass)
+    paused_limiter = AccountRateLimiter(hass, "paused", 30)
+    paused_limiter.async_defer(RETRY_AFTER_MAX)
+    paused = AccountPoller(hass, "paused", scheduler, paused_limiter)
+    paused_coordinators = [
+        FakeCoordinator(f"paused-{index}", paused_limiter)
+        for index in range(POLL_WORKER_LIMIT * 2)
+    ]
+    paused.async_add_coordinators(paused_coordinators)
+    other_limiter = AccountRateLimiter(hass, "other", 30)
+    other = AccountPoller(hass, "other", scheduler, other_limiter)
+    other_coordinator = FakeCoordinator("other", other_limiter)
+    other.async_add_coordinators([other_coordinator])
+
+    waiting = [
+        hass.async_create_task(paused._async_poll(coordinator))
+        for coordinator in paused_coordinators
+    ]
+    await asyncio.sleep(0)
+    await asyncio.wait_for(other._async_poll(other_coordinator), timeout=1)
+
+    assert other_coordinator.refreshes == 1
+    assert not any(coordinator.refreshes for coordinator in paused_coordinators)
+    assert not scheduler.workers.locked()
+    for task in waiting:
+        task.cancel()
+    await asyncio.gather(*waiting, return_exceptions=True)
+    paused_limiter.async_shutdown()
+    other_limiter.async_shutdown()
+
+
+async def test_throttled_account_does_not_hold_workers(hass: HomeAssistant) -> None:
+    """Test an account that spent its budget waits for tokens without a worker."""
+    scheduler = PollScheduler(hass)
+    busy_limiter = AccountRateLimiter(hass, "busy", 1)
+    for _ in range(RATE_LIMIT_BURST):
+        await busy_limiter.async_acquire()
+    busy = AccountPoller(hass, "busy", scheduler, busy_limiter)
+    busy_coordinators = [
+        FakeCoordinator(f"busy-{index}", busy_limiter) for index in range(POLL_WORKER_LIMIT * 2)
+    ]
+    busy.async_add_coordinators(busy_coordinators)
+    other_limiter = AccountRateLimiter(hass, "other", 30)
+    other = AccountPoller(hass, "other", scheduler, other_limiter)
+    other_coordinator = FakeCoordinator("other", other_limiter)
+    other.async_add_coordinators([other_coordinator])
+
+    waiting = [
+        hass.async_create_task(busy._async_poll(coordinator)) for coordinator in busy_coordinators
+    ]
+    await asyncio.sleep(0)
+    await asyncio.wait_for(other._async_poll(other_coordinator), timeout=1)
+
+    assert other_coordinator.refreshes == 1
+    assert not scheduler.workers.locked()
+    for task in waiting:
+        task.cancel()
+    await asyncio.gather(*waiting, return_exceptions=True)
+    busy_limiter.async_shutdown()
+    other_limiter.async_shutdown()
+
+
+async def test_polls_of_every_account_share_the_workers(hass: HomeAssistant) -> None:
+    """Test no more than POLL_WORKER_LIMIT fetches run at once across accounts."""
+    scheduler = PollScheduler(hass)
+    running = 0
+    most_running = 0
+
+    class CountingCoordinator(FakeCoordinator):
+        async def async_refresh(self) -> None:
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    polls = []
+    for account in range(3):
+        poller = AccountPoller(hass, f"account {account}", scheduler)
+        coordinators = [CountingCoordinator(f"{account}-{index}") for index in range(5)]
+        poller.async_add_coordinators(coordinators)
+        polls.extend(poller._async_poll(coordinator) for coordinator in coordinators)
+
+    await asyncio.wait_for(asyncio.gather(*polls), timeout=2)
+
+    assert most_running == POLL_WORKER_LIMIT
+
+
+async def test_cycle_polls_due_coordinators(hass: HomeAssistant) -> None:
+    """Test a cycle refreshes the due coordinators and records what it cost."""
+    scheduler = PollScheduler(hass)
+    limiter = AccountRateLimiter(hass, "account", 600)
+    poller = AccountPoller(hass, "account", scheduler, limiter)
+    due = FakeCoordinator("due", limiter, requests=2)
+    later = FakeCoordinator("later", limiter, interval=3600)
+    poller.async_add_coordinators([due, later])
+    poller._next_poll[due] = hass.loop.time()
+
+    await poller._async_run_cycle()
+
+    assert (due.refreshes, later.refreshes) == (1, 0)
+    stats = poller.get_stats()
+    assert stats["cycle_count"] == 1
+    assert stats["average_refreshed_per_cycle"] == 1
+    assert stats["average_updated_per_cycle"] == 1
+    assert stats["average_requests_per_cycle"] == 2
+    assert poller._next_poll[due] > hass.loop.time() + 30
+    limiter.async_shutdown()
+
+
+async def test_circuit_opens_on_account_wide_failures(hass: HomeAssistant) -> None:
+    """Test failing polls pause the account and a canary closes the circuit again."""
+    scheduler = PollScheduler(hass)
+    poller = AccountPoller(hass, "account", scheduler)
+    coordinators = [FakeCoordinator(f"device-{index}") for index in range(3)]
+    poller.async_add_coordinators(coordinators)
+    outage = classify_error(Exception("Service Unavailable"))
+    assert backoff_policy(outage).account_wide
+    for coordinator in coordinators:
+        coordinator.error = outage
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        await poller._async_poll(coordinators[0])
+
+    assert poller.get_stats()["circuit"] is BreakerState.OPEN
+    poller.async_start()
+    assert poller.next_due >= hass.loop.time() + BREAKER_OPEN_INITIAL - 1
+
+    # The open period is over: only the canary is polled, and it succeeds
+    poller._breaker._retry_at = hass.loop.time()
+    refreshes = [coordinator.refreshes for coordinator in coordinators]
+    for coordinator in coordinators:
+        coordinator.error = None
+    await poller._async_run_cycle()
+
+    polled = [
+        coordinator
+        for coordinator, before in zip(coordinators, refreshes)
+        if coordinator.refreshes != before
+    ]
+    assert len(polled) == 1
+    assert poller.get_stats()["circuit"] is BreakerState.CLOSED
+    # Every other coordinator is due again within one batch window
+    assert all(
+        poller._next_poll[coordinator] <= hass.loop.time() + POLL_BATCH_WINDOW
+        for coordinator in coordinators
+        if coordinator not in polled
+    )
+    poller.async_stop()
+
+
+async def test_device_errors_do_not_open_the_circuit(hass: HomeAssistant) -> None:
+    """Test one unplugged device does not pause the whole account."""
+    scheduler = PollScheduler(hass)
+    poller = AccountPoller(hass, "account", scheduler)
+    coordinator = FakeCoordinator("unplugged")
+    poller.async_add_coordinators([coordinator])
+    coordinator.error = classify_error(Exception('{"code":5005}'))
+    assert not backoff_policy(coordinator.error).account_wide
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD * 2):
+        await poller._async_poll(coordinator)
+
+    assert poller.get_stats()["circuit"] is BreakerState.CLOSED
+
+
+def test_circuit_breaker_doubles_the_open_period() -> None:
+    """Test a failed canary keeps the circuit open for twice as long, up to the cap."""
+    breaker = AccountCircuitBreaker("account")
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        breaker.record_failure(0)
+    assert breaker.state is BreakerState.CLOSED
+
+    breaker.record_failure(0)
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.try_half_open(BREAKER_OPEN_INITIAL - 1)
+
+    now = float(BREAKER_OPEN_INITIAL)
+    durations = []
+    for _ in range(8):
+        assert breaker.try_half_open(now)
+        assert breaker.state is BreakerState.HALF_OPEN
+        breaker.record_failure(now)
+        durations.append(breaker.retry_at - now)
+        now = breaker.retry_at
+
+    assert durations[:2] == [BREAKER_OPEN_INITIAL * 2, BREAKER_OPEN_INITIAL * 4]
+    assert durations[-1] == BREAKER_OPEN_MAX
+    assert breaker.try_half_open(now)
+    assert breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_circuit_breaker_honours_retry_after() -> None:
+    """Test a pause the server asked for sets when the canary goes out."""
+    breaker = AccountCircuitBreaker("account")
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        breaker.record_failure(0, retry_at=600)
+
+    assert breaker.retry_at == 600
+
+
+def test_adaptive_interval_stays_within_bounds() -> None:
+    """Test the interval reacts to activity without leaving its bounds."""
+    interval = AdaptivePollInterval(base=60, minimum=30, maximum=300)
+    for _ in range(20):
+        interval.record_refresh(False)
+    quiet = interval.interval(active=False).total_seconds()
+    assert quiet == 300
+
+    for _ in range(20):
+        interval.record_refresh(True)
+    busy = interval.interval(active=True).total_seconds()
+    assert 30 <= busy < 60
+
+    interval.record_command()
+    assert interval.interval(active=False).total_seconds() == 30
+
+
+def test_adaptive_interval_repairs_swapped_bounds() -> None:
+    """Test bounds saved the wrong way round never produce an interval below the minimum."""
+    interval = AdaptivePollInterval(base=60, minimum=120, maximum=30)
+
+    assert interval.interval(active=True).total_seconds() == 120